@@ -0,0 +1,12 @@
+"""
+lunchable Benchmarks
+
+End-to-end benchmarks of the lunchable client against a synthetic Lunch Money
+API served in-process by `httpx.MockTransport`, so they measure lunchable
+itself rather than the network.
+
+```shell
+python -m benchmarks run --output results.json
+python -m benchmarks compare baseline.json results.json --threshold 0.15
+```
+"""
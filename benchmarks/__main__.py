@@ -0,0 +1,180 @@
+"""
+Benchmark Command Line Interface
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from benchmarks.models import model_cases, run_models
+from benchmarks.suite import (
+    DEFAULT_SIZES,
+    compare_results,
+    default_suite,
+    results_document,
+    run_suite,
+)
+
+console = Console(stderr=True)
+
+
+@click.group()
+def cli() -> None:
+    """
+    Benchmark lunchable against a synthetic, in-process Lunch Money API
+    """
+
+
+@cli.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the JSON results, defaults to stdout",
+)
+@click.option(
+    "-k",
+    "--filter",
+    "filters",
+    multiple=True,
+    help="Only run benchmarks whose name contains this, can be repeated",
+)
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="Transaction counts to paginate through, can be repeated  "
+    f"[default: {', '.join(str(size) for size in DEFAULT_SIZES)}]",
+)
+@click.option(
+    "--rounds",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Rounds per benchmark, overriding each benchmark's default",
+)
+def run(
+    output: TextIO,
+    filters: Tuple[str, ...],
+    sizes: Tuple[int, ...],
+    rounds: Optional[int],
+) -> None:
+    """
+    Run the benchmarks and write their results as JSON
+    """
+    benchmarks = [
+        benchmark
+        for benchmark in default_suite(sizes=sizes or DEFAULT_SIZES)
+        if not filters or any(item in benchmark.name for item in filters)
+    ]
+    if not benchmarks:
+        raise click.UsageError("No benchmarks match the given filters")
+
+    def report(name: str, result: Dict[str, Any]) -> None:
+        console.print(
+            f"{escape(name)}: {result['seconds'] * 1000:.1f} ms "
+            f"({result['rounds']} rounds, {result['server_seconds'] * 1000:.1f} ms "
+            "in the synthetic API)"
+        )
+
+    results = run_suite(benchmarks=benchmarks, rounds=rounds, callback=report)
+    json.dump(results, output, indent=2)
+    output.write("\n")
+
+
+@cli.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the JSON results, defaults to stdout",
+)
+@click.option(
+    "-k",
+    "--filter",
+    "filters",
+    multiple=True,
+    help="Only benchmark models whose case name contains this, can be repeated",
+)
+@click.option(
+    "--min-time",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.2,
+    show_default=True,
+    help="Minimum seconds each timing repeat runs for",
+)
+def models(output: TextIO, filters: Tuple[str, ...], min_time: float) -> None:
+    """
+    Micro-benchmark validating and serializing each model
+    """
+    cases = [
+        case
+        for case in model_cases()
+        if not filters or any(item in case.name for item in filters)
+    ]
+    if not cases:
+        raise click.UsageError("No models match the given filters")
+
+    def report(name: str, result: Dict[str, Any]) -> None:
+        console.print(
+            f"{escape(name)}: {result['nanoseconds']:,.0f} ns, "
+            f"{result['retained_bytes']:,.0f} bytes retained, "
+            f"{result['peak_bytes']:,.0f} bytes peak"
+        )
+
+    results = run_models(cases=cases, min_time=min_time, callback=report)
+    json.dump(results_document(results), output, indent=2)
+    output.write("\n")
+
+
+@cli.command()
+@click.argument("baseline", type=click.File("r"))
+@click.argument("current", type=click.File("r"))
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Relative slowdown past which a benchmark counts as regressed",
+)
+def compare(baseline: TextIO, current: TextIO, threshold: float) -> None:
+    """
+    Compare two results files, failing when any benchmark regressed
+    """
+    comparisons = compare_results(
+        baseline=json.load(baseline), current=json.load(current), threshold=threshold
+    )
+    table = Table(title=f"Benchmarks (threshold {threshold:.0%})")
+    table.add_column("Benchmark")
+    table.add_column("Baseline ms", justify="right")
+    table.add_column("Current ms", justify="right")
+    table.add_column("Change", justify="right")
+    for comparison in comparisons:
+        style = "red" if comparison.regressed else None
+        table.add_row(
+            escape(comparison.name),
+            f"{comparison.baseline * 1000:.1f}",
+            f"{comparison.current * 1000:.1f}",
+            f"{comparison.change:+.1%}",
+            style=style,
+        )
+    console.print(table)
+    regressions = [
+        comparison.name for comparison in comparisons if comparison.regressed
+    ]
+    if regressions:
+        console.print(f"[red]Regressed: {escape(', '.join(regressions))}[/red]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    cli()
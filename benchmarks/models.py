@@ -0,0 +1,422 @@
+"""
+Model Micro-Benchmarks
+
+Time validating and serializing each public model from synthetic, realistically
+sized payloads, and measure the memory each operation allocates with
+`tracemalloc`. Results use the same document format as the end-to-end suite,
+so `python -m benchmarks compare` works on them too.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from benchmarks.synthetic import (
+    asset,
+    category,
+    crypto_balance,
+    plaid_account,
+    transaction,
+)
+from lunchable.models import (
+    AssetsObject,
+    BudgetObject,
+    CategoriesObject,
+    CryptoObject,
+    PlaidAccountObject,
+    TagsObject,
+    TransactionObject,
+    UserObject,
+)
+from lunchable.models._base import LunchableModel
+from lunchable.models.recurring_items import RecurringItemsObject
+
+
+@dataclasses.dataclass
+class ModelCase:
+    """
+    A Model and a Payload to Validate Into It
+    """
+
+    name: str
+    model: Type[LunchableModel]
+    payload: Dict[str, Any]
+
+
+def _plaid_metadata(index: int) -> Dict[str, Any]:
+    """
+    Plaid transaction metadata, as Plaid sends it
+    """
+    return {
+        "account_id": f"synthetic-account-{index % 6}",
+        "account_owner": None,
+        "amount": 12.34,
+        "authorized_date": "2023-01-01",
+        "authorized_datetime": None,
+        "category": ["Food and Drink", "Restaurants", "Coffee Shop"],
+        "category_id": "13005043",
+        "check_number": None,
+        "counterparties": [
+            {
+                "confidence_level": "VERY_HIGH",
+                "entity_id": "O5W5j4dN9OR3E6ypQmjdkWZZRoXEzVMz2ByWM",
+                "logo_url": "https://plaid-merchant-logos.plaid.com/starbucks_956.png",
+                "name": "Starbucks",
+                "type": "merchant",
+                "website": "starbucks.com",
+            }
+        ],
+        "date": "2023-01-02",
+        "datetime": None,
+        "iso_currency_code": "USD",
+        "location": {
+            "address": "1 Main St",
+            "city": "Springfield",
+            "country": "US",
+            "lat": 40.7128,
+            "lon": -74.006,
+            "postal_code": "12345",
+            "region": "NY",
+            "store_number": "1234",
+        },
+        "logo_url": "https://plaid-merchant-logos.plaid.com/starbucks_956.png",
+        "merchant_entity_id": "O5W5j4dN9OR3E6ypQmjdkWZZRoXEzVMz2ByWM",
+        "merchant_name": "Starbucks",
+        "name": "STARBUCKS STORE 1234",
+        "payment_channel": "in store",
+        "payment_meta": {
+            "by_order_of": None,
+            "payee": None,
+            "payer": None,
+            "payment_method": None,
+            "payment_processor": None,
+            "ppd_id": None,
+            "reason": None,
+            "reference_number": None,
+        },
+        "pending": False,
+        "pending_transaction_id": None,
+        "personal_finance_category": {
+            "confidence_level": "VERY_HIGH",
+            "detailed": "FOOD_AND_DRINK_COFFEE",
+            "primary": "FOOD_AND_DRINK",
+        },
+        "personal_finance_category_icon_url": "https://plaid-category-icons.plaid.com/PFC_FOOD_AND_DRINK.png",
+        "transaction_code": None,
+        "transaction_id": f"synthetic-transaction-{index}",
+        "transaction_type": "place",
+        "unofficial_currency_code": None,
+        "website": "starbucks.com",
+    }
+
+
+def _transaction_children(index: int, count: int) -> List[Dict[str, Any]]:
+    """
+    Children of a transaction group
+    """
+    return [
+        {
+            "id": index * 100 + child,
+            "amount": "10.0000",
+            "payee": f"Split {child}",
+            "date": "2023-01-02",
+            "formatted_date": "January 2, 2023",
+            "notes": None,
+            "currency": "usd",
+            "asset_id": None,
+            "plaid_account_id": 1,
+            "to_base": 10.0,
+        }
+        for child in range(count)
+    ]
+
+
+def _transaction_tags(count: int) -> List[Dict[str, Any]]:
+    """
+    Tags of a transaction
+    """
+    return [{"id": tag + 1, "name": f"Tag {tag + 1}"} for tag in range(count)]
+
+
+def _category_group(children: int) -> Dict[str, Any]:
+    """
+    A category group with its categories nested, as with `format=nested`
+    """
+    return {
+        **category(1000),
+        "is_group": True,
+        "group_id": None,
+        "children": [category(index) for index in range(children)],
+    }
+
+
+def _budget(months: int) -> Dict[str, Any]:
+    """
+    A category's budget summary over `months` months
+    """
+    data = {}
+    for month in range(months):
+        start = datetime.date(2020 + month // 12, month % 12 + 1, 1)
+        data[start.isoformat()] = {
+            "budget_amount": 250,
+            "budget_currency": "usd",
+            "budget_to_base": 250,
+            "spending_to_base": 231.45,
+            "num_transactions": 14,
+        }
+    return {
+        "category_name": "Groceries",
+        "category_id": 1,
+        "category_group_name": "Food",
+        "group_id": 1000,
+        "is_group": False,
+        "is_income": False,
+        "exclude_from_budget": False,
+        "exclude_from_totals": False,
+        "data": data,
+        "config": {
+            "config_id": 1,
+            "cadence": "monthly",
+            "amount": 250,
+            "currency": "usd",
+            "to_base": 250,
+            "auto_suggest": "fixed",
+        },
+    }
+
+
+def _recurring_item(months: int) -> Dict[str, Any]:
+    """
+    A monthly recurring item with an occurrence in each of `months` months
+    """
+    occurrences: Dict[str, List[Dict[str, Any]]] = {}
+    for month in range(months):
+        start = datetime.date(2020 + month // 12, month % 12 + 1, 1)
+        occurrences[start.isoformat()] = [
+            {
+                "id": month + 1,
+                "date": start.replace(day=15).isoformat(),
+                "amount": "15.9900",
+                "currency": "usd",
+                "payee": "Netflix",
+                "category_id": 4,
+                "recurring_id": 1,
+                "to_base": 15.99,
+            }
+        ]
+    return {
+        "id": 1,
+        "start_date": "2020-01-15",
+        "end_date": None,
+        "payee": "Netflix",
+        "currency": "usd",
+        "created_by": 1,
+        "created_at": "2020-01-15T00:00:00.000Z",
+        "updated_at": "2023-01-15T00:00:00.000Z",
+        "billing_date": "2020-01-15",
+        "original_name": "NETFLIX.COM",
+        "description": None,
+        "plaid_account_id": 1,
+        "asset_id": None,
+        "source": "manual",
+        "notes": None,
+        "amount": "15.9900",
+        "category_id": 4,
+        "category_group_id": None,
+        "is_income": False,
+        "exclude_from_totals": False,
+        "granularity": "month",
+        "cadence": "monthly",
+        "quantity": 1,
+        "occurrences": occurrences,
+        "transactions_within_range": [
+            item for items in occurrences.values() for item in items
+        ],
+        "missing_dates_within_range": [],
+        "date": None,
+        "to_base": 15.99,
+    }
+
+
+def model_cases() -> List[ModelCase]:
+    """
+    Every model benchmark case
+    """
+    plain = {**transaction(1), "tags": []}
+    return [
+        ModelCase("TransactionObject[plain]", TransactionObject, plain),
+        ModelCase(
+            "TransactionObject[plaid_metadata]",
+            TransactionObject,
+            {**plain, "plaid_metadata": _plaid_metadata(1)},
+        ),
+        ModelCase(
+            "TransactionObject[children]",
+            TransactionObject,
+            {
+                **plain,
+                "has_children": True,
+                "children": _transaction_children(1, count=4),
+            },
+        ),
+        ModelCase(
+            "TransactionObject[tags]",
+            TransactionObject,
+            {**plain, "tags": _transaction_tags(count=3)},
+        ),
+        ModelCase(
+            "TransactionObject[full]",
+            TransactionObject,
+            {
+                **plain,
+                "plaid_metadata": _plaid_metadata(1),
+                "has_children": True,
+                "children": _transaction_children(1, count=4),
+                "tags": _transaction_tags(count=3),
+            },
+        ),
+        ModelCase("CategoriesObject[flat]", CategoriesObject, category(1)),
+        ModelCase(
+            "CategoriesObject[nested]", CategoriesObject, _category_group(children=12)
+        ),
+        ModelCase("BudgetObject[36 months]", BudgetObject, _budget(months=36)),
+        ModelCase(
+            "RecurringItemsObject[24 occurrences]",
+            RecurringItemsObject,
+            _recurring_item(months=24),
+        ),
+        ModelCase("AssetsObject", AssetsObject, asset(1)),
+        ModelCase("PlaidAccountObject", PlaidAccountObject, plaid_account(1)),
+        ModelCase("CryptoObject", CryptoObject, crypto_balance(1)),
+        ModelCase("TagsObject", TagsObject, _transaction_tags(count=1)[0]),
+        ModelCase(
+            "UserObject",
+            UserObject,
+            {
+                "user_id": 1,
+                "user_name": "Benchmark",
+                "user_email": "benchmark@example.com",
+                "account_id": 1,
+                "budget_name": "Benchmark",
+                "api_key_label": None,
+            },
+        ),
+    ]
+
+
+def _operations(case: ModelCase) -> Dict[str, Callable[[], Any]]:
+    """
+    The operations benchmarked for a case
+    """
+    instance = case.model.model_validate(case.payload)
+    return {
+        "validate": lambda: case.model.model_validate(case.payload),
+        "dump": instance.model_dump,
+        "dump_json": instance.model_dump_json,
+    }
+
+
+def time_call(function: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """
+    Median nanoseconds per call
+
+    The number of calls per repeat is scaled up until a repeat takes at least
+    `min_time` seconds.
+    """
+    number = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time * 1e9:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time * 1e9 / elapsed) + 1)
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter_ns() - started) / number)
+    return statistics.median(timings)
+
+
+def measure_allocations(function: Callable[[], Any], calls: int) -> Dict[str, float]:
+    """
+    Memory allocated per call, as traced by `tracemalloc`
+
+    Returns
+    -------
+    Dict[str, float]
+        `peak_bytes` allocated during a single call, and the `retained_bytes`
+        and `allocations` (memory blocks) still held by each call's result
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        gc.collect()
+        tracemalloc.start()
+        results = [function() for _ in range(calls)]
+        retained, _ = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    del results
+    return {
+        "peak_bytes": peak,
+        "retained_bytes": retained / calls,
+        "allocations": blocks / calls,
+    }
+
+
+def run_models(
+    cases: Optional[List[ModelCase]] = None,
+    min_time: float = 0.2,
+    repeat: int = 5,
+    calls: int = 100,
+    callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark every operation of every case
+
+    Parameters
+    ----------
+    cases: Optional[List[ModelCase]]
+        Cases to benchmark, defaults to `model_cases()`
+    min_time: float
+        Minimum seconds each timing repeat runs for
+    repeat: int
+        Timing repeats, the median is reported
+    calls: int
+        Calls whose results are held onto when measuring allocations
+    callback: Optional[Callable[[str, Dict[str, Any]], None]]
+        Called with each benchmark's name and result as soon as it finishes
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Results keyed by `<case>.<operation>`
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in model_cases() if cases is None else cases:
+        for operation, function in _operations(case).items():
+            name = f"{case.name}.{operation}"
+            nanoseconds = time_call(function, min_time=min_time, repeat=repeat)
+            results[name] = {
+                "seconds": nanoseconds / 1e9,
+                "nanoseconds": nanoseconds,
+                **measure_allocations(function, calls=calls),
+            }
+            if callback is not None:
+                callback(name, results[name])
+    return results
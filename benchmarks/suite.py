@@ -0,0 +1,327 @@
+"""
+Benchmark Suite
+
+Each benchmark is set up from scratch for every round (a fresh client and a
+fresh synthetic API) so rounds don't share caches, and only its operation is
+timed. Time the synthetic API spent building responses is subtracted, what's
+left is time spent in lunchable, httpx and pydantic.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import functools
+import gc
+import io
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+from benchmarks.synthetic import SyntheticAPI, transaction
+from lunchable import LunchMoney, TransactionInsertObject
+from lunchable._cli import write_transactions
+from lunchable._version import __version__
+from lunchable.models.transactions import _TransactionsResponse
+from lunchable.plugins import LunchableApp
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES: Tuple[int, ...] = (10_000, 100_000, 1_000_000)
+# `get_transactions` keeps every transaction in memory (~5 KB each), past
+# this size pages are streamed with `iter_transaction_pages` instead
+LIST_LIMIT = 100_000
+INSERT_BATCH_SIZE = 500
+
+Operation = Callable[[], Any]
+
+
+@dataclasses.dataclass
+class Benchmark:
+    """
+    A Single Benchmark
+
+    `setup` is called before every round and returns the operation to time
+    along with the synthetic API it talks to, if any.
+    """
+
+    name: str
+    items: int
+    setup: Callable[[], Tuple[Operation, Optional[SyntheticAPI]]]
+    rounds: int = 5
+
+
+@dataclasses.dataclass
+class Comparison:
+    """
+    A Benchmark Compared Against Its Baseline
+    """
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """
+        Relative change in seconds, positive when slower
+        """
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        """
+        Whether the benchmark got slower by more than the threshold
+        """
+        return self.change > self.threshold
+
+
+def _client(api: SyntheticAPI) -> LunchMoney:
+    """
+    A LunchMoney client talking to a synthetic API
+    """
+    lunch = LunchMoney(access_token="benchmark")
+    lunch.session = httpx.Client(transport=httpx.MockTransport(api))
+    return lunch
+
+
+def _get_transactions(size: int) -> Tuple[Operation, Optional[SyntheticAPI]]:
+    """
+    Fetch every transaction into a list
+    """
+    api = SyntheticAPI(transactions=size)
+    lunch = _client(api)
+    return (
+        lambda: lunch.get_transactions(start_date="2020-01-01", end_date="2099-12-31"),
+        api,
+    )
+
+
+def _iter_transaction_pages(size: int) -> Tuple[Operation, Optional[SyntheticAPI]]:
+    """
+    Page through every transaction without keeping them around
+    """
+    api = SyntheticAPI(transactions=size)
+    lunch = _client(api)
+
+    def operation() -> None:
+        for _ in lunch.iter_transaction_pages(
+            start_date="2020-01-01", end_date="2099-12-31"
+        ):
+            pass
+
+    return operation, api
+
+
+def _insert_transactions(size: int) -> Tuple[Operation, Optional[SyntheticAPI]]:
+    """
+    Insert transactions in batches
+    """
+    api = SyntheticAPI(transactions=0)
+    lunch = _client(api)
+    transactions = [
+        TransactionInsertObject(
+            date=datetime.date(2023, 1, 1) + datetime.timedelta(days=index % 365),
+            amount=(index % 10_000) / 100,
+            payee=f"Payee {index % 250}",
+            category_id=index % 48 + 1,
+            notes=f"Imported {index}",
+            external_id=f"benchmark-{index}",
+            tags=["Imported"],
+        )
+        for index in range(size)
+    ]
+
+    def operation() -> None:
+        for start in range(0, size, INSERT_BATCH_SIZE):
+            lunch.insert_transactions(
+                transactions=transactions[start : start + INSERT_BATCH_SIZE]
+            )
+
+    return operation, api
+
+
+def _refresh_data() -> Tuple[Operation, Optional[SyntheticAPI]]:
+    """
+    Refresh every model of a LunchableApp
+    """
+    api = SyntheticAPI(
+        categories=250, assets=40, plaid_accounts=25, tags=150, crypto=10
+    )
+    app = LunchableApp(access_token="benchmark")
+    app.lunch = _client(api)
+    return app.refresh_data, api
+
+
+def _write_transactions(
+    size: int, output_format: str
+) -> Tuple[Operation, Optional[SyntheticAPI]]:
+    """
+    Render transactions the way `lunchable transactions get` does
+    """
+    pages = [
+        _TransactionsResponse.model_validate(
+            {
+                "transactions": [
+                    transaction(index)
+                    for index in range(start, min(start + 1000, size))
+                ]
+            }
+        ).transactions
+        for start in range(0, size, 1000)
+    ]
+    return (
+        lambda: write_transactions(
+            pages=pages, output_format=output_format, fields=None, stream=io.StringIO()
+        ),
+        None,
+    )
+
+
+def default_suite(sizes: Sequence[int] = DEFAULT_SIZES) -> List[Benchmark]:
+    """
+    Every benchmark, with transaction pagination run at each of `sizes`
+    """
+    suite: List[Benchmark] = []
+    for size in sizes:
+        if size <= LIST_LIMIT:
+            name, setup = "get_transactions", _get_transactions
+        else:
+            name, setup = "iter_transaction_pages", _iter_transaction_pages
+        suite.append(
+            Benchmark(
+                name=f"{name}[{size}]",
+                items=size,
+                setup=functools.partial(setup, size),
+                rounds=5 if size <= 10_000 else 1,
+            )
+        )
+    suite.append(
+        Benchmark(
+            name="insert_transactions[10000]",
+            items=10_000,
+            setup=functools.partial(_insert_transactions, 10_000),
+        )
+    )
+    suite.append(
+        Benchmark(name="refresh_data", items=1, setup=_refresh_data, rounds=20)
+    )
+    for output_format in ("json", "ndjson", "csv"):
+        suite.append(
+            Benchmark(
+                name=f"write_transactions[{output_format}][10000]",
+                items=10_000,
+                setup=functools.partial(
+                    _write_transactions, size=10_000, output_format=output_format
+                ),
+            )
+        )
+    return suite
+
+
+def run_benchmark(benchmark: Benchmark, rounds: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run a benchmark, summarizing its rounds
+
+    Returns
+    -------
+    Dict[str, Any]
+        Median, min and max client seconds across rounds, the median time
+        the synthetic API took, and items processed per second
+    """
+    client_seconds: List[float] = []
+    server_seconds: List[float] = []
+    requests = 0
+    for _ in range(rounds or benchmark.rounds):
+        operation, api = benchmark.setup()
+        gc.collect()
+        started = time.perf_counter()
+        operation()
+        elapsed = time.perf_counter() - started
+        server = api.server_seconds if api is not None else 0.0
+        requests = api.requests if api is not None else 0
+        client_seconds.append(elapsed - server)
+        server_seconds.append(server)
+    seconds = statistics.median(client_seconds)
+    return {
+        "rounds": len(client_seconds),
+        "items": benchmark.items,
+        "requests": requests,
+        "seconds": seconds,
+        "min_seconds": min(client_seconds),
+        "max_seconds": max(client_seconds),
+        "server_seconds": statistics.median(server_seconds),
+        "items_per_second": benchmark.items / seconds if seconds else None,
+    }
+
+
+def run_suite(
+    benchmarks: Iterable[Benchmark],
+    rounds: Optional[int] = None,
+    callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run benchmarks into a JSON serializable results document
+
+    Parameters
+    ----------
+    benchmarks: Iterable[Benchmark]
+        Benchmarks to run
+    rounds: Optional[int]
+        Rounds per benchmark, overriding each benchmark's own
+    callback: Optional[Callable[[str, Dict[str, Any]], None]]
+        Called with each benchmark's name and result as soon as it finishes
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = run_benchmark(benchmark=benchmark, rounds=rounds)
+        if callback is not None:
+            callback(benchmark.name, results[benchmark.name])
+    return results_document(results)
+
+
+def results_document(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Wrap benchmark results, each with a `seconds` key, with details of the
+    environment they ran in
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "lunchable": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Comparison]:
+    """
+    Compare the benchmarks two results documents have in common
+
+    Parameters
+    ----------
+    baseline: Dict[str, Any]
+        Results to compare against
+    current: Dict[str, Any]
+        New results
+    threshold: float
+        Relative slowdown, i.e. `0.1` for 10%, past which a benchmark
+        counts as regressed
+    """
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline["benchmarks"][name]["seconds"],
+            current=result["seconds"],
+            threshold=threshold,
+        )
+        for name, result in current["benchmarks"].items()
+        if name in baseline["benchmarks"]
+    ]
@@ -0,0 +1,228 @@
+"""
+Synthetic Lunch Money API
+
+A deterministic, in-memory stand-in for the endpoints the benchmarks hit,
+meant to be mounted on an `httpx.MockTransport`. Its data comes from the
+stand-in's [SyntheticData][lunchable.standin.SyntheticData]. Transactions are
+generated from their index on request, so paging through a million of them
+doesn't hold a million of them in memory, and encoded from cached fragments,
+so serving them is cheap next to the client's work.
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+
+from lunchable.standin import SyntheticData
+
+_EPOCH = datetime.date(2020, 1, 1)
+_CYCLE = 1000
+# Transactions' fields come from the stand-in's dataset, a cycle of them
+_DATA = SyntheticData(seed=0, transactions=_CYCLE, categories=48)
+
+
+def transaction(index: int) -> Dict[str, Any]:
+    """
+    Transaction number `index`, shaped like the API's `GET /v1/transactions`
+    """
+    date = _EPOCH + datetime.timedelta(days=index // 40)
+    return {"id": index + 1, "date": date.isoformat(), **_transaction_fields(index)}
+
+
+def _transaction_fields(index: int) -> Dict[str, Any]:
+    """
+    Every field of a transaction but its `id` and `date`, which repeat every
+    `_CYCLE` transactions
+    """
+    fields = _DATA.transaction(index % _CYCLE)
+    del fields["id"], fields["date"]
+    return fields
+
+
+@functools.lru_cache(maxsize=None)
+def _encoded_fields() -> List[str]:
+    """
+    JSON encoded `_transaction_fields` of a cycle, without the opening brace
+    """
+    return [_encode(_transaction_fields(index))[1:].decode() for index in range(_CYCLE)]
+
+
+def _encoded_transactions(start: int, end: int) -> str:
+    """
+    JSON array of transactions `start` to `end`, the same as encoding each
+    `transaction` but without building them first
+    """
+    fields = _encoded_fields()
+    return "[{}]".format(
+        ",".join(
+            f'{{"id":{index + 1},'
+            f'"date":"{(_EPOCH + datetime.timedelta(days=index // 40)).isoformat()}",'
+            f"{fields[index % _CYCLE]}"
+            for index in range(start, end)
+        )
+    )
+
+
+def category(index: int) -> Dict[str, Any]:
+    """
+    Category number `index`
+    """
+    return _DATA.category(index)
+
+
+def asset(index: int) -> Dict[str, Any]:
+    """
+    Asset number `index`
+    """
+    return _DATA.asset(index)
+
+
+def plaid_account(index: int) -> Dict[str, Any]:
+    """
+    Plaid account number `index`
+    """
+    return _DATA.plaid_account(index)
+
+
+def crypto_balance(index: int) -> Dict[str, Any]:
+    """
+    Crypto balance number `index`
+    """
+    return _DATA.crypto_balance(index)
+
+
+class SyntheticAPI:
+    """
+    Request Handler Serving Synthetic Lunch Money Data
+
+    Time spent in the handler is added up in `server_seconds`, so it can be
+    told apart from time spent in the client.
+    """
+
+    def __init__(
+        self,
+        transactions: int = 10_000,
+        categories: int = 48,
+        assets: int = 12,
+        plaid_accounts: int = 6,
+        tags: int = 20,
+        crypto: int = 4,
+    ) -> None:
+        """
+        Initialize the API
+
+        Parameters
+        ----------
+        transactions: int
+            Number of transactions `GET /v1/transactions` pages through
+        categories: int
+            Number of categories
+        assets: int
+            Number of manually managed assets
+        plaid_accounts: int
+            Number of Plaid accounts
+        tags: int
+            Number of tags
+        crypto: int
+            Number of crypto balances
+        """
+        self.transactions = transactions
+        self.server_seconds = 0.0
+        self.requests = 0
+        data = SyntheticData(
+            seed=0,
+            transactions=_CYCLE,
+            categories=categories,
+            assets=assets,
+            plaid_accounts=plaid_accounts,
+            tags=tags,
+            crypto=crypto,
+        )
+        self._static: Dict[str, bytes] = {
+            "/v1/categories": _encode({"categories": data.categories_list()}),
+            "/v1/assets": _encode(
+                {"assets": [data.asset(index) for index in range(assets)]}
+            ),
+            "/v1/plaid_accounts": _encode(
+                {
+                    "plaid_accounts": [
+                        data.plaid_account(index) for index in range(plaid_accounts)
+                    ]
+                }
+            ),
+            "/v1/tags": _encode([data.tag(index) for index in range(tags)]),
+            "/v1/crypto": _encode(
+                {"crypto": [data.crypto_balance(index) for index in range(crypto)]}
+            ),
+            "/v1/me": _encode(data.user()),
+        }
+        self._routes: Dict[
+            Tuple[str, str], Callable[[httpx.Request], httpx.Response]
+        ] = {
+            ("GET", "/v1/transactions"): self._get_transactions,
+            ("POST", "/v1/transactions"): self._insert_transactions,
+        }
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """
+        Handle a request
+        """
+        started = time.perf_counter()
+        try:
+            self.requests += 1
+            route = self._routes.get((request.method, request.url.path))
+            if route is not None:
+                return route(request)
+            body = self._static.get(request.url.path)
+            if request.method != "GET" or body is None:
+                return httpx.Response(404, json={"error": "Not Found"})
+            return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+        finally:
+            self.server_seconds += time.perf_counter() - started
+
+    def reset(self) -> None:
+        """
+        Reset the request counters
+        """
+        self.server_seconds = 0.0
+        self.requests = 0
+
+    def _get_transactions(self, request: httpx.Request) -> httpx.Response:
+        """
+        A page of transactions, honoring `offset` and `limit`
+        """
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 1000))
+        end = min(offset + limit, self.transactions)
+        has_more = "true" if end < self.transactions else "false"
+        body = (
+            f'{{"transactions":{_encoded_transactions(offset, end)},'
+            f'"has_more":{has_more}}}'
+        )
+        return httpx.Response(200, content=body.encode("utf-8"), headers=_JSON_HEADERS)
+
+    def _insert_transactions(self, request: httpx.Request) -> httpx.Response:
+        """
+        Assign IDs to inserted transactions
+        """
+        inserted: List[Dict[str, Any]] = json.loads(request.content)["transactions"]
+        first_id = self.transactions + 1
+        self.transactions += len(inserted)
+        ids = list(range(first_id, first_id + len(inserted)))
+        return httpx.Response(200, content=_encode({"ids": ids}), headers=_JSON_HEADERS)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode(body: Any) -> bytes:
+    """
+    Compact JSON bytes
+    """
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
@@ -2,6 +2,7 @@
 Lunch Money Python SDK
 """
 
+from . import _startup  # noqa: F401
 from ._version import __application__, __author__, __email__, __version__
 from .exceptions import LunchMoneyError
 from .models._lunchmoney import LunchMoney
@@ -0,0 +1,214 @@
+"""
+Batch HTTP Requests
+
+Run many raw requests against the Lunch Money API over a single connection
+pool, streaming one result per request as they complete.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from json import JSONDecodeError
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+import httpx
+from pydantic import ValidationError
+
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models._base import LunchableModel
+from lunchable.models._core import LunchMoneyAPIClient
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequest(LunchableModel):
+    """
+    A Single Request in a Batch
+    """
+
+    line: int
+    method: str = "GET"
+    url: str
+    body: Optional[Any] = None
+
+
+class BatchResult(LunchableModel):
+    """
+    Outcome of a Single Request in a Batch
+    """
+
+    line: int
+    method: Optional[str] = None
+    url: Optional[str] = None
+    status: Optional[int] = None
+    elapsed_ms: Optional[float] = None
+    response: Optional[Any] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the request was sent and returned a successful status
+        """
+        return self.error is None and self.status is not None and self.status < 400
+
+
+def resolve_url(url: str, base_url: str) -> str:
+    """
+    Expand a path like `/v1/me` into a full Lunch Money API URL
+
+    Parameters
+    ----------
+    url: str
+        Full URL or a path relative to the API
+    base_url: str
+        Scheme and host of the API, i.e. `LunchMoney.base_url`
+
+    Returns
+    -------
+    str
+    """
+    if url.startswith("http"):
+        return url
+    return f"{base_url}/{url.lstrip('/')}"
+
+
+def parse_batch_line(line: str, line_number: int) -> Optional[BatchRequest]:
+    """
+    Parse a line of batch input
+
+    Lines are either `METHOD URL [BODY]`, where the body is everything after
+    the URL, or a JSON object with `method`, `url` and `body` keys. Blank
+    lines and lines starting with `#` are skipped.
+
+    Parameters
+    ----------
+    line: str
+        Line of batch input
+    line_number: int
+        Line number, starting at 1, used to match results to their input
+
+    Returns
+    -------
+    Optional[BatchRequest]
+        The request, or None when the line should be skipped
+
+    Raises
+    ------
+    LunchMoneyError
+        When the line can't be parsed
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    try:
+        if stripped.startswith("{"):
+            return BatchRequest.model_validate(
+                {**json.loads(stripped), "line": line_number}
+            )
+        method, url, *body = stripped.split(maxsplit=2)
+    except (JSONDecodeError, ValidationError, ValueError) as error:
+        msg = f"Invalid batch request on line {line_number}: {stripped}"
+        raise LunchMoneyError(msg) from error
+    return BatchRequest(
+        line=line_number, method=method, url=url, body=body[0] if body else None
+    )
+
+
+def run_batch(
+    lunch: LunchMoneyAPIClient,
+    lines: Iterable[str],
+    concurrency: int = 4,
+    rate_limit: Optional[float] = None,
+) -> Iterator[BatchResult]:
+    """
+    Send batch requests concurrently, yielding results in input order
+
+    Every request shares the client's connection pool and auth headers.
+    Requests that fail, whether they can't be parsed, can't be sent or
+    return an error status, are reported in their result instead of
+    stopping the batch.
+
+    Parameters
+    ----------
+    lunch: LunchMoneyAPIClient
+        Client to send the requests with
+    lines: Iterable[str]
+        Lines of batch input, see `parse_batch_line`. Lines are read lazily,
+        so this can be a file or a stream like stdin.
+    concurrency: int
+        Maximum number of requests in flight at once, defaults to 4
+    rate_limit: Optional[float]
+        Maximum number of requests started per second, defaults to no limit
+
+    Returns
+    -------
+    Iterator[BatchResult]
+    """
+
+    def send(numbered_line: Tuple[int, str]) -> Optional[BatchResult]:
+        line_number, line = numbered_line
+        try:
+            request = parse_batch_line(line=line, line_number=line_number)
+        except LunchMoneyError as error:
+            return BatchResult(line=line_number, error=str(error))
+        if request is None:
+            return None
+        return _send_request(lunch=lunch, request=request)
+
+    results = lunch._imap_concurrently(
+        send,
+        enumerate(lines, start=1),
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+    )
+    for result in results:
+        if result is not None:
+            yield result
+
+
+def _send_request(lunch: LunchMoneyAPIClient, request: BatchRequest) -> BatchResult:
+    """
+    Send a single batch request and time it
+    """
+    method = request.method.upper()
+    url = resolve_url(request.url, base_url=lunch.base_url)
+    if request.body is None or isinstance(request.body, str):
+        content = request.body
+    else:
+        content = json.dumps(request.body)
+    started = time.perf_counter()
+    try:
+        response = lunch.request(method=method, url=url, content=content)
+    except httpx.HTTPError as error:
+        logger.error("%s %s failed: %s", method, url, error)
+        return BatchResult(
+            line=request.line,
+            method=method,
+            url=url,
+            elapsed_ms=_elapsed_ms(started),
+            error=str(error),
+        )
+    elapsed_ms = _elapsed_ms(started)
+    logger.debug("%s %s: %s in %.1fms", method, url, response.status_code, elapsed_ms)
+    try:
+        body = response.json()
+    except JSONDecodeError:
+        body = response.text or None
+    return BatchResult(
+        line=request.line,
+        method=method,
+        url=url,
+        status=response.status_code,
+        elapsed_ms=elapsed_ms,
+        response=body,
+    )
+
+
+def _elapsed_ms(started: float) -> float:
+    """
+    Milliseconds since a `time.perf_counter()` reading
+    """
+    return round((time.perf_counter() - started) * 1000, 3)
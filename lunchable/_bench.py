@@ -0,0 +1,349 @@
+"""
+API Latency and Throughput Benchmarks
+
+Time common request patterns against the configured base URL, which can be
+the Lunch Money API or a local stand-in, and summarize them as JSON that can
+be compared across runs and hosts.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+import platform
+import threading
+import time
+from enum import Enum
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+import httpx
+
+from lunchable._version import __version__
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models._base import LunchableModel
+from lunchable.models._lunchmoney import LunchMoney
+
+logger = logging.getLogger(__name__)
+
+
+class BenchScenario(str, Enum):
+    """
+    Benchmark Scenarios
+
+    - `get`: sequential single GET requests
+    - `transactions`: sequential, fully paginated `get_transactions` calls
+    - `fanout`: concurrent single GET requests over the shared connection pool
+    """
+
+    get = "get"
+    transactions = "transactions"
+    fanout = "fanout"
+
+
+class LatencySummary(LunchableModel):
+    """
+    Distribution of Operation Latencies, in Milliseconds
+    """
+
+    p50: float
+    p95: float
+    p99: float
+    min: float
+    max: float
+    mean: float
+
+
+class ScenarioResult(LunchableModel):
+    """
+    Benchmark Results for a Single Scenario
+
+    `server_ms` is the time spent waiting on the server, from sending each
+    request until its response body was fully received, network transfer
+    included. `client_ms` is everything else: building requests, decoding
+    JSON and validating models.
+    """
+
+    scenario: BenchScenario
+    operations: int
+    requests: int
+    errors: int
+    concurrency: int
+    wall_ms: float
+    operations_per_second: float
+    requests_per_second: float
+    latency_ms: Optional[LatencySummary] = None
+    server_ms: float
+    client_ms: float
+    bytes_sent: int
+    bytes_received: int
+
+
+class BenchReport(LunchableModel):
+    """
+    Benchmark Report
+    """
+
+    base_url: str
+    lunchable_version: str = __version__
+    python_version: str = platform.python_version()
+    started_at: datetime.datetime
+    scenarios: List[ScenarioResult]
+
+
+class _Sample(LunchableModel):
+    """
+    Measurements of a Single Operation
+    """
+
+    latency: float
+    server: float
+    requests: int
+    bytes_sent: int
+    bytes_received: int
+    error: Optional[str] = None
+
+
+class _RequestTimer:
+    """
+    httpx Event Hooks Timing Requests Made by the Current Thread
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the Timer
+        """
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        """
+        Start measuring a new operation on this thread
+        """
+        self._local.started = 0.0
+        self._local.server = 0.0
+        self._local.requests = 0
+        self._local.bytes_sent = 0
+        self._local.bytes_received = 0
+
+    def on_request(self, request: httpx.Request) -> None:
+        """
+        Record when a request is sent
+        """
+        self._local.bytes_sent += len(request.content)
+        self._local.started = time.perf_counter()
+
+    def on_response(self, response: httpx.Response) -> None:
+        """
+        Read the response body and record the time spent waiting on it
+        """
+        response.read()
+        self._local.server += time.perf_counter() - self._local.started
+        self._local.requests += 1
+        # Responses built in memory (i.e. by a MockTransport) aren't downloaded
+        self._local.bytes_received += response.num_bytes_downloaded or len(
+            response.content
+        )
+
+    def measure(self, operation: Callable[[], object]) -> _Sample:
+        """
+        Run an operation and measure it
+        """
+        self.reset()
+        error: Optional[str] = None
+        started = time.perf_counter()
+        try:
+            operation()
+        except (LunchMoneyError, httpx.HTTPError) as exception:
+            error = str(exception)
+        return _Sample(
+            latency=time.perf_counter() - started,
+            server=self._local.server,
+            requests=self._local.requests,
+            bytes_sent=self._local.bytes_sent,
+            bytes_received=self._local.bytes_received,
+            error=error,
+        )
+
+
+class LunchableBenchmark:
+    """
+    Run Benchmark Scenarios with a Lunch Money Client
+
+    Requests are timed with httpx event hooks installed on the client's
+    session for the duration of the run.
+    """
+
+    def __init__(
+        self,
+        lunch: LunchMoney,
+        iterations: int = 10,
+        concurrency: int = 8,
+        warmup: int = 1,
+        path: str = "me",
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+    ) -> None:
+        """
+        Initialize the Benchmark
+
+        Parameters
+        ----------
+        lunch: LunchMoney
+            Client to benchmark
+        iterations: int
+            Number of timed operations per scenario, defaults to 10
+        concurrency: int
+            Requests in flight at once in the `fanout` scenario, defaults to 8
+        warmup: int
+            Untimed operations before each scenario, defaults to 1, so
+            connection setup doesn't skew the results
+        path: str
+            API path requested by the `get` and `fanout` scenarios, defaults
+            to `me`
+        start_date: Optional[datetime.date]
+            Start of the `transactions` scenario, defaults to 30 days ago
+        end_date: Optional[datetime.date]
+            End of the `transactions` scenario, defaults to today
+        """
+        today = datetime.date.today()
+        self.lunch = lunch
+        self.iterations = iterations
+        self.concurrency = concurrency
+        self.warmup = warmup
+        self.path: List[Union[str, int]] = [part for part in path.split("/") if part]
+        self.start_date = start_date or today - datetime.timedelta(days=30)
+        self.end_date = end_date or today
+        self._timer = _RequestTimer()
+
+    def run(self, scenarios: Iterable[BenchScenario | str]) -> BenchReport:
+        """
+        Run benchmark scenarios
+
+        Parameters
+        ----------
+        scenarios: Iterable[BenchScenario | str]
+            Scenarios to run, in order
+
+        Returns
+        -------
+        BenchReport
+        """
+        started_at = datetime.datetime.now(tz=datetime.timezone.utc)
+        session = self.lunch.session
+        event_hooks = session.event_hooks
+        session.event_hooks = {
+            "request": [*event_hooks["request"], self._timer.on_request],
+            "response": [*event_hooks["response"], self._timer.on_response],
+        }
+        try:
+            results = [
+                self._run_scenario(BenchScenario(scenario)) for scenario in scenarios
+            ]
+        finally:
+            session.event_hooks = event_hooks
+        return BenchReport(
+            base_url=self.lunch.base_url, started_at=started_at, scenarios=results
+        )
+
+    def _run_scenario(self, scenario: BenchScenario) -> ScenarioResult:
+        """
+        Run a single benchmark scenario, with the timing hooks installed
+        """
+        operation: Callable[[], object]
+        if scenario == BenchScenario.transactions:
+            operation = self._get_transactions
+        else:
+            operation = self._get
+        concurrency = self.concurrency if scenario == BenchScenario.fanout else 1
+        for _ in range(self.warmup):
+            self._timer.measure(operation)
+        logger.info("Running %s x %s", scenario.value, self.iterations)
+        started = time.perf_counter()
+        samples = self.lunch._map_concurrently(
+            lambda _: self._timer.measure(operation),
+            range(self.iterations),
+            concurrency=concurrency,
+        )
+        wall = time.perf_counter() - started
+        return _summarize(
+            scenario=scenario, samples=samples, concurrency=concurrency, wall=wall
+        )
+
+    def _get(self) -> object:
+        """
+        A single GET request
+        """
+        return self.lunch.make_request(
+            method=self.lunch.Methods.GET, url_path=self.path
+        )
+
+    def _get_transactions(self) -> object:
+        """
+        Every page of transactions in the configured date range
+        """
+        return self.lunch.get_transactions(
+            start_date=self.start_date, end_date=self.end_date
+        )
+
+
+def _summarize(
+    scenario: BenchScenario,
+    samples: Sequence[_Sample],
+    concurrency: int,
+    wall: float,
+) -> ScenarioResult:
+    """
+    Aggregate operation samples into a scenario result
+    """
+    requests = sum(sample.requests for sample in samples)
+    server = sum(sample.server for sample in samples)
+    total = sum(sample.latency for sample in samples)
+    latencies = sorted(
+        sample.latency * 1000 for sample in samples if sample.error is None
+    )
+    return ScenarioResult(
+        scenario=scenario,
+        operations=len(samples),
+        requests=requests,
+        errors=sum(sample.error is not None for sample in samples),
+        concurrency=concurrency,
+        wall_ms=_round(wall * 1000),
+        operations_per_second=_round(len(samples) / wall) if wall else 0.0,
+        requests_per_second=_round(requests / wall) if wall else 0.0,
+        latency_ms=_latency_summary(latencies) if latencies else None,
+        server_ms=_round(server * 1000),
+        client_ms=_round((total - server) * 1000),
+        bytes_sent=sum(sample.bytes_sent for sample in samples),
+        bytes_received=sum(sample.bytes_received for sample in samples),
+    )
+
+
+def _latency_summary(latencies: Sequence[float]) -> LatencySummary:
+    """
+    Summarize sorted latencies
+    """
+    return LatencySummary(
+        p50=_round(_percentile(latencies, 0.50)),
+        p95=_round(_percentile(latencies, 0.95)),
+        p99=_round(_percentile(latencies, 0.99)),
+        min=_round(latencies[0]),
+        max=_round(latencies[-1]),
+        mean=_round(sum(latencies) / len(latencies)),
+    )
+
+
+def _percentile(values: Sequence[float], quantile: float) -> float:
+    """
+    Linearly interpolated percentile of sorted values
+    """
+    position = (len(values) - 1) * quantile
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _round(value: float) -> float:
+    """
+    Round a measurement for reporting
+    """
+    return round(value, 3)
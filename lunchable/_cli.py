@@ -2,22 +2,25 @@
 Lunchmoney CLI
 """
 
+import csv
+import datetime
+import json
 import logging
+import pathlib
 import sys
 from json import JSONDecodeError
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
 import click
 import httpx
-from click_plugins import with_plugins
-from importlib_metadata import entry_points
 from pydantic_core import to_jsonable_python
 from rich import print, print_json, traceback
 
 import lunchable
 from lunchable import LunchMoney
 from lunchable._config.logging_config import set_up_logging
-from lunchable.models import LunchableModel
+from lunchable._lazy_plugins import LazyPluginGroup
+from lunchable.models import LunchableModel, TransactionObject
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +51,35 @@ access_token_option = click.option(
 )
 @access_token_option
 @debug_option
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile the command and print a time breakdown to stderr",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=None,
+    help="Also dump the raw profile to a .pstats file, implies --profile",
+)
 @click.pass_context
-def cli(ctx: click.core.Context, debug: bool, access_token: str) -> None:
+def cli(
+    ctx: click.core.Context,
+    debug: bool,
+    access_token: str,
+    profile: bool,
+    profile_output: Optional[pathlib.Path],
+) -> None:
     """
     Interactions with Lunch Money via lunchable 🍱
     """
+    if profile or profile_output is not None:
+        from lunchable._profile import CLIProfiler
+
+        profiler = CLIProfiler(output=profile_output)
+        profiler.start()
+        ctx.call_on_close(profiler.finish)
     ctx.obj = LunchMoneyContext(debug=debug, access_token=access_token)
     traceback.install(show_locals=debug)
     set_up_logging(log_level=logging.DEBUG if debug is True else logging.INFO)
@@ -67,7 +94,7 @@ def transactions() -> None:
     """
 
 
-@cli.group()
+@cli.group(cls=LazyPluginGroup, entry_point_group="lunchable.cli")
 def plugins() -> None:
     """
     Interact with Lunchable Plugins
@@ -95,7 +122,10 @@ def plugins() -> None:
     "Format: YYYY-MM-DD.",
 )
 @click.option(
-    "--tag-id", default=None, help="Filter by tag. Only accepts IDs, not names."
+    "--tag-id",
+    type=int,
+    default=None,
+    help="Filter by tag. Only accepts IDs, not names.",
 )
 @click.option("--recurring-id", default=None, help="Filter by recurring expense")
 @click.option("--plaid-account-id", default=None, help="Filter by Plaid account")
@@ -140,39 +170,302 @@ def plugins() -> None:
     default=None,
     help="Pass in true if you’d like to include imported transactions with a pending status.",
 )
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "ndjson", "csv"]),
+    default="json",
+    show_default=True,
+    help="Output format. Each page of transactions is written as soon as it "
+    "arrives, JSON is only pretty-printed when writing to a terminal.",
+)
+@click.option(
+    "--fields",
+    default=None,
+    help="Comma separated transaction fields to output, i.e. id,date,payee,amount. "
+    "Defaults to all fields.",
+)
 @click.pass_obj
 def lunchmoney_transactions(
-    context: LunchMoneyContext, **kwargs: Dict[str, Any]
+    context: LunchMoneyContext,
+    output_format: str,
+    fields: Optional[str],
+    **kwargs: Dict[str, Any],
 ) -> None:
     """
     Retrieve Lunch Money Transactions
     """
+    field_list = _parse_transaction_fields(fields)
     lunch = LunchMoney(access_token=context.access_token)
-    transactions = lunch.get_transactions(**kwargs)  # type: ignore[arg-type]
-    json_data = to_jsonable_python(transactions)
-    print_json(data=json_data)
+    pages = lunch.iter_transaction_pages(**kwargs)  # type: ignore[arg-type]
+    stdout = sys.stdout
+    if output_format == "json" and stdout.isatty():
+        json_data = [
+            transaction.model_dump(mode="json", include=_include(field_list))
+            for page in pages
+            for transaction in page
+        ]
+        print_json(data=json_data)
+    else:
+        write_transactions(
+            pages=pages, output_format=output_format, fields=field_list, stream=stdout
+        )
+
+
+@transactions.command("export")
+@click.option(
+    "--start-date",
+    required=True,
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="First day to export. Format: YYYY-MM-DD.",
+)
+@click.option(
+    "--end-date",
+    required=True,
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Last day to export (inclusive). Format: YYYY-MM-DD.",
+)
+@click.option(
+    "-o",
+    "--output-dir",
+    required=True,
+    type=click.Path(file_okay=False, path_type=pathlib.Path),
+    help="Directory to write one partition per month to, along with a checkpoint "
+    "file used to resume the export.",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(["jsonl", "parquet"]),
+    default="jsonl",
+    show_default=True,
+    help="Partition file format, parquet requires pyarrow.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of months fetched at once.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Fetch every month again, even ones that were already exported.",
+)
+@click.pass_obj
+def lunchmoney_transactions_export(
+    context: LunchMoneyContext,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    output_dir: pathlib.Path,
+    export_format: str,
+    concurrency: int,
+    force: bool,
+) -> None:
+    """
+    Export Lunch Money Transactions to a Directory, Month by Month
+
+    Rerunning an export only fetches the months that are missing, failed,
+    or hadn't ended yet the last time they were exported.
+    """
+    from lunchable._export import TransactionExporter, WindowStatus
+
+    lunch = LunchMoney(access_token=context.access_token)
+    exporter = TransactionExporter(
+        lunch=lunch, output_dir=output_dir, export_format=export_format
+    )
+    windows = exporter.export(
+        start_date=start_date.date(),
+        end_date=end_date.date(),
+        concurrency=concurrency,
+        force=force,
+    )
+    failed = [window for window in windows if window.status == WindowStatus.failed]
+    if failed:
+        logger.error(
+            "%s of %s months failed to export, run the export again to retry them",
+            len(failed),
+            len(windows),
+        )
+        sys.exit(1)
+
+
+def _parse_transaction_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse and validate the `--fields` option
+    """
+    if fields is None:
+        return None
+    field_list = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown_fields = [
+        field for field in field_list if field not in TransactionObject.model_fields
+    ]
+    if unknown_fields:
+        msg = f"Unknown transaction fields: {', '.join(unknown_fields)}"
+        raise click.BadParameter(msg, param_hint="--fields")
+    return field_list
+
+
+def _include(fields: Optional[List[str]]) -> Optional[Set[str]]:
+    """
+    Fields to include when dumping a transaction
+    """
+    return None if fields is None else set(fields)
+
+
+def write_transactions(
+    pages: Iterable[List[TransactionObject]],
+    output_format: str,
+    fields: Optional[List[str]],
+    stream: TextIO,
+) -> None:
+    """
+    Write pages of transactions to a stream as JSON, NDJSON or CSV
+
+    Each page is written as soon as it arrives, nothing is buffered beyond
+    the current page. Nested values (i.e. `tags`) are JSON encoded in CSV
+    output.
+
+    Parameters
+    ----------
+    pages: Iterable[List[TransactionObject]]
+        Pages of transactions, i.e. from `LunchMoney.iter_transaction_pages`
+    output_format: str
+        One of `json`, `ndjson` or `csv`
+    fields: Optional[List[str]]
+        Fields to write, in order. Defaults to all fields.
+    stream: TextIO
+        Stream to write to
+    """
+    include = _include(fields)
+    if output_format == "csv":
+        fieldnames = fields or list(TransactionObject.model_fields)
+        writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for page in pages:
+            _write_csv_page(writer=writer, page=page, include=include)
+            stream.flush()
+        return
+    separator = "\n" if output_format == "ndjson" else ","
+    first = True
+    if output_format == "json":
+        stream.write("[")
+    for page in pages:
+        first = _write_json_page(
+            stream=stream,
+            page=page,
+            include=include,
+            separator=separator,
+            first=first,
+        )
+        stream.flush()
+    stream.write("]\n" if output_format == "json" else ("" if first else "\n"))
+    stream.flush()
+
+
+def _write_csv_page(
+    writer: "csv.DictWriter[str]",
+    page: List[TransactionObject],
+    include: Optional[Set[str]],
+) -> None:
+    """
+    Write a page of transactions as CSV rows
+
+    Pages are rendered on their own so `--profile` can tell rendering apart
+    from fetching the next page.
+    """
+    for transaction in page:
+        row = transaction.model_dump(mode="json", include=include)
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in row.items()
+            }
+        )
+
+
+def _write_json_page(
+    stream: TextIO,
+    page: List[TransactionObject],
+    include: Optional[Set[str]],
+    separator: str,
+    first: bool,
+) -> bool:
+    """
+    Write a page of transactions as JSON values, returning whether nothing
+    has been written yet
+    """
+    for transaction in page:
+        if not first:
+            stream.write(separator)
+        stream.write(transaction.model_dump_json(include=include))
+        first = False
+    return first
 
 
 @cli.command()
-@click.argument("URL")
+@click.argument("URL", required=False)
 @click.option("-X", "--request", default="GET", help="Specify request command to use")
 @click.option("-d", "--data", default=None, help="HTTP POST data")
+@click.option(
+    "--batch",
+    type=click.File("r"),
+    default=None,
+    help=(
+        "Read `METHOD URL [BODY]` lines from a file (or `-` for stdin) "
+        "and stream the results as NDJSON"
+    ),
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of batch requests in flight at once",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Maximum number of batch requests started per second",
+)
 @click.pass_obj
-def http(context: LunchMoneyContext, url: str, request: str, data: str) -> None:
+def http(
+    context: LunchMoneyContext,
+    url: Optional[str],
+    request: str,
+    data: Optional[str],
+    batch: Optional[TextIO],
+    concurrency: int,
+    rate_limit: Optional[float],
+) -> None:
     """
     Interact with the LunchMoney API
 
     lunchable http /v1/transactions
+
+    lunchable http --batch requests.txt
     """
+    from lunchable._batch import resolve_url
+
+    if batch is not None:
+        if url is not None:
+            raise click.UsageError("URL can't be combined with --batch")
+        _http_batch(
+            lunch=LunchMoney(access_token=context.access_token),
+            batch=batch,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+        )
+        return
+    elif url is None:
+        raise click.UsageError("Missing argument 'URL'")
     lunch = LunchMoney(access_token=context.access_token)
-    if not url.startswith("http"):
-        url = url.lstrip("/")
-        url_request = f"https://dev.lunchmoney.app/{url}"
-    else:
-        url_request = url
     resp = lunch.request(
         method=request,
-        url=url_request,
+        url=resolve_url(url, base_url=lunch.base_url),
         content=data,
     )
     try:
@@ -189,5 +482,208 @@ def http(context: LunchMoneyContext, url: str, request: str, data: str) -> None:
     print_json(data=json_data)
 
 
-discovered_plugins = entry_points(group="lunchable.cli")
-with_plugins(discovered_plugins)(plugins)
+def _http_batch(
+    lunch: LunchMoney, batch: TextIO, concurrency: int, rate_limit: Optional[float]
+) -> None:
+    """
+    Stream batch request results to stdout as NDJSON, exiting 1 if any failed
+    """
+    from lunchable._batch import run_batch
+
+    failed = False
+    for result in run_batch(
+        lunch=lunch, lines=batch, concurrency=concurrency, rate_limit=rate_limit
+    ):
+        failed = failed or not result.ok
+        sys.stdout.write(result.model_dump_json())
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    if failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "-s",
+    "--scenario",
+    "scenarios",
+    type=click.Choice(["get", "transactions", "fanout"]),
+    multiple=True,
+    help="Scenario to run, can be repeated. Defaults to every scenario.",
+)
+@click.option(
+    "-n",
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Timed operations per scenario.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Requests in flight at once in the fanout scenario.",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Untimed operations before each scenario.",
+)
+@click.option(
+    "--path",
+    default="me",
+    show_default=True,
+    help="API path requested by the get and fanout scenarios.",
+)
+@click.option(
+    "--start-date",
+    type=click.DateTime(["%Y-%m-%d"]),
+    default=None,
+    help="Start of the transactions scenario, defaults to 30 days ago.",
+)
+@click.option(
+    "--end-date",
+    type=click.DateTime(["%Y-%m-%d"]),
+    default=None,
+    help="End of the transactions scenario, defaults to today.",
+)
+@click.option(
+    "--base-url",
+    default=None,
+    envvar="LUNCHMONEY_BASE_URL",
+    help="API base URL, i.e. a local stand-in for the Lunch Money API.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="File to write the JSON report to, defaults to stdout.",
+)
+@click.pass_obj
+def bench(
+    context: LunchMoneyContext,
+    scenarios: Tuple[str, ...],
+    iterations: int,
+    concurrency: int,
+    warmup: int,
+    path: str,
+    start_date: Optional[datetime.datetime],
+    end_date: Optional[datetime.datetime],
+    base_url: Optional[str],
+    output: TextIO,
+) -> None:
+    """
+    Benchmark API latency and throughput
+
+    Reports p50/p95/p99 latency, requests per second, bytes transferred and
+    the split between client and server time for each scenario as JSON.
+    """
+    from lunchable._bench import BenchScenario, LunchableBenchmark
+
+    lunch = LunchMoney(access_token=context.access_token, base_url=base_url)
+    benchmark = LunchableBenchmark(
+        lunch=lunch,
+        iterations=iterations,
+        concurrency=concurrency,
+        warmup=warmup,
+        path=path,
+        start_date=start_date.date() if start_date is not None else None,
+        end_date=end_date.date() if end_date is not None else None,
+    )
+    report = benchmark.run(scenarios=scenarios or list(BenchScenario))
+    output.write(report.model_dump_json(indent=2))
+    output.write("\n")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Host to bind.")
+@click.option("--port", type=int, default=8080, show_default=True, help="Port to bind.")
+@click.option(
+    "--seed", type=int, default=0, show_default=True, help="Synthetic data seed."
+)
+@click.option(
+    "--transactions",
+    "transaction_count",
+    type=click.IntRange(min=0),
+    default=10_000,
+    show_default=True,
+    help="Number of synthetic transactions.",
+)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Seconds every response is delayed by.",
+)
+@click.option(
+    "--jitter",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Up to this many more seconds of random delay.",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(min=0, max=1),
+    default=0.0,
+    show_default=True,
+    help="Fraction of requests answered with a 500 error.",
+)
+@click.option(
+    "--rate-limit-rate",
+    type=click.FloatRange(min=0, max=1),
+    default=0.0,
+    show_default=True,
+    help="Fraction of requests answered with a 429 error.",
+)
+@click.option(
+    "--access-token",
+    "standin_token",
+    default=None,
+    help="Only accept this access token, any token is accepted by default.",
+)
+def standin(
+    host: str,
+    port: int,
+    seed: int,
+    transaction_count: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    rate_limit_rate: float,
+    standin_token: Optional[str],
+) -> None:
+    """
+    Serve a local stand-in for the Lunch Money API
+
+    Serves a seeded, synthetic account with optional latency, errors and rate
+    limiting. Point lunchable at it with the LUNCHMONEY_BASE_URL environment
+    variable. Requires the `standin` extra.
+    """
+    from lunchable.exceptions import LunchMoneyImportError
+    from lunchable.standin import StandInAPI, SyntheticData
+
+    try:
+        import uvicorn
+    except ImportError as ie:
+        msg = (
+            "lunchable standin requires uvicorn, install lunchable "
+            'with the "standin" extra: pip install "lunchable[standin]"'
+        )
+        raise LunchMoneyImportError(msg) from ie
+    api = StandInAPI(
+        data=SyntheticData(seed=seed, transactions=transaction_count),
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        access_token=standin_token,
+    )
+    print(f"LUNCHMONEY_BASE_URL=http://{host}:{port}")
+    uvicorn.run(api, host=host, port=port)
@@ -40,6 +40,7 @@ class APIConfig:
     }
 
     _access_token_environment_variable = "LUNCHMONEY_ACCESS_TOKEN"
+    _base_url_environment_variable = "LUNCHMONEY_BASE_URL"
 
     @staticmethod
     def get_access_token(access_token: Optional[str] = None) -> str:
@@ -91,7 +92,33 @@ class APIConfig:
         return lunchable_header
 
     @staticmethod
-    def make_url(url_path: Union[List[Union[str, int]], str, int]) -> str:
+    def get_base_url(base_url: Optional[str] = None) -> str:
+        """
+        Method for Resolving the API Base URL: Hardcoded -> Env Var -> Default
+
+        Pointing the base URL elsewhere, i.e. `http://127.0.0.1:8000`, sends
+        every request to a proxy or local stand-in for the Lunch Money API.
+
+        Parameters
+        ----------
+        base_url: Optional[str]
+            Scheme and host (and optional path prefix) of the API
+
+        Returns
+        -------
+        str
+        """
+        if base_url is None:
+            base_url = getenv(APIConfig._base_url_environment_variable, None)
+        if base_url is None:
+            return f"{APIConfig.LUNCHMONEY_SCHEME}://{APIConfig.LUNCHMONEY_NETLOC}"
+        return base_url.rstrip("/")
+
+    @staticmethod
+    def make_url(
+        url_path: Union[List[Union[str, int]], str, int],
+        base_url: Optional[str] = None,
+    ) -> str:
         """
         Make a Lunch Money API URL using path parts
 
@@ -99,6 +126,8 @@ class APIConfig:
         ----------
         url_path: Union[List[Union[str, int]], str, int]
             API Components, if a list join these sequentially
+        base_url: Optional[str]
+            Scheme and host of the API, defaults to the Lunch Money API
 
         Returns
         -------
@@ -115,10 +144,25 @@ class APIConfig:
             for item in url_path
             if str(item).lower() != APIConfig.LUNCHMONEY_API_PATH
         ]
+        if base_url is None:
+            scheme, netloc, prefix = (
+                APIConfig.LUNCHMONEY_SCHEME,
+                APIConfig.LUNCHMONEY_NETLOC,
+                "",
+            )
+        else:
+            scheme, netloc, prefix, _, _ = parse.urlsplit(base_url)
         url = APIConfig._generate_url(
-            scheme=APIConfig.LUNCHMONEY_SCHEME,
-            netloc=APIConfig.LUNCHMONEY_NETLOC,
-            path="/".join([APIConfig.LUNCHMONEY_API_PATH, *path_set]),
+            scheme=scheme,
+            netloc=netloc,
+            path="/".join(
+                [
+                    part
+                    for part in (prefix.strip("/"), APIConfig.LUNCHMONEY_API_PATH)
+                    if part
+                ]
+                + path_set
+            ),
         )
         return url
 
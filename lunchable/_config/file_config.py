@@ -2,6 +2,7 @@
 File Path Helper
 """
 
+from os import getenv
 from pathlib import Path
 
 
@@ -16,3 +17,4 @@ class FileConfig:
     LUNCHMONEY_DIR = CONFIG_DIR.parent
     PROJECT_DIR = LUNCHMONEY_DIR.parent
     DATA_DIR = LUNCHMONEY_DIR.joinpath("data")
+    CACHE_DIR = Path(getenv("XDG_CACHE_HOME") or HOME_DIR / ".cache") / "lunchable"
@@ -2,16 +2,107 @@
 Dynamic Logging Configuration
 """
 
+import datetime
+import json
 import logging
 from os import getenv
-from typing import Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import click
-from rich.console import Console
-from rich.logging import RichHandler
 
 LOG_HANDLER = getenv("LOG_HANDLER", "rich").lower()
 
+# Attributes every LogRecord has, anything else was passed via `extra`
+_RECORD_ATTRIBUTES = frozenset(
+    [*vars(logging.makeLogRecord({})), "message", "asctime", "taskName"]
+)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format Log Records as Single Line JSON Objects
+
+    Along with the time, level, logger and message, any structured fields
+    passed to the logger via `extra` (i.e. `method`, `endpoint`, `status` and
+    `duration_ms` on API requests) are included as top level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON
+
+        Parameters
+        ----------
+        record: logging.LogRecord
+            Record to format
+
+        Returns
+        -------
+        str
+        """
+        entry: Dict[str, Any] = {
+            "time": datetime.datetime.fromtimestamp(
+                record.created, tz=datetime.timezone.utc
+            ).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def _rich_handler(log_level: Union[int, str]) -> logging.Handler:
+    """
+    Colorful, human friendly logs on stderr
+    """
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    handler = RichHandler(
+        level=log_level,
+        rich_tracebacks=True,
+        omit_repeated_times=False,
+        show_path=False,
+        tracebacks_suppress=[click],
+        console=Console(stderr=True),
+    )
+    handler.setFormatter(
+        logging.Formatter(datefmt="[%Y-%m-%d %H:%M:%S]", fmt="%(message)s")
+    )
+    return handler
+
+
+def _python_handler(log_level: Union[int, str]) -> logging.Handler:
+    """
+    Plain text logs on stderr
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)8s]: %(message)s"))
+    handler.setLevel(log_level)
+    return handler
+
+
+def _json_handler(log_level: Union[int, str]) -> logging.Handler:
+    """
+    One JSON object per line on stderr
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter())
+    handler.setLevel(log_level)
+    return handler
+
+
+_LOG_HANDLERS: Dict[str, Callable[[Union[int, str]], logging.Handler]] = {
+    "rich": _rich_handler,
+    "python": _python_handler,
+    "json": _json_handler,
+}
+
 
 def get_log_handler(
     log_level: Optional[int] = None,
@@ -19,6 +110,9 @@ def get_log_handler(
     """
     Determine which logging handler should be used
 
+    The handler is picked with the LOG_HANDLER environment variable: `rich`
+    (the default), `python` or `json`. Only the selected handler is built.
+
     Parameters
     ----------
     log_level: Optional[int]
@@ -31,31 +125,15 @@ def get_log_handler(
     """
     if log_level is None:
         log_level = logging.getLevelName(getenv("LOG_LEVEL", "INFO").upper())
-    rich_handler = RichHandler(
-        level=log_level,
-        rich_tracebacks=True,
-        omit_repeated_times=False,
-        show_path=False,
-        tracebacks_suppress=[click],
-        console=Console(stderr=True),
-    )
     httpx_logger = logging.getLogger("httpx")
     if log_level != logging.DEBUG:
         httpx_logger.setLevel(logging.WARNING)
-    python_handler = logging.StreamHandler()
-    python_formatter = logging.Formatter("%(asctime)s [%(levelname)8s]: %(message)s")
-    python_handler.setFormatter(python_formatter)
-    python_handler.setLevel(log_level)
-    _log_dict = {
-        "rich": rich_handler,
-        "python": python_handler,
-    }
     if getenv("PYTEST_CURRENT_TEST", None) is not None:
         handler = "python"
     else:
         handler = LOG_HANDLER
-    log_handler: logging.Handler = _log_dict.get(handler, rich_handler)
-    return log_handler, log_level
+    build_handler = _LOG_HANDLERS.get(handler, _rich_handler)
+    return build_handler(log_level), log_level
 
 
 def set_up_logging(log_level: Optional[int] = None) -> None:
@@ -70,10 +148,4 @@ def set_up_logging(log_level: Optional[int] = None) -> None:
     """
     log_handler, level_to_log = get_log_handler(log_level=log_level)
     logging.root.handlers = [log_handler]
-    if isinstance(log_handler, RichHandler):
-        rich_formatter = logging.Formatter(
-            datefmt="[%Y-%m-%d %H:%M:%S]", fmt="%(message)s"
-        )
-        logging.root.handlers[0].setFormatter(rich_formatter)
-        level_to_log = logging.NOTSET
     logging.root.setLevel(level_to_log)
@@ -0,0 +1,382 @@
+"""
+Resumable Transaction Exports
+
+Split a date range into monthly windows, fetch them concurrently and merge
+each month into its own partition, keeping a checkpoint so an interrupted
+export only fetches what's missing when it's run again.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from lunchable.exceptions import LunchMoneyError, LunchMoneyImportError
+from lunchable.models._base import LunchableModel
+from lunchable.models._dates import PeriodEnum, is_past_period, period_windows
+from lunchable.models._lunchmoney import LunchMoney
+from lunchable.models.transactions import TransactionObject
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "_checkpoint.json"
+
+_Window = Tuple[datetime.date, datetime.date]
+# A partition row: its ID, its date (YYYY-MM-DD) and the row as it's stored,
+# a JSON line or a Parquet record
+_Row = Tuple[int, str, Union[str, Dict[str, Any]]]
+
+
+class ExportFormat(str, Enum):
+    """
+    Export File Formats
+    """
+
+    jsonl = "jsonl"
+    parquet = "parquet"
+
+
+class WindowStatus(str, Enum):
+    """
+    Export Window Statuses
+    """
+
+    complete = "complete"
+    failed = "failed"
+
+
+class ExportWindow(LunchableModel):
+    """
+    Checkpoint Entry for a Single Export Window
+
+    Entries are kept per month and set of `get_transactions` filters, and
+    record the days of the month that were exported with those filters.
+    """
+
+    start_date: datetime.date
+    end_date: datetime.date
+    status: WindowStatus
+    path: Optional[str] = None
+    transactions: int = 0
+    error: Optional[str] = None
+    exported_at: datetime.datetime
+    filters: Dict[str, Any] = {}
+
+
+class TransactionExporter:
+    """
+    Resumable, Concurrent Transaction Exporter
+
+    Each month is merged into `<output_dir>/month=YYYY-MM/transactions.<format>`
+    and recorded in `<output_dir>/_checkpoint.json`, per set of filters.
+    Completed months are skipped on the next run with the same filters,
+    failed and missing months are fetched again. Months that haven't ended
+    yet are always fetched again since their transactions can still change.
+
+    Fetched transactions replace the partition's rows with the same IDs.
+    Without filters, the partition's other rows within the fetched window are
+    dropped as well, since they no longer exist. Rows outside the window, and
+    rows exported with other filters, are kept.
+    """
+
+    def __init__(
+        self,
+        lunch: LunchMoney,
+        output_dir: os.PathLike[str] | str,
+        export_format: ExportFormat | str = ExportFormat.jsonl,
+    ) -> None:
+        """
+        Initialize the Exporter
+
+        Parameters
+        ----------
+        lunch: LunchMoney
+            Client to fetch transactions with
+        output_dir: os.PathLike[str] | str
+            Directory to write partitions and the checkpoint to
+        export_format: ExportFormat | str
+            Partition file format, `jsonl` (the default) or `parquet`, which
+            requires `pyarrow` to be installed
+        """
+        self.lunch = lunch
+        self.output_dir = pathlib.Path(output_dir)
+        self.export_format = ExportFormat(export_format)
+        self.checkpoint_path = self.output_dir / CHECKPOINT_FILE
+        self._lock = threading.Lock()
+        if self.export_format == ExportFormat.parquet:
+            _import_pyarrow()
+
+    def load_checkpoint(self) -> Dict[str, ExportWindow]:
+        """
+        Read the checkpoint file, keyed by partition and filters
+
+        Returns
+        -------
+        Dict[str, ExportWindow]
+        """
+        if not self.checkpoint_path.exists():
+            return {}
+        windows = json.loads(self.checkpoint_path.read_text())
+        return {
+            key: ExportWindow.model_validate(value) for key, value in windows.items()
+        }
+
+    def export(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        concurrency: int = 4,
+        force: bool = False,
+        **params: Any,
+    ) -> List[ExportWindow]:
+        """
+        Export transactions between two dates
+
+        Parameters
+        ----------
+        start_date: datetime.date
+            First day to export
+        end_date: datetime.date
+            Last day to export (inclusive)
+        concurrency: int
+            Maximum number of months fetched at once, defaults to 4
+        force: bool
+            Fetch every month again, even ones the checkpoint marks complete
+        **params: Any
+            Additional `get_transactions` filters, i.e. `category_id`
+
+        Returns
+        -------
+        List[ExportWindow]
+            Checkpoint entries for the months fetched by this run
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = self.load_checkpoint()
+        windows = period_windows(
+            start_date=start_date, end_date=end_date, period=PeriodEnum.month
+        )
+        filters = _filters_key(params)
+        pending = [
+            window
+            for window in windows
+            if force
+            or not _is_complete(
+                checkpoint.get(_checkpoint_key(window, filters)), window
+            )
+        ]
+        logger.info(
+            "Exporting %s of %s months, %s already complete",
+            len(pending),
+            len(windows),
+            len(windows) - len(pending),
+        )
+        return self.lunch._map_concurrently(
+            lambda window: self._export_window(
+                window=window, checkpoint=checkpoint, **params
+            ),
+            pending,
+            concurrency=concurrency,
+        )
+
+    def _export_window(
+        self,
+        window: _Window,
+        checkpoint: Dict[str, ExportWindow],
+        **params: Any,
+    ) -> ExportWindow:
+        """
+        Fetch and write a single window, recording the outcome
+        """
+        start_date, end_date = window
+        try:
+            transactions = self.lunch.get_transactions(
+                start_date=start_date, end_date=end_date, **params
+            )
+            path = self._write_partition(
+                window=window, transactions=transactions, filtered=bool(params)
+            )
+        except (LunchMoneyError, httpx.HTTPError, OSError) as error:
+            logger.error("Failed to export %s to %s: %s", start_date, end_date, error)
+            entry = ExportWindow(
+                start_date=start_date,
+                end_date=end_date,
+                status=WindowStatus.failed,
+                error=str(error),
+                exported_at=datetime.datetime.now(tz=datetime.timezone.utc),
+                filters=params,
+            )
+        else:
+            logger.info(
+                "Exported %s transactions from %s to %s",
+                len(transactions),
+                start_date,
+                end_date,
+            )
+            entry = ExportWindow(
+                start_date=start_date,
+                end_date=end_date,
+                status=WindowStatus.complete,
+                path=str(path.relative_to(self.output_dir)),
+                transactions=len(transactions),
+                exported_at=datetime.datetime.now(tz=datetime.timezone.utc),
+                filters=params,
+            )
+        with self._lock:
+            checkpoint[_checkpoint_key(window, _filters_key(params))] = entry
+            self._save_checkpoint(checkpoint)
+        return entry
+
+    def _write_partition(
+        self, window: _Window, transactions: List[TransactionObject], filtered: bool
+    ) -> pathlib.Path:
+        """
+        Merge a window of transactions into its month, replacing the file
+        atomically
+        """
+        start_date, end_date = window
+        partition = self.output_dir / f"month={start_date:%Y-%m}"
+        partition.mkdir(parents=True, exist_ok=True)
+        path = partition / f"transactions.{self.export_format.value}"
+        rows = self._encode_rows(transactions)
+        if path.exists():
+            fetched = {row[0] for row in rows}
+            start, end = start_date.isoformat(), end_date.isoformat()
+            rows = [
+                row
+                for row in self._read_rows(path)
+                if row[0] not in fetched and (filtered or not start <= row[1] <= end)
+            ] + rows
+        temp_path = path.with_name(f".{path.name}.tmp")
+        if self.export_format == ExportFormat.parquet:
+            _write_parquet(path=temp_path, rows=[row[2] for row in rows])
+        else:
+            with temp_path.open("w") as file:
+                for _, _, line in rows:
+                    file.write(f"{line}\n")
+        os.replace(temp_path, path)
+        return path
+
+    def _encode_rows(self, transactions: List[TransactionObject]) -> List[_Row]:
+        """
+        Encode transactions the way the partition stores them
+        """
+        if self.export_format == ExportFormat.parquet:
+            return [
+                (
+                    transaction.id,
+                    transaction.date.isoformat(),
+                    _parquet_row(transaction),
+                )
+                for transaction in transactions
+            ]
+        return [
+            (
+                transaction.id,
+                transaction.date.isoformat(),
+                transaction.model_dump_json(),
+            )
+            for transaction in transactions
+        ]
+
+    def _read_rows(self, path: pathlib.Path) -> List[_Row]:
+        """
+        Read the rows of an existing partition
+        """
+        if self.export_format == ExportFormat.parquet:
+            return [
+                (record["id"], record["date"], record)
+                for record in _import_pyarrow().read_table(path).to_pylist()
+            ]
+        rows: List[_Row] = []
+        with path.open() as file:
+            for line in file:
+                record = json.loads(line)
+                rows.append((record["id"], record["date"], line.rstrip("\n")))
+        return rows
+
+    def _save_checkpoint(self, checkpoint: Dict[str, ExportWindow]) -> None:
+        """
+        Write the checkpoint file atomically
+        """
+        temp_path = self.checkpoint_path.with_name(f".{CHECKPOINT_FILE}.tmp")
+        temp_path.write_text(
+            json.dumps(
+                {
+                    key: entry.model_dump(mode="json")
+                    for key, entry in sorted(checkpoint.items())
+                },
+                indent=2,
+            )
+        )
+        os.replace(temp_path, self.checkpoint_path)
+
+
+def _filters_key(params: Dict[str, Any]) -> str:
+    """
+    Short, stable key of a set of `get_transactions` filters
+    """
+    if not params:
+        return "all"
+    encoded = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _checkpoint_key(window: _Window, filters: str) -> str:
+    """
+    Checkpoint key of a window's partition and filters
+    """
+    return f"month={window[0]:%Y-%m}/{filters}"
+
+
+def _is_complete(entry: Optional[ExportWindow], window: _Window) -> bool:
+    """
+    Whether a window was exported and can't have changed since
+    """
+    return (
+        entry is not None
+        and entry.status == WindowStatus.complete
+        and entry.start_date <= window[0]
+        and entry.end_date >= window[1]
+        and is_past_period(end_date=window[1], today=entry.exported_at.date())
+    )
+
+
+def _import_pyarrow() -> Any:
+    """
+    Import pyarrow's parquet module
+    """
+    try:
+        import pyarrow.parquet
+    except ImportError as ie:
+        msg = "Parquet exports require pyarrow: pip install pyarrow"
+        raise LunchMoneyImportError(msg) from ie
+    return pyarrow.parquet
+
+
+def _parquet_row(transaction: TransactionObject) -> Dict[str, Any]:
+    """
+    A transaction as a Parquet record, JSON encoding nested values
+    """
+    return {
+        key: json.dumps(value) if isinstance(value, (dict, list)) else value
+        for key, value in transaction.model_dump(mode="json").items()
+    }
+
+
+def _write_parquet(path: pathlib.Path, rows: List[Any]) -> None:
+    """
+    Write Parquet records to a file
+    """
+    import pyarrow
+
+    parquet = _import_pyarrow()
+    parquet.write_table(pyarrow.Table.from_pylist(rows), path)
@@ -0,0 +1,218 @@
+"""
+Lazily Loaded CLI Plugins
+
+Plugins register click commands under the `lunchable.cli` entry point group.
+Rather than importing every plugin each time `lunchable` runs, plugin names
+are read from a cached index of entry point metadata and a plugin is only
+imported once its subcommand is invoked.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sys
+from typing import Any, Dict, List, Optional
+
+import click
+from click.shell_completion import CompletionItem
+from click_plugins.core import BrokenCommand
+from importlib_metadata import EntryPoint, entry_points
+
+from lunchable._config.file_config import FileConfig
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_INDEX_VERSION = 1
+
+
+class LazyPluginGroup(click.Group):
+    """
+    Click Group Loading Entry Point Commands on Demand
+
+    The index of plugin entry points is cached on disk, keyed by the Python
+    version and the modification times of the `sys.path` directories, which
+    change whenever a distribution is installed or removed. Listing commands,
+    rendering help and shell completion only read that index.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        entry_point_group: str,
+        index_path: Optional[os.PathLike[str] | str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the Group
+
+        Parameters
+        ----------
+        *args: Any
+            Positional arguments for `click.Group`
+        entry_point_group: str
+            Entry point group plugins register their commands under
+        index_path: Optional[os.PathLike[str] | str]
+            Where to cache the plugin index, defaults to a file in the
+            lunchable cache directory
+        **kwargs: Any
+            Keyword arguments for `click.Group`
+        """
+        super().__init__(*args, **kwargs)
+        self.entry_point_group = entry_point_group
+        self._index_path = pathlib.Path(index_path) if index_path is not None else None
+        self._plugin_index: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        """
+        Where the plugin index is cached
+
+        The default is resolved when it's used, so it follows
+        `FileConfig.CACHE_DIR`.
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        if self._index_path is not None:
+            return self._index_path
+        return FileConfig.CACHE_DIR / f"{self.entry_point_group}.json"
+
+    @property
+    def plugin_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Plugin entry points keyed by command name
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            The entry point `value` and distribution `summary` of each plugin
+        """
+        if self._plugin_index is None:
+            self._plugin_index = self._load_index()
+        return self._plugin_index
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        Built-in and plugin command names, without importing any plugin
+        """
+        return sorted({*super().list_commands(ctx), *self.plugin_index})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Get a command, importing its plugin the first time it's requested
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.plugin_index:
+            return command
+        entry_point = EntryPoint(
+            name=cmd_name,
+            value=self.plugin_index[cmd_name]["value"],
+            group=self.entry_point_group,
+        )
+        logger.debug("Loading plugin %s from %s", cmd_name, entry_point.value)
+        try:
+            command = entry_point.load()
+        except Exception:
+            # A broken plugin shouldn't take the rest of the CLI down with it
+            command = BrokenCommand(cmd_name)
+        self.add_command(command, name=cmd_name)
+        return command
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """
+        List commands in help text, describing plugins by their distribution
+        """
+        rows = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is not None and command.hidden:
+                continue
+            rows.append((name, self._short_help(name=name, formatter=formatter)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(
+        self, ctx: click.Context, incomplete: str
+    ) -> List[CompletionItem]:
+        """
+        Complete command names from the plugin index
+        """
+        results = [
+            CompletionItem(name, help=self._short_help(name=name))
+            for name in self.list_commands(ctx)
+            if name.startswith(incomplete)
+            and not (name in self.commands and self.commands[name].hidden)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _short_help(
+        self, name: str, formatter: Optional[click.HelpFormatter] = None
+    ) -> str:
+        """
+        Short help of a loaded command, or the summary of a plugin's distribution
+        """
+        limit = 45 if formatter is None else formatter.width - 6 - len(name)
+        command = self.commands.get(name)
+        if command is not None:
+            return command.get_short_help_str(limit=limit)
+        summary = self.plugin_index[name]["summary"]
+        if len(summary) <= limit:
+            return summary
+        return f"{summary[: limit - 3].rstrip()}..."
+
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Read the cached plugin index, rebuilding it when it's stale
+        """
+        key = _environment_key()
+        try:
+            cached = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            cached = {}
+        if cached.get("version") == PLUGIN_INDEX_VERSION and cached.get("key") == key:
+            plugins: Dict[str, Dict[str, str]] = cached["plugins"]
+            return plugins
+        plugins = _scan_entry_points(group=self.entry_point_group)
+        index = {"version": PLUGIN_INDEX_VERSION, "key": key, "plugins": plugins}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.index_path.with_name(f".{self.index_path.name}.tmp")
+            temp_path.write_text(json.dumps(index, indent=2))
+            os.replace(temp_path, self.index_path)
+        except OSError as error:
+            logger.debug("Unable to cache the plugin index: %s", error)
+        return plugins
+
+
+def _scan_entry_points(group: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read plugin entry points from installed distribution metadata
+    """
+    plugins: Dict[str, Dict[str, str]] = {}
+    for entry_point in entry_points(group=group):
+        dist = entry_point.dist
+        summary = (dist.metadata["Summary"] if dist is not None else None) or ""
+        plugins[entry_point.name] = {"value": entry_point.value, "summary": summary}
+    return plugins
+
+
+def _environment_key() -> str:
+    """
+    Fingerprint of the interpreter and the contents of its `sys.path`
+    """
+    parts = [sys.version]
+    for path in sys.path:
+        try:
+            parts.append(f"{path}:{os.stat(path or '.').st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,149 @@
+"""
+CLI Profiling
+
+Run a CLI command under `cProfile` and summarize where its time went:
+startup and imports, waiting on the network, decoding JSON, validating
+models and rendering output.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pathlib
+import pstats
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from lunchable import _startup
+
+# (path suffix, function name) of the calls each category is measured from
+_CATEGORIES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "Network wait": (("httpx/_client.py", "send"),),
+    "JSON decode": (("lunchable/models/_core.py", "process_response"),),
+    "Model validation": (("lunchable/models/_base.py", "model_validate"),),
+    "Output rendering": (
+        ("rich/__init__.py", "print_json"),
+        ("rich/__init__.py", "print"),
+        ("lunchable/_cli.py", "_write_csv_page"),
+        ("lunchable/_cli.py", "_write_json_page"),
+    ),
+}
+
+
+class CLIProfiler:
+    """
+    Profile a CLI Command and Report a Time Breakdown
+    """
+
+    def __init__(self, output: Optional[os.PathLike[str] | str] = None) -> None:
+        """
+        Initialize the Profiler
+
+        Parameters
+        ----------
+        output: Optional[os.PathLike[str] | str]
+            Where to dump the raw `.pstats` profile, if anywhere
+        """
+        self.output = None if output is None else pathlib.Path(output)
+        self.profiler = cProfile.Profile()
+        self.startup = 0.0
+        self.started = 0.0
+        self.total = 0.0
+
+    def start(self) -> None:
+        """
+        Start profiling
+
+        Startup is measured as the wall time between the `lunchable`
+        package starting to import and profiling starting, which is
+        dominated by imports. Interpreter startup before that isn't counted.
+        """
+        self.started = time.perf_counter()
+        self.startup = self.started - _startup.STARTED
+        self.profiler.enable()
+
+    def stop(self) -> None:
+        """
+        Stop profiling, dumping the profile when an output path was given
+        """
+        self.profiler.disable()
+        self.total = time.perf_counter() - self.started
+        if self.output is not None:
+            self.profiler.dump_stats(self.output)
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Seconds spent per category
+
+        Returns
+        -------
+        Dict[str, float]
+            Startup, each measured category, everything else in the command
+            and the command's total
+        """
+        stats = pstats.Stats(self.profiler)
+        measured = {
+            category: _cumulative_time(stats=stats, functions=functions)
+            for category, functions in _CATEGORIES.items()
+        }
+        return {
+            "Startup / imports": self.startup,
+            **measured,
+            "Other": max(self.total - sum(measured.values()), 0.0),
+            "Command total": self.total,
+        }
+
+    def report(self, console: Console) -> None:
+        """
+        Print the time breakdown as a table
+
+        Parameters
+        ----------
+        console: Console
+            Console to print to
+        """
+        breakdown = self.breakdown()
+        table = Table(title="lunchable profile")
+        table.add_column("Phase")
+        table.add_column("Seconds", justify="right")
+        table.add_column("% of command", justify="right")
+        for phase, seconds in breakdown.items():
+            share = (
+                ""
+                if phase == "Startup / imports" or not self.total
+                else f"{seconds / self.total:.1%}"
+            )
+            table.add_row(phase, f"{seconds:.3f}", share)
+        console.print(table)
+        if self.output is not None:
+            console.print(f"Profile written to {self.output}")
+
+    def finish(self) -> None:
+        """
+        Stop profiling and print the report to stderr
+        """
+        self.stop()
+        self.report(console=Console(stderr=True))
+
+
+def _cumulative_time(
+    stats: pstats.Stats, functions: Iterable[Tuple[str, str]]
+) -> float:
+    """
+    Total cumulative time of the profiled functions matching any of `functions`
+    """
+    total = 0.0
+    targets = tuple(functions)
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    for (filename, _, function_name), (_, _, _, cumulative, _) in raw_stats.items():
+        normalized = filename.replace(os.sep, "/")
+        if any(
+            normalized.endswith(suffix) and function_name == name
+            for suffix, name in targets
+        ):
+            total += cumulative
+    return total
@@ -0,0 +1,9 @@
+"""
+Process Startup Timing
+"""
+
+import time
+
+# Taken when the `lunchable` package starts importing, before any of its
+# dependencies, as the reference for the startup phase of `--profile`
+STARTED = time.perf_counter()
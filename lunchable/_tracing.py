@@ -0,0 +1,93 @@
+"""
+Optional OpenTelemetry Tracing
+
+When `opentelemetry-api` is installed, lunchable records spans around API
+requests, response decoding, transaction pages and LunchableApp refreshes,
+which are exported by whichever tracer provider the application configures.
+Without it, `span` returns a shared no-op context manager.
+
+```shell
+pip install "lunchable[tracing]"
+```
+"""
+
+from __future__ import annotations
+
+from typing import Any, ContextManager, Dict, Optional, Sequence, Union
+
+from lunchable._version import __version__
+
+AttributeValue = Union[str, bool, int, float, Sequence[str], Sequence[int]]
+
+try:
+    from opentelemetry import trace
+except ImportError:  # no cov
+    _tracer: Optional[Any] = None
+else:
+    _tracer = trace.get_tracer("lunchable", __version__)
+
+
+class _NoOpSpan:
+    """
+    Stand-In for a Span When Tracing Isn't Available
+    """
+
+    def __enter__(self) -> _NoOpSpan:
+        """
+        Enter the span
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Exit the span
+        """
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """
+        Ignore an attribute
+        """
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+def tracing_enabled() -> bool:
+    """
+    Whether spans are recorded
+
+    Returns
+    -------
+    bool
+    """
+    return _tracer is not None
+
+
+def span(
+    name: str, attributes: Optional[Dict[str, Optional[AttributeValue]]] = None
+) -> ContextManager[Any]:
+    """
+    Start a span as the current span
+
+    Parameters
+    ----------
+    name: str
+        Span name
+    attributes: Optional[Dict[str, Optional[AttributeValue]]]
+        Span attributes, `None` values are left out
+
+    Returns
+    -------
+    ContextManager[Any]
+        Context manager yielding the span, which supports `set_attribute`
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(
+        name,
+        attributes=(
+            None
+            if attributes is None
+            else {key: value for key, value in attributes.items() if value is not None}
+        ),
+    )
@@ -0,0 +1,43 @@
+"""
+Local Analytics Over Lunch Money Data
+
+This namespace requires the optional `numpy` dependency, install lunchable
+with the `analytics` extra to get it:
+
+```shell
+pip install "lunchable[analytics]"
+```
+"""
+
+from lunchable.exceptions import LunchMoneyImportError
+
+try:
+    import numpy  # noqa: F401
+except ImportError as ie:  # no cov
+    msg = (
+        "lunchable.analytics requires numpy, install lunchable "
+        'with the "analytics" extra: pip install "lunchable[analytics]"'
+    )
+    raise LunchMoneyImportError(msg) from ie
+
+from lunchable.analytics.budgets import BudgetEngine, BudgetMatrix, budgets_to_matrix
+from lunchable.analytics.recurring import (
+    RecurringProjection,
+    project_recurring_items,
+)
+from lunchable.analytics.spending import (
+    SpendingAggregation,
+    TransactionArrays,
+    aggregate_spending,
+)
+
+__all__ = [
+    "BudgetEngine",
+    "BudgetMatrix",
+    "RecurringProjection",
+    "SpendingAggregation",
+    "TransactionArrays",
+    "aggregate_spending",
+    "budgets_to_matrix",
+    "project_recurring_items",
+]
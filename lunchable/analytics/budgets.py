@@ -0,0 +1,308 @@
+"""
+Local Budget Summaries
+
+Compute the same per-category, per-month budget summaries the
+[get_budgets][lunchable.LunchMoney.get_budgets] endpoint returns, from
+transactions and budget configurations that have already been fetched.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import functools
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lunchable.analytics.spending import (
+    MISSING_ID,
+    GroupByEnum,
+    SpendingAggregation,
+    SpendingSource,
+    _to_arrays,
+    aggregate_spending,
+)
+from lunchable.models._dates import month_starts
+from lunchable.models.budgets import BudgetDataObject, BudgetObject
+from lunchable.plugins.app import LunchableData
+
+logger = logging.getLogger(__name__)
+
+_MONTHLY = "monthly"
+
+
+class BudgetEngine:
+    """
+    Local Budget Summary Computation
+
+    Combines budget objects fetched once (for their category metadata,
+    `config` and any budgeted amounts in `data`) with locally cached
+    transactions to compute `spending_to_base` and `num_transactions` per
+    category per month. Any date range can then be summarized without another
+    API call.
+
+    Spending is summed from each transaction's `to_base` amount. Members of
+    a transaction group and split parents aren't counted, the group or split
+    children are. Category groups are summed across their children.
+
+    Budgeted amounts come from the fetched month when there is one. Other
+    months fall back to the budget's `config`, but only for `monthly`
+    cadences: other cadences aren't converted into monthly amounts, those
+    months are left without a budgeted amount.
+
+    Examples
+    --------
+    ```python
+    import datetime
+
+    from lunchable.analytics import BudgetEngine
+    from lunchable.plugins import LunchableApp
+
+    app = LunchableApp()
+    app.refresh_transactions(start_date="2023-01-01", end_date="2023-12-31")
+    budgets = app.lunch.get_budgets(
+        start_date=datetime.date(2023, 1, 1), end_date=datetime.date(2023, 12, 31)
+    )
+    engine = BudgetEngine(budgets=budgets, transactions=app.data)
+    march = engine.get_budgets(
+        start_date=datetime.date(2023, 3, 1), end_date=datetime.date(2023, 3, 31)
+    )
+    ```
+    """
+
+    def __init__(
+        self, budgets: Iterable[BudgetObject], transactions: SpendingSource
+    ) -> None:
+        """
+        Initialize the Budget Engine
+
+        Parameters
+        ----------
+        budgets: Iterable[BudgetObject]
+            Budgets fetched with `LunchMoney.get_budgets`, these provide the
+            categories to summarize along with their budget configuration
+        transactions: SpendingSource
+            Transactions to compute spending from. When this is
+            `LunchableApp.data` the latest transactions are always used,
+            anything else is converted into columns once, up front.
+        """
+        self.budgets = list(budgets)
+        self.transactions: SpendingSource = (
+            transactions
+            if isinstance(transactions, LunchableData)
+            else _to_arrays(transactions)
+        )
+
+    def get_budgets(
+        self, start_date: datetime.date, end_date: datetime.date
+    ) -> List[BudgetObject]:
+        """
+        Get Monthly Budgets, Computed Locally
+
+        Parameters
+        ----------
+        start_date: datetime.date
+            Start of the period to summarize
+        end_date: datetime.date
+            End of the period to summarize
+
+        Returns
+        -------
+        List[BudgetObject]
+            One budget per category, in the same order as the budgets the
+            engine was created with
+        """
+        aggregate = functools.partial(
+            aggregate_spending,
+            _to_arrays(self.transactions),
+            start_date=start_date,
+            end_date=end_date,
+            include_income=True,
+            include_excluded=True,
+        )
+        by_category = _spending_lookup(
+            aggregate(by=[GroupByEnum.category, GroupByEnum.period])
+        )
+        by_group = _spending_lookup(
+            aggregate(by=[GroupByEnum.category_group, GroupByEnum.period])
+        )
+        months = month_starts(start_date=start_date, end_date=end_date)
+        summaries: List[BudgetObject] = []
+        lookup: Dict[Tuple[int, datetime.date], Tuple[float, int]]
+        for budget in self.budgets:
+            if budget.is_group:
+                lookup = by_group
+            elif budget.category_id is None and budget.is_income:
+                # Uncategorized spending is reported on the non-income row
+                lookup = {}
+            else:
+                lookup = by_category
+            category_id = (
+                MISSING_ID if budget.category_id is None else budget.category_id
+            )
+            data: Dict[datetime.date, BudgetDataObject] = {}
+            for month in months:
+                spending, count = lookup.get((category_id, month), (0.0, 0))
+                data[month] = BudgetDataObject(
+                    **_budgeted_amounts(budget=budget, month=month),
+                    spending_to_base=round(spending, 2),
+                    num_transactions=count,
+                )
+            summaries.append(budget.model_copy(update={"data": data}))
+        logger.debug(
+            "Computed %s local budgets from %s to %s",
+            len(summaries),
+            start_date,
+            end_date,
+        )
+        return summaries
+
+
+def _spending_lookup(
+    aggregation: SpendingAggregation,
+) -> Dict[Tuple[int, datetime.date], Tuple[float, int]]:
+    """
+    Map (ID, month) to (spending, number of transactions)
+    """
+    ids, months = aggregation.keys.values()
+    return {
+        (category_id, month): (total, count)
+        for category_id, month, total, count in zip(
+            ids.tolist(),
+            months.astype("datetime64[D]").tolist(),
+            aggregation.total.tolist(),
+            aggregation.count.tolist(),
+        )
+    }
+
+
+def _budgeted_amounts(
+    budget: BudgetObject, month: datetime.date
+) -> Dict[str, Optional[float | str]]:
+    """
+    Budgeted amounts for a month: the fetched month first, then a monthly
+    config
+    """
+    fetched = budget.data.get(month)
+    if fetched is not None and fetched.budget_amount is not None:
+        return {
+            "budget_amount": fetched.budget_amount,
+            "budget_currency": fetched.budget_currency,
+            "budget_to_base": fetched.budget_to_base,
+        }
+    elif budget.config is not None and budget.config.cadence == _MONTHLY:
+        return {
+            "budget_amount": budget.config.amount,
+            "budget_currency": budget.config.currency,
+            "budget_to_base": budget.config.to_base,
+        }
+    return {}
+
+
+@dataclasses.dataclass(frozen=True)
+class BudgetMatrix:
+    """
+    Dense Category-by-Month Budget Arrays
+
+    Row `i` is the category `category_id[i]` / `category_name[i]` (`category_id`
+    is `MISSING_ID` for Uncategorized) and column `j` is the month starting on
+    `months[j]`. Months a category has no data for hold `nan` amounts and zero
+    transactions, as do months without a budget in `budget_to_base`.
+    """
+
+    category_id: np.ndarray
+    category_name: np.ndarray
+    months: np.ndarray
+    budget_to_base: np.ndarray
+    spending_to_base: np.ndarray
+    num_transactions: np.ndarray
+
+    @property
+    def variance(self) -> np.ndarray:
+        """
+        Budgeted minus spent, per category per month
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.budget_to_base - self.spending_to_base
+
+    @property
+    def rollover(self) -> np.ndarray:
+        """
+        Running total of the variance across months, per category
+
+        Months without a budget don't contribute to the running total.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return np.nancumsum(self.variance, axis=1)
+
+
+def budgets_to_matrix(budgets: Sequence[BudgetObject]) -> BudgetMatrix:
+    """
+    Convert budgets into dense category-by-month arrays
+
+    Parameters
+    ----------
+    budgets: Sequence[BudgetObject]
+        Budgets, i.e. from `LunchMoney.get_budgets_series` or
+        `BudgetEngine.get_budgets`. Rows keep the order of this sequence.
+
+    Returns
+    -------
+    BudgetMatrix
+
+    Examples
+    --------
+    ```python
+    import datetime
+
+    from lunchable import LunchMoney
+    from lunchable.analytics import budgets_to_matrix
+
+    lunch = LunchMoney(access_token="xxxxxxx")
+    budgets = lunch.get_budgets_series(
+        start_date=datetime.date(2023, 1, 1), end_date=datetime.date(2023, 12, 31)
+    )
+    matrix = budgets_to_matrix(budgets)
+    over_budget = matrix.variance < 0
+    ```
+    """
+    months = np.array(
+        sorted({month for budget in budgets for month in budget.data}),
+        dtype="datetime64[D]",
+    )
+    month_index = {month: index for index, month in enumerate(months.tolist())}
+    shape = (len(budgets), len(months))
+    budget_to_base = np.full(shape, np.nan)
+    spending_to_base = np.full(shape, np.nan)
+    num_transactions = np.zeros(shape, dtype=np.int64)
+    for row, budget in enumerate(budgets):
+        for month, data in budget.data.items():
+            column = month_index[month]
+            if data.budget_to_base is not None:
+                budget_to_base[row, column] = data.budget_to_base
+            spending_to_base[row, column] = data.spending_to_base
+            num_transactions[row, column] = data.num_transactions
+    category_name = np.empty(len(budgets), dtype=object)
+    category_name[:] = [budget.category_name for budget in budgets]
+    return BudgetMatrix(
+        category_id=np.array(
+            [
+                MISSING_ID if budget.category_id is None else budget.category_id
+                for budget in budgets
+            ],
+            dtype=np.int64,
+        ),
+        category_name=category_name,
+        months=months,
+        budget_to_base=budget_to_base,
+        spending_to_base=spending_to_base,
+        num_transactions=num_transactions,
+    )
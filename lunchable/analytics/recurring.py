@@ -0,0 +1,247 @@
+"""
+Recurring Item Occurrence Projection
+
+Compute the expected occurrences of recurring items over any horizon locally,
+using each item's `billing_date`, `granularity`, `quantity`, `start_date` and
+`end_date`, instead of requesting one month at a time from the API.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models._dates import PeriodEnum
+from lunchable.models.recurring_items import RecurringItemsObject
+
+logger = logging.getLogger(__name__)
+
+_TWICE_A_MONTH = "twice a month"
+_TWICE_A_MONTH_OFFSET_DAYS = 15
+
+
+@dataclasses.dataclass(frozen=True)
+class RecurringProjection:
+    """
+    Projected Recurring Item Occurrences
+
+    One row per expected occurrence, sorted by date and then recurring item.
+    `amount` is the item's amount in the user's primary currency (`to_base`).
+    """
+
+    recurring_id: np.ndarray
+    date: np.ndarray
+    amount: np.ndarray
+
+    def __len__(self) -> int:
+        """
+        Number of Occurrences
+        """
+        return len(self.recurring_id)
+
+    def to_dict(self) -> Dict[int, List[datetime.date]]:
+        """
+        Occurrence dates keyed by recurring item ID
+
+        Returns
+        -------
+        Dict[int, List[datetime.date]]
+        """
+        occurrences: Dict[int, List[datetime.date]] = {}
+        for recurring_id, date in zip(self.recurring_id.tolist(), self.date.tolist()):
+            occurrences.setdefault(recurring_id, []).append(date)
+        return occurrences
+
+    def totals_by_month(self) -> Dict[datetime.date, float]:
+        """
+        Expected total per month, i.e. a cash-flow forecast
+
+        Returns
+        -------
+        Dict[datetime.date, float]
+            Summed `to_base` amounts keyed by the first day of each month
+        """
+        months = self.date.astype("datetime64[M]")
+        unique_months, index = np.unique(months, return_inverse=True)
+        totals = np.bincount(index.reshape(-1), weights=self.amount)
+        return dict(
+            zip(unique_months.astype("datetime64[D]").tolist(), totals.tolist())
+        )
+
+
+def _ceil_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Integer division rounding towards positive infinity
+    """
+    return -(-numerator // denominator)
+
+
+def _project_days(
+    anchor: np.ndarray, step: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Occurrences every `step` days, returns (item index, date)
+    """
+    anchor_days = anchor.view(np.int64)
+    k_min = _ceil_divide(lower.view(np.int64) - anchor_days, step)
+    k_max = (upper.view(np.int64) - anchor_days) // step
+    counts = np.clip(k_max - k_min + 1, 0, None)
+    items = np.repeat(np.arange(len(anchor)), counts)
+    k = k_min[items] + _group_positions(counts)
+    dates = (anchor_days[items] + k * step[items]).view("datetime64[D]")
+    return items, dates
+
+
+def _project_months(
+    anchor: np.ndarray, step: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Occurrences every `step` months on the anchor's day of the month (clamped
+    to the length of the month), returns (item index, date)
+    """
+    anchor_month = anchor.astype("datetime64[M]").view(np.int64)
+    anchor_month_start = anchor.astype("datetime64[M]").astype("datetime64[D]")
+    anchor_day = (anchor - anchor_month_start).view(np.int64)
+    lower_month = lower.astype("datetime64[M]").view(np.int64)
+    upper_month = upper.astype("datetime64[M]").view(np.int64)
+    k_min = _ceil_divide(lower_month - anchor_month, step)
+    k_max = (upper_month - anchor_month) // step
+    counts = np.clip(k_max - k_min + 1, 0, None)
+    items = np.repeat(np.arange(len(anchor)), counts)
+    k = k_min[items] + _group_positions(counts)
+    months = anchor_month[items] + k * step[items]
+    month_start = months.view("datetime64[M]").astype("datetime64[D]")
+    month_length = (
+        (months + 1).view("datetime64[M]").astype("datetime64[D]") - month_start
+    ).view(np.int64)
+    dates = month_start + np.minimum(anchor_day[items], month_length - 1)
+    in_bounds = (dates >= lower[items]) & (dates <= upper[items])
+    return items[in_bounds], dates[in_bounds]
+
+
+def _group_positions(counts: np.ndarray) -> np.ndarray:
+    """
+    Position of each repeated row within its group: [2, 3] -> [0, 1, 0, 1, 2]
+    """
+    group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(int(counts.sum())) - group_starts
+
+
+def project_recurring_items(
+    items: Sequence[RecurringItemsObject],
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> RecurringProjection:
+    """
+    Project recurring item occurrences over any horizon
+
+    Occurrences are anchored on each item's `billing_date` and repeat every
+    `quantity` units of `granularity` (`day`, `week`, `month` or `year`),
+    in both directions, bounded by the item's `start_date` and `end_date`.
+    Monthly and yearly occurrences on days past the end of a shorter month
+    fall on the last day of that month. Items with a `twice a month` cadence
+    occur on their billing day and again 15 days later, every month.
+
+    Parameters
+    ----------
+    items: Sequence[RecurringItemsObject]
+        Recurring items, i.e. from `LunchMoney.get_recurring_items`
+    start_date: datetime.date
+        First day of the horizon
+    end_date: datetime.date
+        Last day of the horizon (inclusive)
+
+    Returns
+    -------
+    RecurringProjection
+
+    Examples
+    --------
+    ```python
+    import datetime
+
+    from lunchable import LunchMoney
+    from lunchable.analytics import project_recurring_items
+
+    lunch = LunchMoney(access_token="xxxxxxx")
+    recurring_items = lunch.get_recurring_items()
+    projection = project_recurring_items(
+        recurring_items,
+        start_date=datetime.date(2024, 1, 1),
+        end_date=datetime.date(2024, 12, 31),
+    )
+    forecast = projection.totals_by_month()
+    ```
+    """
+    ids: List[int] = []
+    anchors: List[datetime.date] = []
+    lowers: List[datetime.date] = []
+    uppers: List[datetime.date] = []
+    granularities: List[PeriodEnum] = []
+    quantities: List[int] = []
+    amounts: List[float] = []
+    for item in items:
+        try:
+            granularity = PeriodEnum(item.granularity.lower().rstrip("s"))
+        except ValueError as ve:
+            msg = f"Unsupported recurring item granularity: {item.granularity}"
+            raise LunchMoneyError(msg) from ve
+        anchor_dates = [item.billing_date]
+        if (item.cadence or "").lower() == _TWICE_A_MONTH:
+            granularity = PeriodEnum.month
+            anchor_dates.append(
+                item.billing_date + datetime.timedelta(days=_TWICE_A_MONTH_OFFSET_DAYS)
+            )
+        lower = max(start_date, item.start_date or start_date)
+        upper = min(end_date, item.end_date or end_date)
+        for anchor in anchor_dates:
+            ids.append(item.id)
+            anchors.append(anchor)
+            lowers.append(lower)
+            uppers.append(upper)
+            granularities.append(granularity)
+            quantities.append(max(item.quantity or 1, 1))
+            amounts.append(item.to_base)
+    anchor_array = np.array(anchors, dtype="datetime64[D]")
+    lower_array = np.array(lowers, dtype="datetime64[D]")
+    upper_array = np.array(uppers, dtype="datetime64[D]")
+    granularity_array = np.array([granularity.value for granularity in granularities])
+    quantity_array = np.array(quantities, dtype=np.int64)
+    projected_items: List[np.ndarray] = []
+    projected_dates: List[np.ndarray] = []
+    for granularity, multiplier, project in (
+        (PeriodEnum.day, 1, _project_days),
+        (PeriodEnum.week, 7, _project_days),
+        (PeriodEnum.month, 1, _project_months),
+        (PeriodEnum.year, 12, _project_months),
+    ):
+        subset = np.flatnonzero(granularity_array == granularity.value)
+        if len(subset) == 0:
+            continue
+        subset_items, subset_dates = project(
+            anchor_array[subset],
+            quantity_array[subset] * multiplier,
+            lower_array[subset],
+            upper_array[subset],
+        )
+        projected_items.append(subset[subset_items])
+        projected_dates.append(subset_dates)
+    if projected_items:
+        row_items = np.concatenate(projected_items)
+        dates = np.concatenate(projected_dates)
+    else:
+        row_items = np.array([], dtype=np.int64)
+        dates = np.array([], dtype="datetime64[D]")
+    id_array = np.array(ids, dtype=np.int64)[row_items]
+    order = np.lexsort((id_array, dates))
+    logger.debug("Projected %s recurring item occurrences", len(order))
+    return RecurringProjection(
+        recurring_id=id_array[order],
+        date=dates[order],
+        amount=np.array(amounts, dtype=np.float64)[row_items][order],
+    )
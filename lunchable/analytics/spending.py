@@ -0,0 +1,474 @@
+"""
+Vectorized Spending Aggregation
+
+Aggregate transactions by any combination of category, category group, tag,
+payee, asset and time period. Transactions are converted once into a set of
+NumPy columns ([TransactionArrays][lunchable.analytics.spending.TransactionArrays])
+and all grouping and summing happens on those columns.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models import TransactionObject
+from lunchable.models._dates import PeriodEnum
+from lunchable.plugins.app import LunchableData
+
+logger = logging.getLogger(__name__)
+
+MISSING_ID = -1
+"""
+Sentinel used in ID columns when a transaction has no value, i.e. uncategorized
+"""
+
+
+class GroupByEnum(str, Enum):
+    """
+    Dimensions to Aggregate Over
+    """
+
+    category = "category"
+    category_group = "category_group"
+    tag = "tag"
+    payee = "payee"
+    asset = "asset"
+    period = "period"
+
+
+@dataclasses.dataclass(frozen=True)
+class TransactionArrays:
+    """
+    Columnar (NumPy) Representation of Transactions
+
+    Missing IDs are stored as `MISSING_ID`. Amounts are normalized to the
+    user's primary currency using `to_base`. Transactions without a `to_base`
+    (i.e. built locally rather than fetched) fall back to their `amount`,
+    assumed to be in the primary currency, and a warning with their number is
+    logged since foreign currency amounts would be summed as is. Payees are stored as integer codes
+    into the `payees` label array and tags are stored as a flattened array
+    of tag IDs with per-transaction offsets (`tag_ids[tag_offsets[i]:tag_offsets[i + 1]]`).
+    `is_hidden` marks transactions that are already represented by another
+    transaction: members of a transaction group and split parents.
+    """
+
+    id: np.ndarray
+    date: np.ndarray
+    amount: np.ndarray
+    category_id: np.ndarray
+    category_group_id: np.ndarray
+    asset_id: np.ndarray
+    payee: np.ndarray
+    payees: np.ndarray
+    tag_offsets: np.ndarray
+    tag_ids: np.ndarray
+    is_income: np.ndarray
+    exclude_from_totals: np.ndarray
+    is_hidden: np.ndarray
+
+    def __len__(self) -> int:
+        """
+        Number of Transactions
+        """
+        return len(self.id)
+
+    @classmethod
+    def from_transactions(
+        cls, transactions: Iterable[TransactionObject]
+    ) -> TransactionArrays:
+        """
+        Build the columns from TransactionObjects
+
+        This makes a single pass over `transactions`, so any iterable works,
+        including a generator that streams transactions page by page.
+
+        Parameters
+        ----------
+        transactions: Iterable[TransactionObject]
+            Transactions to convert
+
+        Returns
+        -------
+        TransactionArrays
+        """
+        ids: List[int] = []
+        dates: List[int] = []
+        amounts: List[float] = []
+        category_ids: List[int] = []
+        category_group_ids: List[int] = []
+        asset_ids: List[int] = []
+        payee_codes: List[int] = []
+        tag_offsets: List[int] = [0]
+        tag_ids: List[int] = []
+        is_income: List[bool] = []
+        exclude_from_totals: List[bool] = []
+        is_hidden: List[bool] = []
+        payee_lookup: Dict[Optional[str], int] = {}
+        epoch = datetime.date(1970, 1, 1).toordinal()
+        missing_to_base = 0
+        for transaction in transactions:
+            ids.append(transaction.id)
+            dates.append(transaction.date.toordinal() - epoch)
+            if transaction.to_base is None:
+                missing_to_base += 1
+                amounts.append(transaction.amount)
+            else:
+                amounts.append(transaction.to_base)
+            category_ids.append(
+                MISSING_ID
+                if transaction.category_id is None
+                else transaction.category_id
+            )
+            category_group_ids.append(
+                MISSING_ID
+                if transaction.category_group_id is None
+                else transaction.category_group_id
+            )
+            if transaction.asset_id is not None:
+                asset_ids.append(transaction.asset_id)
+            elif transaction.plaid_account_id is not None:
+                asset_ids.append(transaction.plaid_account_id)
+            else:
+                asset_ids.append(MISSING_ID)
+            payee_codes.append(
+                payee_lookup.setdefault(transaction.payee, len(payee_lookup))
+            )
+            if transaction.tags:
+                tag_ids.extend(tag.id for tag in transaction.tags)
+            tag_offsets.append(len(tag_ids))
+            is_income.append(bool(transaction.is_income))
+            exclude_from_totals.append(bool(transaction.exclude_from_totals))
+            is_hidden.append(
+                transaction.group_id is not None or bool(transaction.has_children)
+            )
+        if missing_to_base:
+            logger.warning(
+                "%s of %s transactions have no to_base, their amount is summed "
+                "as if it were in the primary currency",
+                missing_to_base,
+                len(ids),
+            )
+        payees = np.empty(len(payee_lookup), dtype=object)
+        payees[:] = list(payee_lookup.keys())
+        return cls(
+            id=np.array(ids, dtype=np.int64),
+            date=np.array(dates, dtype=np.int64).view("datetime64[D]"),
+            amount=np.array(amounts, dtype=np.float64),
+            category_id=np.array(category_ids, dtype=np.int64),
+            category_group_id=np.array(category_group_ids, dtype=np.int64),
+            asset_id=np.array(asset_ids, dtype=np.int64),
+            payee=np.array(payee_codes, dtype=np.int64),
+            payees=payees,
+            tag_offsets=np.array(tag_offsets, dtype=np.int64),
+            tag_ids=np.array(tag_ids, dtype=np.int64),
+            is_income=np.array(is_income, dtype=bool),
+            exclude_from_totals=np.array(exclude_from_totals, dtype=bool),
+            is_hidden=np.array(is_hidden, dtype=bool),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class SpendingAggregation:
+    """
+    Result of a Spending Aggregation
+
+    Each group is a row: `keys[dimension][i]` holds the value of each
+    dimension for group `i`, `total[i]` is the summed amount (in the user's
+    primary currency) and `count[i]` is the number of transactions. Rows are
+    sorted by the dimensions in the order they were requested.
+    """
+
+    by: Tuple[GroupByEnum, ...]
+    period: PeriodEnum
+    keys: Dict[GroupByEnum, np.ndarray]
+    total: np.ndarray
+    count: np.ndarray
+    payees: np.ndarray
+
+    def __len__(self) -> int:
+        """
+        Number of Groups
+        """
+        return len(self.total)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convert the aggregation into a list of dictionaries
+
+        IDs are returned as `int` (or `None` when missing), payees as `str`
+        and periods as `datetime.date` of the start of the period.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+        """
+        columns: Dict[str, List[Any]] = {}
+        for dimension, values in self.keys.items():
+            if dimension == GroupByEnum.period:
+                columns[dimension.value] = values.astype("datetime64[D]").tolist()
+            elif dimension == GroupByEnum.payee:
+                columns[dimension.value] = self.payees[values].tolist()
+            else:
+                columns[dimension.value] = [
+                    None if value == MISSING_ID else value for value in values.tolist()
+                ]
+        columns["total"] = self.total.tolist()
+        columns["count"] = self.count.tolist()
+        return [dict(zip(columns.keys(), row)) for row in zip(*columns.values())]
+
+
+SpendingSource = Union[
+    LunchableData,
+    TransactionArrays,
+    Mapping[int, TransactionObject],
+    Iterable[TransactionObject],
+]
+
+
+def _to_arrays(source: SpendingSource) -> TransactionArrays:
+    """
+    Resolve any supported source into TransactionArrays
+    """
+    if isinstance(source, TransactionArrays):
+        return source
+    elif isinstance(source, LunchableData):
+        data = source
+        return data._cached_view(
+            "transaction_arrays",
+            ("transactions",),
+            lambda: TransactionArrays.from_transactions(data.transactions.values()),
+        )
+    elif isinstance(source, Mapping):
+        return TransactionArrays.from_transactions(source.values())
+    return TransactionArrays.from_transactions(source)
+
+
+def _period_start(dates: np.ndarray, period: PeriodEnum) -> np.ndarray:
+    """
+    Truncate an array of dates to the start of their period
+    """
+    if period == PeriodEnum.day:
+        return dates
+    elif period == PeriodEnum.week:
+        # 1970-01-01 was a Thursday, shift so that weeks start on Monday
+        days = dates.view(np.int64)
+        return (days - (days + 3) % 7).view("datetime64[D]")
+    elif period == PeriodEnum.month:
+        return dates.astype("datetime64[M]").astype("datetime64[D]")
+    return dates.astype("datetime64[Y]").astype("datetime64[D]")
+
+
+def _explode_tags(
+    arrays: TransactionArrays, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Repeat each row once per tag, untagged rows are kept once with MISSING_ID
+    """
+    tag_counts = np.diff(arrays.tag_offsets)[rows]
+    repeats = np.maximum(tag_counts, 1)
+    exploded_rows = np.repeat(rows, repeats)
+    group_starts = np.repeat(np.cumsum(repeats) - repeats, repeats)
+    positions = np.arange(len(exploded_rows)) - group_starts
+    tag_ids = np.append(arrays.tag_ids, MISSING_ID)
+    tag_index = np.minimum(
+        arrays.tag_offsets[exploded_rows] + positions, len(tag_ids) - 1
+    )
+    exploded_tags = np.where(
+        np.repeat(tag_counts, repeats) > 0, tag_ids[tag_index], MISSING_ID
+    )
+    return exploded_rows, exploded_tags
+
+
+def _filter_rows(
+    arrays: TransactionArrays,
+    start_date: Optional[datetime.date],
+    end_date: Optional[datetime.date],
+    include_income: bool,
+    include_excluded: bool,
+) -> np.ndarray:
+    """
+    Indexes of the rows `aggregate_spending` counts
+    """
+    mask = ~arrays.is_hidden
+    if not include_excluded:
+        mask &= ~arrays.exclude_from_totals
+    if not include_income:
+        mask &= ~arrays.is_income
+    if start_date is not None:
+        mask &= arrays.date >= np.datetime64(start_date, "D")
+    if end_date is not None:
+        mask &= arrays.date <= np.datetime64(end_date, "D")
+    return np.flatnonzero(mask)
+
+
+def _key_columns(
+    arrays: TransactionArrays,
+    rows: np.ndarray,
+    dimensions: Tuple[GroupByEnum, ...],
+    period: PeriodEnum,
+) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Rows to aggregate, exploded per tag when grouping by tag, and the key
+    column of each dimension for those rows
+    """
+    tags = np.empty(0, dtype=np.int64)
+    if GroupByEnum.tag in dimensions:
+        rows, tags = _explode_tags(arrays=arrays, rows=rows)
+    key_columns: List[np.ndarray] = []
+    for dimension in dimensions:
+        column: np.ndarray
+        if dimension == GroupByEnum.period:
+            column = _period_start(arrays.date[rows], period).view(np.int64)
+        elif dimension == GroupByEnum.tag:
+            column = tags
+        elif dimension == GroupByEnum.payee:
+            column = arrays.payee[rows]
+        else:
+            column = getattr(arrays, f"{dimension.value}_id")[rows]
+        key_columns.append(column)
+    return rows, key_columns
+
+
+def aggregate_spending(
+    source: SpendingSource,
+    by: Sequence[Union[str, GroupByEnum]] = (
+        GroupByEnum.category,
+        GroupByEnum.period,
+    ),
+    period: Union[str, PeriodEnum] = PeriodEnum.month,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    include_income: bool = False,
+    include_excluded: bool = False,
+) -> SpendingAggregation:
+    """
+    Sum spending across any combination of dimensions
+
+    Transactions that belong to a transaction group and split parents are
+    skipped, their amounts are already counted by the group / split children.
+
+    Parameters
+    ----------
+    source: SpendingSource
+        Transactions to aggregate. Either `LunchableApp.data` (the columns are
+        cached until transactions are refreshed), a `Dict[int, TransactionObject]`,
+        any iterable of `TransactionObject` (i.e. a stream of pages) or
+        pre-built `TransactionArrays`.
+    by: Sequence[Union[str, GroupByEnum]]
+        Dimensions to group by, any of `category`, `category_group`, `tag`,
+        `payee`, `asset` and `period`. Defaults to category and period. Grouping
+        by `tag` counts a transaction once for every tag it has.
+    period: Union[str, PeriodEnum]
+        Period length when grouping by `period`: `day`, `week` (starting on
+        Monday), `month` or `year`. Defaults to `month`.
+    start_date: Optional[datetime.date]
+        Only include transactions on or after this date
+    end_date: Optional[datetime.date]
+        Only include transactions on or before this date
+    include_income: bool
+        Include transactions whose category is treated as income.
+        Defaults to False.
+    include_excluded: bool
+        Include transactions whose category is excluded from totals.
+        Defaults to False.
+
+    Returns
+    -------
+    SpendingAggregation
+
+    Examples
+    --------
+    ```python
+    from lunchable.analytics import aggregate_spending
+    from lunchable.plugins import LunchableApp
+
+    app = LunchableApp()
+    app.refresh_transactions(start_date="2023-01-01", end_date="2023-12-31")
+    spending = aggregate_spending(app.data, by=["category", "period"])
+    for row in spending.to_records():
+        print(row["category"], row["period"], row["total"])
+    ```
+    """
+    try:
+        dimensions = tuple(GroupByEnum(dimension) for dimension in by)
+        period = PeriodEnum(period)
+    except ValueError as ve:
+        raise LunchMoneyError(str(ve)) from ve
+    arrays = _to_arrays(source)
+    rows = _filter_rows(
+        arrays=arrays,
+        start_date=start_date,
+        end_date=end_date,
+        include_income=include_income,
+        include_excluded=include_excluded,
+    )
+    rows, key_columns = _key_columns(
+        arrays=arrays, rows=rows, dimensions=dimensions, period=period
+    )
+    amounts = arrays.amount[rows]
+    if not key_columns:
+        group_index = np.zeros(len(rows), dtype=np.int64)
+        group_keys: List[np.ndarray] = []
+    else:
+        group_index, group_keys = _group(key_columns)
+    number_of_groups = len(group_keys[0]) if group_keys else int(len(rows) > 0)
+    total = np.bincount(group_index, weights=amounts, minlength=number_of_groups)
+    count = np.bincount(group_index, minlength=number_of_groups)
+    keys: Dict[GroupByEnum, np.ndarray] = {}
+    for dimension, values in zip(dimensions, group_keys):
+        if dimension == GroupByEnum.period:
+            values = values.view("datetime64[D]")
+        keys[dimension] = values
+    logger.debug(
+        "Aggregated %s transactions into %s groups", len(arrays), number_of_groups
+    )
+    return SpendingAggregation(
+        by=dimensions,
+        period=period,
+        keys=keys,
+        total=total,
+        count=count.astype(np.int64),
+        payees=arrays.payees,
+    )
+
+
+def _group(key_columns: List[np.ndarray]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Factorize key columns into a group index and the unique key values per group
+    """
+    codes: List[np.ndarray] = []
+    uniques: List[np.ndarray] = []
+    for column in key_columns:
+        unique_values, inverse = np.unique(column, return_inverse=True)
+        uniques.append(unique_values)
+        codes.append(inverse.reshape(-1))
+    shape = tuple(max(len(unique_values), 1) for unique_values in uniques)
+    if np.prod(shape, dtype=np.float64) < np.iinfo(np.int64).max:
+        flat = np.ravel_multi_index(codes, shape)
+        unique_flat, group_index = np.unique(flat, return_inverse=True)
+        group_codes = np.unravel_index(unique_flat, shape)
+    else:
+        stacked = np.stack(codes, axis=1)
+        unique_rows, group_index = np.unique(stacked, axis=0, return_inverse=True)
+        group_codes = tuple(unique_rows.T)
+    group_keys = [
+        unique_values[code] for unique_values, code in zip(uniques, group_codes)
+    ]
+    return group_index.reshape(-1), group_keys
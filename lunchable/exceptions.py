@@ -27,3 +27,15 @@ class LunchMoneyImportError(LunchMoneyError, ImportError):
     """
     Lunch Money Import Error
     """
+
+
+class LunchMoneyTimeoutError(LunchMoneyError, TimeoutError):
+    """
+    Lunch Money Timeout Error
+    """
+
+
+class LunchMoneyReplayError(LunchMoneyError, LookupError):
+    """
+    Lunch Money Recording Replay Error
+    """
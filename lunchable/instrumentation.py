@@ -0,0 +1,492 @@
+"""
+Request Instrumentation and Metrics
+
+Every [LunchMoney][lunchable.LunchMoney] client has a set of
+[hooks][lunchable.instrumentation.InstrumentationHooks] that are called before
+and after each API request, and after each response is validated into a model.
+[MetricsCollector][lunchable.instrumentation.MetricsCollector] uses them to
+record per-endpoint latency histograms, response sizes, retries, status
+codes and time spent decoding JSON vs. validating models, and exports them
+as Prometheus text or a dict, without running a server.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import re
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from lunchable.models._core import LunchMoneyAPIClient
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+
+
+@dataclasses.dataclass
+class RequestEvent:
+    """
+    A Single API Request
+
+    Passed to `pre_request` hooks before the request is sent, then to
+    `post_request` hooks once it finished, with its outcome filled in.
+    `decode_seconds` is only set for requests made through `make_request`,
+    which decode the JSON response.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    started: float
+    attempt: int = 1
+    status: Optional[int] = None
+    response_bytes: int = 0
+    duration: Optional[float] = None
+    decode_seconds: Optional[float] = None
+    error: Optional[BaseException] = None
+    hooks: Optional[InstrumentationHooks] = dataclasses.field(default=None, repr=False)
+
+
+@dataclasses.dataclass
+class ValidationEvent:
+    """
+    A Response Validated Into a Model
+
+    Validation happens after the request finished, it's attributed to the
+    request whose response is being validated. Only the client's own
+    validation of its responses is reported.
+    """
+
+    model: str
+    request: RequestEvent
+    duration: float
+
+
+RequestHook = Callable[[RequestEvent], None]
+ValidationHook = Callable[[ValidationEvent], None]
+
+
+@dataclasses.dataclass
+class InstrumentationHooks:
+    """
+    Instrumentation Callbacks of a Client
+
+    Hooks are called synchronously on the thread making the request, so they
+    should be quick. Exceptions raised by hooks propagate to the caller.
+    """
+
+    pre_request: List[RequestHook] = dataclasses.field(default_factory=list)
+    post_request: List[RequestHook] = dataclasses.field(default_factory=list)
+    post_validation: List[ValidationHook] = dataclasses.field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """
+        Whether any hooks are registered
+        """
+        return bool(self.pre_request or self.post_request or self.post_validation)
+
+
+# The last finished request, until its response is validated
+_pending_request: contextvars.ContextVar[
+    Optional[RequestEvent]
+] = contextvars.ContextVar("lunchable_pending_request", default=None)
+# The request whose response is being validated
+_validating_request: contextvars.ContextVar[
+    Optional[RequestEvent]
+] = contextvars.ContextVar("lunchable_validating_request", default=None)
+
+
+def endpoint_from_path(path: str) -> str:
+    """
+    Template a URL path into an endpoint: `/v1/transactions/123` ->
+    `/v1/transactions/{id}`
+
+    Parameters
+    ----------
+    path: str
+        URL path
+
+    Returns
+    -------
+    str
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def start_request(
+    hooks: InstrumentationHooks, method: str, url: str, path: str
+) -> RequestEvent:
+    """
+    Create a request event and call the `pre_request` hooks
+    """
+    event = RequestEvent(
+        method=method.upper(),
+        url=url,
+        endpoint=endpoint_from_path(path),
+        started=time.perf_counter(),
+        hooks=hooks,
+    )
+    for hook in hooks.pre_request:
+        hook(event)
+    return event
+
+
+def finish_request(event: RequestEvent) -> None:
+    """
+    Call the `post_request` hooks and keep the request for validation events
+    """
+    if event.duration is None:
+        event.duration = time.perf_counter() - event.started
+    if event.hooks is None:
+        return
+    for hook in event.hooks.post_request:
+        hook(event)
+    if event.hooks.post_validation:
+        _pending_request.set(event)
+
+
+@contextlib.contextmanager
+def response_validation() -> Iterator[None]:
+    """
+    Attribute the model validations in the block to the last finished request
+
+    The request is only attributed once, validations outside of the block
+    aren't reported.
+    """
+    request = _pending_request.get()
+    if request is not None:
+        _pending_request.set(None)
+    token = _validating_request.set(request)
+    try:
+        yield
+    finally:
+        _validating_request.reset(token)
+
+
+def record_validation(model: str, started: float) -> None:
+    """
+    Call the `post_validation` hooks of the request being validated, if any
+    """
+    request = _validating_request.get()
+    if request is None or request.hooks is None:
+        return
+    event = ValidationEvent(
+        model=model, request=request, duration=time.perf_counter() - started
+    )
+    for hook in request.hooks.post_validation:
+        hook(event)
+
+
+def validation_is_instrumented() -> bool:
+    """
+    Whether model validation in this thread or task should be timed
+    """
+    request = _validating_request.get()
+    return (
+        request is not None
+        and request.hooks is not None
+        and bool(request.hooks.post_validation)
+    )
+
+
+@dataclasses.dataclass
+class _Histogram:
+    """
+    Cumulative Histogram
+    """
+
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value
+        """
+        self.total += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+@dataclasses.dataclass
+class _EndpointMetrics:
+    """
+    Metrics of a Single Endpoint
+    """
+
+    duration: _Histogram
+    statuses: Dict[str, int] = dataclasses.field(default_factory=dict)
+    response_bytes: int = 0
+    retries: int = 0
+    decode_seconds: float = 0.0
+    validation_seconds: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+class MetricsCollector:
+    """
+    Per-Endpoint Request Metrics
+
+    Examples
+    --------
+    ```python
+    from lunchable import LunchMoney
+    from lunchable.instrumentation import MetricsCollector
+
+    lunch = LunchMoney(access_token="xxxxxxx")
+    metrics = MetricsCollector().install(lunch)
+    lunch.get_transactions()
+    print(metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize the Collector
+
+        Parameters
+        ----------
+        buckets: Tuple[float, ...]
+            Upper bounds of the latency histogram buckets, in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[Tuple[str, str], _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def install(self, client: LunchMoneyAPIClient) -> MetricsCollector:
+        """
+        Register the collector's hooks on a client
+
+        Parameters
+        ----------
+        client: LunchMoneyAPIClient
+            Client to collect metrics from
+
+        Returns
+        -------
+        MetricsCollector
+            The collector itself
+        """
+        client.hooks.post_request.append(self.post_request)
+        client.hooks.post_validation.append(self.post_validation)
+        return self
+
+    def post_request(self, event: RequestEvent) -> None:
+        """
+        Record a finished request
+
+        Parameters
+        ----------
+        event: RequestEvent
+            The finished request
+        """
+        status = "error" if event.status is None else str(event.status)
+        with self._lock:
+            metrics = self._metrics(method=event.method, endpoint=event.endpoint)
+            metrics.duration.observe(event.duration or 0.0)
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.response_bytes += event.response_bytes
+            metrics.retries += event.attempt > 1
+            metrics.decode_seconds += event.decode_seconds or 0.0
+
+    def post_validation(self, event: ValidationEvent) -> None:
+        """
+        Record a validated model
+
+        Parameters
+        ----------
+        event: ValidationEvent
+            The finished validation
+        """
+        with self._lock:
+            metrics = self._metrics(
+                method=event.request.method, endpoint=event.request.endpoint
+            )
+            metrics.validation_seconds[event.model] = (
+                metrics.validation_seconds.get(event.model, 0.0) + event.duration
+            )
+
+    def reset(self) -> None:
+        """
+        Clear every recorded metric
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export metrics as a dict, keyed by `METHOD /endpoint`
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": {
+                    "requests": metrics.duration.count,
+                    "statuses": dict(metrics.statuses),
+                    "retries": metrics.retries,
+                    "response_bytes": metrics.response_bytes,
+                    "duration_seconds": {
+                        "sum": metrics.duration.total,
+                        "buckets": dict(
+                            zip(metrics.duration.buckets, metrics.duration.counts)
+                        ),
+                    },
+                    "decode_seconds": metrics.decode_seconds,
+                    "validation_seconds": dict(metrics.validation_seconds),
+                }
+                for (method, endpoint), metrics in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Export metrics in the Prometheus text exposition format
+
+        Returns
+        -------
+        str
+        """
+        duration: List[str] = []
+        requests: List[str] = []
+        response_bytes: List[str] = []
+        retries: List[str] = []
+        decode: List[str] = []
+        validation: List[str] = []
+        with self._lock:
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                histogram = metrics.duration
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    duration.append(
+                        "lunchable_request_duration_seconds_bucket"
+                        f'{{{labels},le="{bound}"}} {count}'
+                    )
+                duration.extend(
+                    [
+                        "lunchable_request_duration_seconds_bucket"
+                        f'{{{labels},le="+Inf"}} {histogram.count}',
+                        f"lunchable_request_duration_seconds_sum{{{labels}}} "
+                        f"{histogram.total}",
+                        f"lunchable_request_duration_seconds_count{{{labels}}} "
+                        f"{histogram.count}",
+                    ]
+                )
+                for status, count in sorted(metrics.statuses.items()):
+                    requests.append(
+                        f'lunchable_requests_total{{{labels},status="{status}"}} '
+                        f"{count}"
+                    )
+                response_bytes.append(
+                    f"lunchable_response_bytes_total{{{labels}}} "
+                    f"{metrics.response_bytes}"
+                )
+                retries.append(
+                    f"lunchable_request_retries_total{{{labels}}} {metrics.retries}"
+                )
+                decode.append(
+                    f"lunchable_json_decode_seconds_total{{{labels}}} "
+                    f"{metrics.decode_seconds}"
+                )
+                for model, seconds in sorted(metrics.validation_seconds.items()):
+                    validation.append(
+                        "lunchable_validation_seconds_total"
+                        f'{{{labels},model="{model}"}} {seconds}'
+                    )
+        families = [
+            (
+                "lunchable_request_duration_seconds",
+                "histogram",
+                "Lunch Money API request latency",
+                duration,
+            ),
+            (
+                "lunchable_requests_total",
+                "counter",
+                "Lunch Money API requests by status code",
+                requests,
+            ),
+            (
+                "lunchable_response_bytes_total",
+                "counter",
+                "Bytes received from the Lunch Money API",
+                response_bytes,
+            ),
+            (
+                "lunchable_request_retries_total",
+                "counter",
+                "Retried Lunch Money API requests",
+                retries,
+            ),
+            (
+                "lunchable_json_decode_seconds_total",
+                "counter",
+                "Time spent decoding JSON responses",
+                decode,
+            ),
+            (
+                "lunchable_validation_seconds_total",
+                "counter",
+                "Time spent validating responses into models",
+                validation,
+            ),
+        ]
+        lines: List[str] = []
+        for name, metric_type, description, samples in families:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def _metrics(self, method: str, endpoint: str) -> _EndpointMetrics:
+        """
+        Metrics of an endpoint, created on first use
+        """
+        key = (method, endpoint)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = _EndpointMetrics(
+                duration=_Histogram(
+                    buckets=self.buckets, counts=[0] * len(self.buckets)
+                )
+            )
+            self._endpoints[key] = metrics
+        return metrics
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a Prometheus label value
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -2,7 +2,13 @@
 Base Pydantic Object for Containers
 """
 
+import time
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
+from typing_extensions import Self
+
+from lunchable.instrumentation import record_validation, validation_is_instrumented
 
 
 class LunchableModel(BaseModel):
@@ -17,3 +23,15 @@ class LunchableModel(BaseModel):
         Hash Method for Pydantic BaseModels
         """
         return hash((type(self), *tuple(self.__dict__.values())))
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:
+        """
+        Validate an object into the model, timing it for instrumentation hooks
+        """
+        if not validation_is_instrumented():
+            return super().model_validate(obj, **kwargs)
+        started = time.perf_counter()
+        model = super().model_validate(obj, **kwargs)
+        record_validation(model=cls.__name__, started=started)
+        return model
@@ -4,13 +4,24 @@ Lunchmoney SDK Core
 
 from __future__ import annotations
 
-from functools import cached_property
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, partial
 from typing import (
     Any,
     AsyncIterable,
+    Callable,
+    Deque,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     Optional,
+    TypeVar,
     Union,
 )
 
@@ -19,7 +30,22 @@ import pydantic_core
 from httpx import Client
 
 from lunchable._config import APIConfig
+from lunchable._tracing import span
 from lunchable.exceptions import LunchMoneyHTTPError
+from lunchable.instrumentation import (
+    InstrumentationHooks,
+    RequestEvent,
+    finish_request,
+    start_request,
+)
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Longest wait between retries of a rate limited request, in seconds
+_MAX_RETRY_DELAY = 60.0
 
 
 class LunchMoneyClient(Client):
@@ -27,9 +53,13 @@ class LunchMoneyClient(Client):
     API HTTP Client
     """
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         timeout = httpx.Timeout(connect=5, read=30, write=20, pool=5)
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, transport=transport)
         api_headers = APIConfig.get_header(access_token=access_token)
         self.headers.update(api_headers)
 
@@ -39,13 +69,117 @@ class LunchMoneyAsyncClient(httpx.AsyncClient):
     API Async HTTP Client
     """
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         timeout = httpx.Timeout(connect=5, read=30, write=20, pool=5)
-        super().__init__(timeout=timeout)
+        super().__init__(timeout=timeout, transport=transport)
         api_headers = APIConfig.get_header(access_token=access_token)
         self.headers.update(api_headers)
 
 
+class _RateLimiter:
+    """
+    Thread-Safe Limit on Calls per Second
+
+    Calls are spaced evenly, each `wait()` blocks until the caller's turn.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initialize the Rate Limiter
+
+        Parameters
+        ----------
+        rate: float
+            Maximum number of calls per second
+        """
+        self.interval = 1 / rate
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    def wait(self) -> None:
+        """
+        Block until the next call is allowed
+        """
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self.interval
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+def _record_response(
+    event: Optional[RequestEvent], response: httpx.Response, started: float
+) -> None:
+    """
+    Fill in a request event from its response and log it
+    """
+    duration = time.perf_counter() - started
+    if event is not None:
+        event.status = response.status_code
+        # Responses built in memory (i.e. by a MockTransport) aren't downloaded
+        event.response_bytes = response.num_bytes_downloaded or len(response.content)
+        event.duration = duration
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_response(response=response, duration=duration)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    How long to wait before retrying a rate limited request
+
+    Honors the response's `Retry-After` seconds, backing off exponentially
+    when it doesn't have one.
+    """
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 2.0 ** (attempt - 1)
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
+
+def _set_response_attributes(span: Any, response: httpx.Response) -> None:
+    """
+    Record a response's status and size on its request span
+    """
+    span.set_attribute("http.response.status_code", response.status_code)
+    span.set_attribute("http.response.body.size", len(response.content))
+
+
+def _log_response(response: httpx.Response, duration: float) -> None:
+    """
+    Log a response with structured request fields
+    """
+    duration_ms = round(duration * 1000, 3)
+    logger.debug(
+        "%s %s %s (%.1fms)",
+        response.request.method,
+        response.request.url.path,
+        response.status_code,
+        duration_ms,
+        extra={
+            "method": response.request.method,
+            "endpoint": response.request.url.path,
+            "status": response.status_code,
+            "duration_ms": duration_ms,
+        },
+    )
+
+
+def _call_rate_limited(
+    function: Callable[[_T], _R], limiter: _RateLimiter, item: _T
+) -> _R:
+    """
+    Wait for the rate limiter before calling a function
+    """
+    limiter.wait()
+    return function(item)
+
+
 class LunchMoneyAPIClient:
     """
     Core API Client Class
@@ -65,7 +199,14 @@ class LunchMoneyAPIClient:
         PATCH = "PATCH"
         DELETE = "DELETE"
 
-    def __init__(self, access_token: str | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        base_url: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        max_retries: int = 0,
+    ) -> None:
         """
         Initialize a Lunch Money object with an Access Token.
 
@@ -75,8 +216,22 @@ class LunchMoneyAPIClient:
         ----------
         access_token: Optional[str]
             Lunchmoney Developer API Access Token
+        base_url: Optional[str]
+            API base URL, inherited from the `LUNCHMONEY_BASE_URL` environment
+            variable if not provided and defaults to the Lunch Money API
+        transport: Optional[httpx.BaseTransport]
+            Transport for the sync session, i.e. `httpx.MockTransport`
+        async_transport: Optional[httpx.AsyncBaseTransport]
+            Transport for the async session, i.e. `httpx.ASGITransport`
+        max_retries: int
+            How many times to retry requests that were rate limited (429),
+            defaults to 0
         """
         self.access_token = APIConfig.get_access_token(access_token=access_token)
+        self.base_url = APIConfig.get_base_url(base_url=base_url)
+        self.transport = transport
+        self.async_transport = async_transport
+        self.max_retries = max_retries
 
     def __repr__(self) -> str:
         """
@@ -97,7 +252,9 @@ class LunchMoneyAPIClient:
         -------
         httpx.Client
         """
-        return LunchMoneyClient(access_token=self.access_token)
+        return LunchMoneyClient(
+            access_token=self.access_token, transport=self.transport
+        )
 
     @cached_property
     def async_session(self) -> httpx.AsyncClient:
@@ -108,7 +265,9 @@ class LunchMoneyAPIClient:
         -------
         httpx.AsyncClient
         """
-        return LunchMoneyAsyncClient(access_token=self.access_token)
+        return LunchMoneyAsyncClient(
+            access_token=self.access_token, transport=self.async_transport
+        )
 
     def request(
         self,
@@ -184,7 +343,9 @@ class LunchMoneyAPIClient:
             response.raise_for_status()
         ```
         """
-        response = self.session.request(
+        event = self._start_request(method=method, url=url)
+        response = self._send(
+            event,
             method=method,
             url=url,
             content=content,
@@ -193,6 +354,8 @@ class LunchMoneyAPIClient:
             params=params,
             **kwargs,
         )
+        if event is not None:
+            finish_request(event)
         return response
 
     async def arequest(
@@ -239,7 +402,9 @@ class LunchMoneyAPIClient:
         -------
         httpx.Response
         """
-        response = self.async_session.request(
+        event = self._start_request(method=method, url=url)
+        response = await self._asend(
+            event,
             method=method,
             url=url,
             content=content,
@@ -248,7 +413,125 @@ class LunchMoneyAPIClient:
             params=params,
             **kwargs,
         )
-        return await response
+        if event is not None:
+            finish_request(event)
+        return response
+
+    @cached_property
+    def hooks(self) -> InstrumentationHooks:
+        """
+        Instrumentation Callbacks
+
+        Register callables on `pre_request`, `post_request` and
+        `post_validation` to observe every request this client makes, i.e.
+        with a [MetricsCollector][lunchable.instrumentation.MetricsCollector].
+
+        Returns
+        -------
+        InstrumentationHooks
+        """
+        return InstrumentationHooks()
+
+    def _start_request(
+        self, method: str, url: Union[httpx.URL, str]
+    ) -> Optional[RequestEvent]:
+        """
+        Start a request event, when any instrumentation hooks are registered
+        """
+        if not self.hooks:
+            return None
+        url = httpx.URL(url)
+        return start_request(
+            hooks=self.hooks, method=method, url=str(url), path=url.path
+        )
+
+    def _send(
+        self, event: Optional[RequestEvent], method: str, url: Any, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request with the sync session, recording it on its event
+
+        Rate limited requests are retried up to `max_retries` times, the
+        event's `attempt` counts them.
+        """
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            except Exception as error:
+                if event is not None:
+                    event.error = error
+                    finish_request(event)
+                raise
+            if not self._should_retry(response=response, attempt=attempt):
+                break
+            delay = _retry_delay(response=response, attempt=attempt)
+            response.close()
+            logger.debug("Rate limited, retrying %s %s in %.1fs", method, url, delay)
+            time.sleep(delay)
+            attempt += 1
+            if event is not None:
+                event.attempt = attempt
+        _record_response(event=event, response=response, started=started)
+        return response
+
+    async def _asend(
+        self, event: Optional[RequestEvent], method: str, url: Any, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request with the async session, recording it on its event
+
+        Rate limited requests are retried up to `max_retries` times, the
+        event's `attempt` counts them.
+        """
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await self.async_session.request(
+                    method=method, url=url, **kwargs
+                )
+            except Exception as error:
+                if event is not None:
+                    event.error = error
+                    finish_request(event)
+                raise
+            if not self._should_retry(response=response, attempt=attempt):
+                break
+            delay = _retry_delay(response=response, attempt=attempt)
+            await response.aclose()
+            logger.debug("Rate limited, retrying %s %s in %.1fs", method, url, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+            if event is not None:
+                event.attempt = attempt
+        _record_response(event=event, response=response, started=started)
+        return response
+
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        """
+        Whether a response was rate limited and has retries left
+        """
+        return (
+            response.status_code == httpx.codes.TOO_MANY_REQUESTS
+            and attempt <= self.max_retries
+        )
+
+    def _process_instrumented(
+        self, event: Optional[RequestEvent], response: httpx.Response
+    ) -> Any:
+        """
+        Process a response, timing it and finishing its request event
+        """
+        if event is None:
+            return self.process_response(response=response)
+        started = time.perf_counter()
+        try:
+            return self.process_response(response=response)
+        finally:
+            event.decode_seconds = time.perf_counter() - started
+            finish_request(event)
 
     @classmethod
     def process_response(cls, response: httpx.Response) -> Any:
@@ -301,8 +584,9 @@ class LunchMoneyAPIClient:
             PATCH, or DELETE
         url_path: Union[List[Union[str, int]], str, int]
             URL components to make into a URL
-        payload: Optional[Mapping[str, Any]]
-            Data to send in the body of the Request.
+        payload: Optional[Any]
+            Data to send in the body of the Request, serialized to JSON.
+            `bytes` are assumed to be serialized already and are sent as-is.
         params: Optional[Mapping[str, Any]]
             Dictionary, list of tuples or bytes to send in the query
             string for the Request.
@@ -313,18 +597,27 @@ class LunchMoneyAPIClient:
         -------
         Any
         """
-        url = APIConfig.make_url(url_path=url_path)
-        json_safe_payload = pydantic_core.to_json(payload) if payload else None
+        url = APIConfig.make_url(url_path=url_path, base_url=self.base_url)
+        if isinstance(payload, bytes):
+            json_safe_payload: Optional[bytes] = payload
+        else:
+            json_safe_payload = pydantic_core.to_json(payload) if payload else None
         json_safe_params = pydantic_core.to_jsonable_python(params)
-        response = self.request(
-            method=method,
-            url=url,
-            params=json_safe_params,
-            content=json_safe_payload,
-            **kwargs,
-        )
-        data = self.process_response(response=response)
-        return data
+        with span(
+            "lunchable.request", {"http.request.method": method, "url.full": url}
+        ) as request_span:
+            event = self._start_request(method=method, url=url)
+            response = self._send(
+                event,
+                method=method,
+                url=url,
+                params=json_safe_params,
+                content=json_safe_payload,
+                **kwargs,
+            )
+            _set_response_attributes(span=request_span, response=response)
+            with span("lunchable.decode"):
+                return self._process_instrumented(event=event, response=response)
 
     async def amake_request(
         self,
@@ -347,8 +640,9 @@ class LunchMoneyAPIClient:
             PATCH, or DELETE
         url_path: Union[List[Union[str, int]], str, int]
             URL components to make into a URL
-        payload: Optional[Mapping[str, Any]]
-            Data to send in the body of the Request.
+        payload: Optional[Any]
+            Data to send in the body of the Request, serialized to JSON.
+            `bytes` are assumed to be serialized already and are sent as-is.
         params: Optional[Mapping[str, Any]]
             Dictionary, list of tuples or bytes to send in the query
             string for the Request.
@@ -359,15 +653,109 @@ class LunchMoneyAPIClient:
         -------
         Any
         """
-        url = APIConfig.make_url(url_path=url_path)
-        json_safe_payload = pydantic_core.to_jsonable_python(payload)
+        url = APIConfig.make_url(url_path=url_path, base_url=self.base_url)
+        if isinstance(payload, bytes):
+            json_safe_payload: Optional[bytes] = payload
+        else:
+            json_safe_payload = pydantic_core.to_json(payload) if payload else None
         json_safe_params = pydantic_core.to_jsonable_python(params)
-        response = await self.arequest(
-            method=method,
-            url=url,
-            params=json_safe_params,
-            data=json_safe_payload,
-            **kwargs,
+        with span(
+            "lunchable.request", {"http.request.method": method, "url.full": url}
+        ) as request_span:
+            event = self._start_request(method=method, url=url)
+            response = await self._asend(
+                event,
+                method=method,
+                url=url,
+                params=json_safe_params,
+                content=json_safe_payload,
+                **kwargs,
+            )
+            _set_response_attributes(span=request_span, response=response)
+            with span("lunchable.decode"):
+                return self._process_instrumented(event=event, response=response)
+
+    def _map_concurrently(
+        self,
+        function: Callable[[_T], _R],
+        items: Iterable[_T],
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+    ) -> List[_R]:
+        """
+        Call a function for each item using a pool of threads
+
+        Requests made by `function` share the same `httpx.Client` connection pool.
+        Results are returned in the same order as `items`, the first exception
+        raised by `function` is re-raised.
+
+        Parameters
+        ----------
+        function: Callable[[_T], _R]
+            Function to call with each item
+        items: Iterable[_T]
+            Items to call the function with
+        concurrency: int
+            Maximum number of calls in flight at once, defaults to 4
+        rate_limit: Optional[float]
+            Maximum number of calls started per second, defaults to no limit
+
+        Returns
+        -------
+        List[_R]
+        """
+        items = list(items)
+        return list(
+            self._imap_concurrently(
+                function,
+                items,
+                concurrency=min(concurrency, len(items)),
+                rate_limit=rate_limit,
+            )
         )
-        data = self.process_response(response=response)
-        return data
+
+    def _imap_concurrently(
+        self,
+        function: Callable[[_T], _R],
+        items: Iterable[_T],
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+    ) -> Iterator[_R]:
+        """
+        Lazily call a function for each item using a pool of threads
+
+        Like `_map_concurrently`, but `items` is consumed as it goes and
+        results are yielded in order as soon as they're available, so
+        unbounded iterables (i.e. lines read from stdin) can be streamed
+        through the pool.
+
+        Parameters
+        ----------
+        function: Callable[[_T], _R]
+            Function to call with each item
+        items: Iterable[_T]
+            Items to call the function with
+        concurrency: int
+            Maximum number of calls in flight at once, defaults to 4
+        rate_limit: Optional[float]
+            Maximum number of calls started per second, defaults to no limit
+
+        Returns
+        -------
+        Iterator[_R]
+        """
+        if rate_limit is not None:
+            function = partial(
+                _call_rate_limited, function, _RateLimiter(rate=rate_limit)
+            )
+        if concurrency <= 1:
+            yield from map(function, items)
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: Deque[Future[_R]] = deque()
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= concurrency * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -0,0 +1,173 @@
+"""
+Date Period Helpers
+"""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+from enum import Enum
+from typing import List, Tuple
+
+
+class PeriodEnum(str, Enum):
+    """
+    Time Periods
+    """
+
+    day = "day"
+    week = "week"
+    month = "month"
+    year = "year"
+
+
+def period_start(date: datetime.date, period: PeriodEnum | str) -> datetime.date:
+    """
+    First day of the period a date falls in (weeks start on Monday)
+
+    Parameters
+    ----------
+    date: datetime.date
+        Date to truncate
+    period: PeriodEnum | str
+        Length of the period
+
+    Returns
+    -------
+    datetime.date
+    """
+    period = PeriodEnum(period)
+    if period == PeriodEnum.day:
+        return date
+    elif period == PeriodEnum.week:
+        return date - datetime.timedelta(days=date.weekday())
+    elif period == PeriodEnum.month:
+        return date.replace(day=1)
+    return date.replace(month=1, day=1)
+
+
+def next_period_start(date: datetime.date, period: PeriodEnum | str) -> datetime.date:
+    """
+    First day of the period after the one a date falls in
+
+    Parameters
+    ----------
+    date: datetime.date
+        Date within the current period
+    period: PeriodEnum | str
+        Length of the period
+
+    Returns
+    -------
+    datetime.date
+    """
+    period = PeriodEnum(period)
+    start = period_start(date=date, period=period)
+    if period == PeriodEnum.day:
+        return start + datetime.timedelta(days=1)
+    elif period == PeriodEnum.week:
+        return start + datetime.timedelta(days=7)
+    elif period == PeriodEnum.month:
+        return add_months(start, 1)
+    return start.replace(year=start.year + 1)
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """
+    Shift a date by a number of months, clamping to the end of the month
+
+    Parameters
+    ----------
+    date: datetime.date
+        Date to shift
+    months: int
+        Number of months to shift by, may be negative
+
+    Returns
+    -------
+    datetime.date
+    """
+    year, month = divmod(date.year * 12 + date.month - 1 + months, 12)
+    day = min(date.day, calendar.monthrange(year, month + 1)[1])
+    return datetime.date(year, month + 1, day)
+
+
+def period_windows(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    period: PeriodEnum | str = PeriodEnum.month,
+) -> List[Tuple[datetime.date, datetime.date]]:
+    """
+    Split a date range into calendar periods
+
+    The first and last windows are clipped to `start_date` and `end_date`.
+
+    Parameters
+    ----------
+    start_date: datetime.date
+        First day of the range
+    end_date: datetime.date
+        Last day of the range (inclusive)
+    period: PeriodEnum | str
+        Length of each window, defaults to `month`
+
+    Returns
+    -------
+    List[Tuple[datetime.date, datetime.date]]
+        Inclusive (start, end) pairs
+    """
+    windows: List[Tuple[datetime.date, datetime.date]] = []
+    window_start = start_date
+    while window_start <= end_date:
+        next_start = next_period_start(date=window_start, period=period)
+        window_end = min(next_start - datetime.timedelta(days=1), end_date)
+        windows.append((window_start, window_end))
+        window_start = next_start
+    return windows
+
+
+def month_starts(
+    start_date: datetime.date, end_date: datetime.date
+) -> List[datetime.date]:
+    """
+    First day of every month between two dates (inclusive)
+
+    Parameters
+    ----------
+    start_date: datetime.date
+        Any date within the first month
+    end_date: datetime.date
+        Any date within the last month
+
+    Returns
+    -------
+    List[datetime.date]
+    """
+    return [
+        period_start(window_start, PeriodEnum.month)
+        for window_start, _ in period_windows(
+            start_date=start_date, end_date=end_date, period=PeriodEnum.month
+        )
+    ]
+
+
+def is_past_period(end_date: datetime.date, today: datetime.date | None = None) -> bool:
+    """
+    Whether a period ended before the current month
+
+    Data for months that have already closed is treated as settled and safe
+    to cache.
+
+    Parameters
+    ----------
+    end_date: datetime.date
+        Last day of the period
+    today: datetime.date | None
+        Reference date, defaults to today
+
+    Returns
+    -------
+    bool
+    """
+    today = today or datetime.date.today()
+    return end_date < today.replace(day=1)
@@ -204,6 +204,13 @@ class _PlaidAccountDescriptions:
     limit = """
     Optional credit limit of the account. This field is set by Plaid and cannot be altered
     """
+    plaid_last_successful_update = """
+    Date of last successful update from Plaid in ISO 8601 extended format
+    """
+    last_fetch = """
+    Date of last attempted fetch from Plaid in ISO 8601 extended format. Fetches can
+    only be triggered once a minute.
+    """
 
 
 class _RecurringExpensesDescriptions:
@@ -12,6 +12,8 @@ will refer to the TransactionsClient object.
 
 from typing import Optional
 
+import httpx
+
 from .assets import AssetsClient
 from .budgets import BudgetsClient
 from .categories import CategoriesClient
@@ -31,8 +33,8 @@ class LunchMoney(
     CryptoClient,
     PlaidAccountsClient,
     RecurringExpensesClient,
-    TagsClient,
     TransactionsClient,
+    TagsClient,
     UserClient,
     RecurringItemsClient,
 ):
@@ -57,7 +59,14 @@ class LunchMoney(
     ```
     """
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_retries: int = 0,
+    ):
         """
         Initialize a Lunch Money object with an Access Token.
 
@@ -67,5 +76,23 @@ class LunchMoney(
         ----------
         access_token: Optional[str]
             Lunchmoney Developer API Access Token
+        base_url: Optional[str]
+            API base URL, i.e. a local stand-in for the Lunch Money API.
+            Inherited from the `LUNCHMONEY_BASE_URL` environment variable if
+            not provided and defaults to `https://dev.lunchmoney.app`
+        transport: Optional[httpx.BaseTransport]
+            Transport for the sync session, i.e. an `httpx.MockTransport`
+            serving [StandInAPI][lunchable.standin.StandInAPI]
+        async_transport: Optional[httpx.AsyncBaseTransport]
+            Transport for the async session, i.e. an `httpx.ASGITransport`
+        max_retries: int
+            How many times to retry requests that were rate limited (429),
+            honoring their `Retry-After` header. Defaults to 0.
         """
-        super(LunchMoney, self).__init__(access_token=access_token)
+        super(LunchMoney, self).__init__(
+            access_token=access_token,
+            base_url=base_url,
+            transport=transport,
+            async_transport=async_transport,
+            max_retries=max_retries,
+        )
@@ -6,11 +6,16 @@ https://lunchmoney.dev/#assets
 
 import datetime
 import logging
-from typing import List, Optional, Union
+from enum import Enum
+from functools import cached_property
+from typing import Dict, List, Mapping, Optional, Union
 
+import httpx
 from pydantic import Field, field_validator
 
 from lunchable._config import APIConfig
+from lunchable.exceptions import LunchMoneyError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import _AssetsDescriptions
@@ -100,11 +105,41 @@ class _AssetsParamsPost(LunchableModel):
         return round(x, 2)
 
 
+class BalanceUpdateStatus(str, Enum):
+    """
+    Outcome of a Bulk Balance Update
+    """
+
+    updated = "updated"
+    unchanged = "unchanged"
+    failed = "failed"
+
+
+class AssetBalanceUpdate(LunchableModel):
+    """
+    Result of Updating a Single Asset's Balance in Bulk
+    """
+
+    asset_id: int
+    balance: float
+    previous_balance: Optional[float] = None
+    status: BalanceUpdateStatus
+    error: Optional[str] = None
+    asset: Optional[AssetsObject] = None
+
+
 class AssetsClient(LunchMoneyAPIClient):
     """
     Lunch Money Assets Interactions
     """
 
+    @cached_property
+    def _assets_snapshot(self) -> Dict[int, AssetsObject]:
+        """
+        Assets as of the latest `get_assets` call or update
+        """
+        return {}
+
     def get_assets(self) -> List[AssetsObject]:
         """
         Get Manually Managed Assets
@@ -121,7 +156,10 @@ class AssetsClient(LunchMoneyAPIClient):
             method=self.Methods.GET, url_path=[APIConfig.LUNCHMONEY_ASSETS]
         )
         assets = response_data.get(APIConfig.LUNCHMONEY_ASSETS)
-        asset_objects = [AssetsObject.model_validate(item) for item in assets]
+        with response_validation():
+            asset_objects = [AssetsObject.model_validate(item) for item in assets]
+        self._assets_snapshot.clear()
+        self._assets_snapshot.update((asset.id, asset) for asset in asset_objects)
         return asset_objects
 
     def update_asset(
@@ -179,9 +217,98 @@ class AssetsClient(LunchMoneyAPIClient):
             url_path=[APIConfig.LUNCHMONEY_ASSETS, asset_id],
             payload=payload,
         )
-        asset = AssetsObject.model_validate(response_data)
+        with response_validation():
+            asset = AssetsObject.model_validate(response_data)
+        if asset.id in self._assets_snapshot:
+            self._assets_snapshot[asset.id] = asset
         return asset
 
+    def update_asset_balances(
+        self,
+        balances: Mapping[int, float],
+        balance_as_of: Optional[datetime.datetime] = None,
+        refresh: bool = False,
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+    ) -> List[AssetBalanceUpdate]:
+        """
+        Update Many Asset Balances
+
+        Balances are compared (to the cent) against a cached snapshot of
+        `get_assets`, which is fetched the first time it's needed. Unchanged
+        balances aren't sent, the rest are updated concurrently. A failed
+        update doesn't stop the others, it's reported in its result instead.
+
+        Parameters
+        ----------
+        balances: Mapping[int, float]
+            New balances keyed by asset ID
+        balance_as_of: Optional[datetime.datetime]
+            Timestamp of the new balances, defaults to the time of the update
+        refresh: bool
+            Fetch a fresh snapshot of the assets before comparing,
+            defaults to False
+        concurrency: int
+            Maximum number of requests in flight at once, defaults to 4
+        rate_limit: Optional[float]
+            Maximum number of requests started per second, defaults to no limit
+
+        Returns
+        -------
+        List[AssetBalanceUpdate]
+            One result per balance, in the same order as `balances`
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        results = lunch.update_asset_balances({78214: 1520.25, 78215: 10.00})
+        failed = [result for result in results if result.status == "failed"]
+        ```
+        """
+        if refresh or not self._assets_snapshot:
+            self.get_assets()
+        results: Dict[int, AssetBalanceUpdate] = {}
+        for asset_id, balance in balances.items():
+            asset = self._assets_snapshot.get(asset_id)
+            result = AssetBalanceUpdate(
+                asset_id=asset_id,
+                balance=balance,
+                previous_balance=None if asset is None else asset.balance,
+                status=BalanceUpdateStatus.unchanged,
+                asset=asset,
+            )
+            if asset is None:
+                result.status = BalanceUpdateStatus.failed
+                result.error = f"Asset ID not found: {asset_id}"
+            elif round(asset.balance, 2) != round(balance, 2):
+                result.status = BalanceUpdateStatus.updated
+            results[asset_id] = result
+        to_update = [
+            result
+            for result in results.values()
+            if result.status == BalanceUpdateStatus.updated
+        ]
+        logger.debug("Updating %s of %s asset balances", len(to_update), len(results))
+
+        def update(result: AssetBalanceUpdate) -> None:
+            try:
+                result.asset = self.update_asset(
+                    asset_id=result.asset_id,
+                    balance=result.balance,
+                    balance_as_of=balance_as_of,
+                )
+            except (LunchMoneyError, httpx.HTTPError) as error:
+                result.status = BalanceUpdateStatus.failed
+                result.error = str(error)
+
+        self._map_concurrently(
+            update, to_update, concurrency=concurrency, rate_limit=rate_limit
+        )
+        return list(results.values())
+
     def insert_asset(
         self,
         type_name: str,
@@ -247,5 +374,6 @@ class AssetsClient(LunchMoneyAPIClient):
             url_path=[APIConfig.LUNCHMONEY_ASSETS],
             payload=payload,
         )
-        asset = AssetsObject.model_validate(response_data)
+        with response_validation():
+            asset = AssetsObject.model_validate(response_data)
         return asset
@@ -6,13 +6,22 @@ https://lunchmoney.dev/#budget
 
 import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.exceptions import LunchMoneyError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
+from lunchable.models._dates import (
+    PeriodEnum,
+    add_months,
+    is_past_period,
+    period_windows,
+)
 from lunchable.models._descriptions import _BudgetDescriptions
 
 logger = logging.getLogger(__name__)
@@ -132,9 +141,121 @@ class BudgetsClient(LunchMoneyAPIClient):
             url_path=[APIConfig.LUNCHMONEY_BUDGET],
             params=params,
         )
-        budget_objects = [BudgetObject.model_validate(item) for item in response_data]
+        with response_validation():
+            budget_objects = [
+                BudgetObject.model_validate(item) for item in response_data
+            ]
         return budget_objects
 
+    @cached_property
+    def _budgets_cache(
+        self,
+    ) -> Dict[Tuple[datetime.date, datetime.date], List[BudgetObject]]:
+        """
+        Budgets for periods that have already passed
+        """
+        return {}
+
+    def get_budgets_series(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        period: Union[str, PeriodEnum] = PeriodEnum.month,
+        concurrency: int = 4,
+    ) -> List[BudgetObject]:
+        """
+        Get Budgets Across Many Periods
+
+        Split a date range into periods, fetch the budgets for each period
+        concurrently and merge them into a single `BudgetObject` per category
+        whose `data` covers the whole range. Periods that ended before the
+        current month are cached on the client and never fetched twice, the
+        current period is always refreshed.
+
+        Budgets are monthly, so the range is widened to whole months: from the
+        first day of `start_date`'s month to the last day of `end_date`'s.
+
+        Parameters
+        ----------
+        start_date: datetime.date
+            Start of the range
+        end_date: datetime.date
+            End of the range
+        period: Union[str, PeriodEnum]
+            Length of each request's window: `month` or `year`. Defaults to
+            `month`.
+        concurrency: int
+            Maximum number of requests in flight at once, defaults to 4
+
+        Returns
+        -------
+        List[BudgetObject]
+            One budget per category, in the order the API returned them for the
+            latest period. Metadata (i.e. `config`) comes from the latest period.
+
+        Raises
+        ------
+        LunchMoneyError
+            If `period` is shorter than a month
+
+        Examples
+        --------
+        ```python
+        import datetime
+
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        budgets = lunch.get_budgets_series(
+            start_date=datetime.date(2021, 1, 1),
+            end_date=datetime.date(2023, 12, 31),
+            concurrency=8,
+        )
+        ```
+        """
+        if period not in (PeriodEnum.month, PeriodEnum.year):
+            msg = f"Budgets are monthly, period must be month or year: {period}"
+            raise LunchMoneyError(msg)
+        windows = period_windows(
+            start_date=start_date.replace(day=1),
+            end_date=add_months(end_date.replace(day=1), 1)
+            - datetime.timedelta(days=1),
+            period=period,
+        )
+        missing_windows = [
+            window for window in windows if window not in self._budgets_cache
+        ]
+        fetched = self._map_concurrently(
+            lambda window: self.get_budgets(start_date=window[0], end_date=window[1]),
+            missing_windows,
+            concurrency=concurrency,
+        )
+        fetched_windows = dict(zip(missing_windows, fetched))
+        for window, budgets in fetched_windows.items():
+            if is_past_period(end_date=window[1]):
+                self._budgets_cache[window] = budgets
+        logger.debug(
+            "%s budget periods fetched, %s from cache",
+            len(fetched_windows),
+            len(windows) - len(fetched_windows),
+        )
+        merged: Dict[Tuple[Optional[int], bool], BudgetObject] = {}
+        for window in reversed(windows):
+            budgets = (
+                fetched_windows[window]
+                if window in fetched_windows
+                else self._budgets_cache[window]
+            )
+            for budget in budgets:
+                key = (budget.category_id, budget.is_income)
+                if key not in merged:
+                    merged[key] = budget.model_copy(update={"data": {}})
+                for data_date, data in budget.data.items():
+                    merged[key].data.setdefault(data_date, data)
+        for budget in merged.values():
+            budget.data = dict(sorted(budget.data.items()))
+        return list(merged.values())
+
     def upsert_budget(
         self,
         start_date: datetime.date,
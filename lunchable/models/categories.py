@@ -10,12 +10,13 @@ import datetime
 import json
 import logging
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from pydantic import Field
 
 from lunchable._config import APIConfig
 from lunchable.exceptions import LunchMoneyError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import _CategoriesDescriptions
@@ -144,6 +145,227 @@ class _GetCategoriesParams(LunchableModel):
     format: Optional[CategoriesFormatEnum] = None
 
 
+class CategoryTree:
+    """
+    Category Hierarchy Index
+
+    Built once from a list of categories (either format of
+    `LunchMoney.get_categories`), this indexes categories by ID and name and
+    maps each category to its group and each group to its children, so
+    hierarchy lookups don't need another request or a scan of the list.
+
+    Examples
+    --------
+    ```python
+    from lunchable import LunchMoney
+
+    lunch = LunchMoney(access_token="xxxxxxx")
+    tree = lunch.get_category_tree()
+    groceries = tree.get_category(tree.get_id("Groceries"))
+    group = tree.get_group(groceries.id)
+    siblings = tree.get_children(group.id) if group else []
+    ```
+    """
+
+    def __init__(self, categories: Iterable[CategoriesObject]) -> None:
+        """
+        Index a list of categories
+
+        Parameters
+        ----------
+        categories: Iterable[CategoriesObject]
+            Flattened or nested categories, nested children that are full
+            category objects are indexed too
+        """
+        self.categories: Dict[int, CategoriesObject] = {}
+        self.groups: Dict[int, int] = {}
+        self.children: Dict[int, List[int]] = {}
+        self.names: Dict[str, int] = {}
+        for category in categories:
+            self._add(category)
+            for child in category.children or []:
+                if isinstance(child, CategoriesObject):
+                    self._add(child)
+        logger.debug("Indexed %s categories", len(self.categories))
+
+    def _add(self, category: CategoriesObject) -> None:
+        """
+        Index a single category, ignoring ones that are already indexed
+        """
+        if category.id in self.categories:
+            return
+        self.categories[category.id] = category
+        self.names.setdefault(category.name, category.id)
+        if category.is_group:
+            self.children.setdefault(category.id, [])
+        if category.group_id is not None:
+            self.groups[category.id] = category.group_id
+            self.children.setdefault(category.group_id, []).append(category.id)
+
+    def __len__(self) -> int:
+        """
+        Number of Categories
+        """
+        return len(self.categories)
+
+    def __contains__(self, category_id: object) -> bool:
+        """
+        Whether a category ID is indexed
+        """
+        return category_id in self.categories
+
+    def get_category(self, category_id: int) -> CategoriesObject:
+        """
+        Get a category by ID
+
+        Parameters
+        ----------
+        category_id: int
+            Category ID
+
+        Returns
+        -------
+        CategoriesObject
+        """
+        try:
+            return self.categories[category_id]
+        except KeyError as ke:
+            msg = f"Category ID not found: {category_id}"
+            raise LunchMoneyError(msg) from ke
+
+    def get_id(self, name: str) -> int:
+        """
+        Get a category ID by name
+
+        Parameters
+        ----------
+        name: str
+            Category name, when names are shared the first one indexed wins
+
+        Returns
+        -------
+        int
+        """
+        try:
+            return self.names[name]
+        except KeyError as ke:
+            msg = f"Category name not found: {name}"
+            raise LunchMoneyError(msg) from ke
+
+    def get_group(self, category_id: int) -> Optional[CategoriesObject]:
+        """
+        Get the category group a category belongs to
+
+        Parameters
+        ----------
+        category_id: int
+            Category ID
+
+        Returns
+        -------
+        Optional[CategoriesObject]
+            None when the category isn't part of a group
+        """
+        group_id = self.groups.get(self.get_category(category_id).id)
+        return None if group_id is None else self.categories.get(group_id)
+
+    def get_children(self, category_id: int) -> List[CategoriesObject]:
+        """
+        Get the categories within a category group
+
+        Parameters
+        ----------
+        category_id: int
+            Category group ID
+
+        Returns
+        -------
+        List[CategoriesObject]
+            Empty when the category isn't a group
+        """
+        return [
+            self.categories[child_id]
+            for child_id in self.children.get(self.get_category(category_id).id, [])
+        ]
+
+    def ancestors(self, category_id: int) -> List[CategoriesObject]:
+        """
+        Get every group above a category, nearest first
+
+        Parameters
+        ----------
+        category_id: int
+            Category ID
+
+        Returns
+        -------
+        List[CategoriesObject]
+        """
+        ancestors: List[CategoriesObject] = []
+        group = self.get_group(category_id)
+        while group is not None and group not in ancestors:
+            ancestors.append(group)
+            group = self.get_group(group.id)
+        return ancestors
+
+    def descendants(self, category_id: int) -> List[CategoriesObject]:
+        """
+        Get every category below a category group, depth first
+
+        Parameters
+        ----------
+        category_id: int
+            Category group ID
+
+        Returns
+        -------
+        List[CategoriesObject]
+        """
+        descendants: List[CategoriesObject] = []
+        seen = {category_id}
+        stack = list(reversed(self.get_children(category_id)))
+        while stack:
+            child = stack.pop()
+            if child.id in seen:
+                continue
+            seen.add(child.id)
+            descendants.append(child)
+            stack.extend(reversed(self.get_children(child.id)))
+        return descendants
+
+    def nested(self) -> List[CategoriesObject]:
+        """
+        Categories in the `nested` format, derived locally
+
+        Top-level categories (category groups and categories outside of a
+        group) come first by their `order` and then by name, with each group's
+        members under `children` - the same response as
+        `get_categories(format="nested")`.
+
+        Returns
+        -------
+        List[CategoriesObject]
+        """
+        top_level = [
+            category
+            for category_id, category in self.categories.items()
+            if category_id not in self.groups
+        ]
+        top_level.sort(
+            key=lambda category: (
+                category.order is None,
+                category.order or 0,
+                category.name.lower(),
+            )
+        )
+        return [
+            category.model_copy(update={"children": self.get_children(category.id)})
+            if category.is_group
+            else category
+            for category in top_level
+        ]
+
+
 class CategoriesClient(LunchMoneyAPIClient):
     """
     Lunch Money Categories Interactions
@@ -178,11 +400,26 @@ class CategoriesClient(LunchMoneyAPIClient):
             params=_GetCategoriesParams(format=format).model_dump(exclude_none=True),
         )
         categories = response_data["categories"]
-        category_objects = [
-            CategoriesObject.model_validate(item) for item in categories
-        ]
+        with response_validation():
+            category_objects = [
+                CategoriesObject.model_validate(item) for item in categories
+            ]
         return category_objects
 
+    def get_category_tree(self) -> CategoryTree:
+        """
+        Get Spending Categories as a Hierarchy Index
+
+        Fetches the flattened list of categories once and indexes it, see
+        [CategoryTree][lunchable.models.categories.CategoryTree]. The nested
+        format can be derived from the result with `CategoryTree.nested`.
+
+        Returns
+        -------
+        CategoryTree
+        """
+        return CategoryTree(self.get_categories(format=CategoriesFormatEnum.flattened))
+
     def insert_category(
         self,
         name: str,
@@ -263,7 +500,8 @@ class CategoriesClient(LunchMoneyAPIClient):
             method=self.Methods.GET,
             url_path=[APIConfig.LUNCHMONEY_CATEGORIES, category_id],
         )
-        return CategoriesObject.model_validate(response_data)
+        with response_validation():
+            return CategoriesObject.model_validate(response_data)
 
     def remove_category(self, category_id: int) -> bool:
         """
@@ -485,4 +723,5 @@ class CategoriesClient(LunchMoneyAPIClient):
             ],
             payload=payload,
         )
-        return CategoriesObject.model_validate(response_data)
+        with response_validation():
+            return CategoriesObject.model_validate(response_data)
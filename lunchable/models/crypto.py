@@ -6,14 +6,19 @@ https://lunchmoney.dev/#crypto
 
 import datetime
 import logging
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Mapping, Optional
 
+import httpx
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.exceptions import LunchMoneyError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import _CryptoDescriptions
+from lunchable.models.assets import BalanceUpdateStatus
 
 logger = logging.getLogger(__name__)
 
@@ -60,11 +65,31 @@ class CryptoParamsPut(LunchableModel):
     currency: Optional[str] = None
 
 
+class CryptoBalanceUpdate(LunchableModel):
+    """
+    Result of Updating a Single Crypto Asset's Balance in Bulk
+    """
+
+    crypto_id: int
+    balance: float
+    previous_balance: Optional[float] = None
+    status: BalanceUpdateStatus
+    error: Optional[str] = None
+    crypto: Optional[CryptoObject] = None
+
+
 class CryptoClient(LunchMoneyAPIClient):
     """
     Lunch Money Tag Interactions
     """
 
+    @cached_property
+    def _crypto_snapshot(self) -> Dict[int, CryptoObject]:
+        """
+        Crypto assets as of the latest `get_crypto` call or update
+        """
+        return {}
+
     def get_crypto(self) -> List[CryptoObject]:
         """
         Get Crypto Assets
@@ -83,7 +108,10 @@ class CryptoClient(LunchMoneyAPIClient):
             method=self.Methods.GET, url_path=APIConfig.LUNCHMONEY_CRYPTO
         )
         crypto_data = response_data["crypto"]
-        crypto_objects = [CryptoObject.model_validate(item) for item in crypto_data]
+        with response_validation():
+            crypto_objects = [CryptoObject.model_validate(item) for item in crypto_data]
+        self._crypto_snapshot.clear()
+        self._crypto_snapshot.update((crypto.id, crypto) for crypto in crypto_objects)
         return crypto_objects
 
     def update_crypto(
@@ -140,5 +168,92 @@ class CryptoClient(LunchMoneyAPIClient):
             ],
             payload=crypto_body,
         )
-        crypto = CryptoObject.model_validate(response_data)
+        with response_validation():
+            crypto = CryptoObject.model_validate(response_data)
+        if crypto.id in self._crypto_snapshot:
+            self._crypto_snapshot[crypto.id] = crypto
         return crypto
+
+    def update_crypto_balances(
+        self,
+        balances: Mapping[int, float],
+        refresh: bool = False,
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+    ) -> List[CryptoBalanceUpdate]:
+        """
+        Update Many Manual Crypto Balances
+
+        Balances are compared against a cached snapshot of `get_crypto`,
+        which is fetched the first time it's needed. Unchanged balances aren't
+        sent, the rest are updated concurrently. Only manually-managed crypto
+        assets can be updated, a failed update doesn't stop the others,
+        it's reported in its result instead.
+
+        Parameters
+        ----------
+        balances: Mapping[int, float]
+            New balances keyed by crypto asset ID
+        refresh: bool
+            Fetch a fresh snapshot of the crypto assets before comparing,
+            defaults to False
+        concurrency: int
+            Maximum number of requests in flight at once, defaults to 4
+        rate_limit: Optional[float]
+            Maximum number of requests started per second, defaults to no limit
+
+        Returns
+        -------
+        List[CryptoBalanceUpdate]
+            One result per balance, in the same order as `balances`
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        results = lunch.update_crypto_balances({12345: 0.25}, rate_limit=5)
+        ```
+        """
+        if refresh or not self._crypto_snapshot:
+            self.get_crypto()
+        results: Dict[int, CryptoBalanceUpdate] = {}
+        for crypto_id, balance in balances.items():
+            crypto = self._crypto_snapshot.get(crypto_id)
+            result = CryptoBalanceUpdate(
+                crypto_id=crypto_id,
+                balance=balance,
+                previous_balance=None if crypto is None else crypto.balance,
+                status=BalanceUpdateStatus.unchanged,
+                crypto=crypto,
+            )
+            if crypto is None:
+                result.status = BalanceUpdateStatus.failed
+                result.error = f"Crypto ID not found: {crypto_id}"
+            elif crypto.source != "manual":
+                result.status = BalanceUpdateStatus.failed
+                result.error = f"Crypto ID {crypto_id} isn't manually managed"
+            elif crypto.balance != balance:
+                result.status = BalanceUpdateStatus.updated
+            results[crypto_id] = result
+        to_update = [
+            result
+            for result in results.values()
+            if result.status == BalanceUpdateStatus.updated
+        ]
+        logger.debug("Updating %s of %s crypto balances", len(to_update), len(results))
+
+        def update(result: CryptoBalanceUpdate) -> None:
+            try:
+                result.crypto = self.update_crypto(
+                    crypto_id=result.crypto_id, balance=result.balance
+                )
+            except (LunchMoneyError, httpx.HTTPError) as error:
+                result.status = BalanceUpdateStatus.failed
+                result.error = str(error)
+
+        self._map_concurrently(
+            update, to_update, concurrency=concurrency, rate_limit=rate_limit
+        )
+        return list(results.values())
@@ -6,13 +6,19 @@ https://lunchmoney.dev/#plaid-accounts
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import datetime
 import logging
-from typing import List, Optional
+import time
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.exceptions import LunchMoneyError, LunchMoneyTimeoutError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import _PlaidAccountDescriptions
@@ -64,6 +70,63 @@ class PlaidAccountObject(LunchableModel):
         description=_PlaidAccountDescriptions.balance_last_update
     )
     limit: Optional[int] = Field(None, description=_PlaidAccountDescriptions.limit)
+    plaid_last_successful_update: Optional[datetime.datetime] = Field(
+        None, description=_PlaidAccountDescriptions.plaid_last_successful_update
+    )
+    last_fetch: Optional[datetime.datetime] = Field(
+        None, description=_PlaidAccountDescriptions.last_fetch
+    )
+
+
+_PLAID_FETCH_INTERVAL = datetime.timedelta(minutes=1)
+
+
+@dataclasses.dataclass(frozen=True)
+class _PlaidFetch:
+    """
+    A fetch from Plaid triggered by this client
+
+    `baseline` holds the account's update timestamps at the time of the
+    trigger, the fetch is complete once they change.
+    """
+
+    triggered_at: datetime.datetime
+    baseline: Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]
+
+
+def _utcnow() -> datetime.datetime:
+    """
+    Current time in UTC
+    """
+    return datetime.datetime.now(tz=datetime.timezone.utc)
+
+
+def _as_utc(value: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    """
+    Treat naive timestamps from the API as UTC
+    """
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=datetime.timezone.utc)
+
+
+def _update_marker(
+    account: PlaidAccountObject,
+) -> Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]:
+    """
+    Timestamps that change once a fetch from Plaid has landed
+    """
+    return account.plaid_last_successful_update, account.last_import
+
+
+def _backoff(initial: float, maximum: float, factor: float = 1.5) -> Iterator[float]:
+    """
+    Polling delays growing geometrically from `initial` up to `maximum`
+    """
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * factor, maximum)
 
 
 class PlaidAccountsClient(LunchMoneyAPIClient):
@@ -71,6 +134,13 @@ class PlaidAccountsClient(LunchMoneyAPIClient):
     Lunch Money Plaid Accounts Interactions
     """
 
+    @cached_property
+    def _plaid_fetches(self) -> Dict[int, _PlaidFetch]:
+        """
+        Fetches from Plaid triggered by this client, by Plaid account ID
+        """
+        return {}
+
     def get_plaid_accounts(self) -> List[PlaidAccountObject]:
         """
         Get Plaid Synced Assets
@@ -89,7 +159,10 @@ class PlaidAccountsClient(LunchMoneyAPIClient):
             method=self.Methods.GET, url_path=APIConfig.LUNCHMONEY_PLAID_ACCOUNTS
         )
         accounts = response_data.get(APIConfig.LUNCHMONEY_PLAID_ACCOUNTS)
-        account_objects = [PlaidAccountObject.model_validate(item) for item in accounts]
+        with response_validation():
+            account_objects = [
+                PlaidAccountObject.model_validate(item) for item in accounts
+            ]
         return account_objects
 
     def trigger_fetch_from_plaid(
@@ -134,6 +207,250 @@ class PlaidAccountsClient(LunchMoneyAPIClient):
         response: bool = self.make_request(
             method=self.Methods.POST,
             url_path=[APIConfig.LUNCHMONEY_PLAID_ACCOUNTS, "fetch"],
-            data=fetch_request.model_dump(exclude_none=True),
+            payload=fetch_request.model_dump(exclude_none=True),
         )
         return response
+
+    def fetch_from_plaid_and_wait(
+        self,
+        plaid_account_ids: Optional[Iterable[int]] = None,
+        timeout: float = 300.0,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+    ) -> List[PlaidAccountObject]:
+        """
+        Fetch from Plaid and Wait for the Data to Land
+
+        Triggers a fetch for every eligible account and then polls
+        `get_plaid_accounts` until each account's `plaid_last_successful_update`
+        or `last_import` changes. The delay between polls starts at
+        `poll_interval` and grows up to `max_poll_interval`.
+
+        Fetches can only be triggered once a minute per account, accounts
+        fetched (per `last_fetch`) or triggered by this client within the last
+        minute aren't triggered again. Accounts this client triggered are still
+        waited on, and inactive accounts are skipped.
+
+        Parameters
+        ----------
+        plaid_account_ids: Optional[Iterable[int]]
+            Plaid accounts to fetch, defaults to all of them
+        timeout: float
+            Seconds to wait before raising a `LunchMoneyTimeoutError`,
+            defaults to 300
+        start_date: Optional[datetime.date]
+            Start date for fetch (ignored if end_date is null)
+        end_date: Optional[datetime.date]
+            End date for fetch (ignored if start_date is null)
+        poll_interval: float
+            Seconds to wait before the first poll, defaults to 2
+        max_poll_interval: float
+            Longest wait between polls in seconds, defaults to 30
+
+        Returns
+        -------
+        List[PlaidAccountObject]
+            The requested Plaid accounts, after the fetch
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        accounts = lunch.fetch_from_plaid_and_wait(timeout=120)
+        transactions = lunch.get_transactions()
+        ```
+        """
+        deadline = time.monotonic() + timeout
+        accounts = self.get_plaid_accounts()
+        target_ids, trigger_requests = self._plan_plaid_fetch(
+            accounts=accounts,
+            plaid_account_ids=plaid_account_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        for account_ids, fetch_request in trigger_requests:
+            if self.trigger_fetch_from_plaid(**dict(fetch_request)):
+                self._record_plaid_fetch(accounts=accounts, account_ids=account_ids)
+        delays = _backoff(initial=poll_interval, maximum=max_poll_interval)
+        while True:
+            pending = self._pending_plaid_fetches(accounts, target_ids=target_ids)
+            if not pending:
+                return [account for account in accounts if account.id in target_ids]
+            time.sleep(self._next_plaid_poll(delays, deadline, timeout, pending))
+            accounts = self.get_plaid_accounts()
+
+    async def afetch_from_plaid_and_wait(
+        self,
+        plaid_account_ids: Optional[Iterable[int]] = None,
+        timeout: float = 300.0,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+    ) -> List[PlaidAccountObject]:
+        """
+        Fetch from Plaid and Wait for the Data to Land, Asynchronously
+
+        The async form of
+        [fetch_from_plaid_and_wait][lunchable.LunchMoney.fetch_from_plaid_and_wait],
+        polling with `asyncio.sleep` over the async HTTPX client.
+
+        Parameters
+        ----------
+        plaid_account_ids: Optional[Iterable[int]]
+            Plaid accounts to fetch, defaults to all of them
+        timeout: float
+            Seconds to wait before raising a `LunchMoneyTimeoutError`,
+            defaults to 300
+        start_date: Optional[datetime.date]
+            Start date for fetch (ignored if end_date is null)
+        end_date: Optional[datetime.date]
+            End date for fetch (ignored if start_date is null)
+        poll_interval: float
+            Seconds to wait before the first poll, defaults to 2
+        max_poll_interval: float
+            Longest wait between polls in seconds, defaults to 30
+
+        Returns
+        -------
+        List[PlaidAccountObject]
+            The requested Plaid accounts, after the fetch
+        """
+        deadline = time.monotonic() + timeout
+        accounts = await self._aget_plaid_accounts()
+        target_ids, trigger_requests = self._plan_plaid_fetch(
+            accounts=accounts,
+            plaid_account_ids=plaid_account_ids,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        for account_ids, fetch_request in trigger_requests:
+            triggered = await self.amake_request(
+                method=self.Methods.POST,
+                url_path=[APIConfig.LUNCHMONEY_PLAID_ACCOUNTS, "fetch"],
+                payload=fetch_request.model_dump(exclude_none=True),
+            )
+            if triggered:
+                self._record_plaid_fetch(accounts=accounts, account_ids=account_ids)
+        delays = _backoff(initial=poll_interval, maximum=max_poll_interval)
+        while True:
+            pending = self._pending_plaid_fetches(accounts, target_ids=target_ids)
+            if not pending:
+                return [account for account in accounts if account.id in target_ids]
+            await asyncio.sleep(
+                self._next_plaid_poll(delays, deadline, timeout, pending)
+            )
+            accounts = await self._aget_plaid_accounts()
+
+    async def _aget_plaid_accounts(self) -> List[PlaidAccountObject]:
+        """
+        Get Plaid Synced Assets, Asynchronously
+        """
+        response_data = await self.amake_request(
+            method=self.Methods.GET, url_path=APIConfig.LUNCHMONEY_PLAID_ACCOUNTS
+        )
+        accounts = response_data.get(APIConfig.LUNCHMONEY_PLAID_ACCOUNTS)
+        with response_validation():
+            return [PlaidAccountObject.model_validate(item) for item in accounts]
+
+    def _plan_plaid_fetch(
+        self,
+        accounts: List[PlaidAccountObject],
+        plaid_account_ids: Optional[Iterable[int]],
+        start_date: Optional[datetime.date],
+        end_date: Optional[datetime.date],
+    ) -> Tuple[Set[int], List[Tuple[List[int], _PlaidFetchRequest]]]:
+        """
+        Decide which accounts to wait on and which fetches to trigger
+
+        A single fetch for every account is triggered when all accounts are
+        requested and eligible, otherwise one fetch per eligible account.
+        """
+        account_ids = {account.id for account in accounts}
+        target_ids = (
+            account_ids if plaid_account_ids is None else set(plaid_account_ids)
+        )
+        unknown_ids = target_ids - account_ids
+        if unknown_ids:
+            msg = f"Plaid account IDs not found: {sorted(unknown_ids)}"
+            raise LunchMoneyError(msg)
+        now = _utcnow()
+        eligible_ids: List[int] = []
+        for account in accounts:
+            if account.id not in target_ids:
+                continue
+            fetch = self._plaid_fetches.get(account.id)
+            last_fetch = _as_utc(account.last_fetch)
+            if account.status != "active":
+                logger.debug("Plaid account %s is %s", account.id, account.status)
+            elif fetch is not None and now - fetch.triggered_at < _PLAID_FETCH_INTERVAL:
+                logger.debug("Plaid account %s was triggered recently", account.id)
+            elif last_fetch is not None and now - last_fetch < _PLAID_FETCH_INTERVAL:
+                logger.debug("Plaid account %s was fetched recently", account.id)
+            else:
+                eligible_ids.append(account.id)
+        if not eligible_ids:
+            return target_ids, []
+        elif plaid_account_ids is None and len(eligible_ids) == len(accounts):
+            whole_request = _PlaidFetchRequest(start_date=start_date, end_date=end_date)
+            return target_ids, [(eligible_ids, whole_request)]
+        return target_ids, [
+            (
+                [account_id],
+                _PlaidFetchRequest(
+                    start_date=start_date,
+                    end_date=end_date,
+                    plaid_account_id=account_id,
+                ),
+            )
+            for account_id in eligible_ids
+        ]
+
+    def _record_plaid_fetch(
+        self, accounts: List[PlaidAccountObject], account_ids: Iterable[int]
+    ) -> None:
+        """
+        Remember when fetches were triggered and what the accounts looked like
+        """
+        triggered_at = _utcnow()
+        triggered_ids = set(account_ids)
+        for account in accounts:
+            if account.id in triggered_ids:
+                self._plaid_fetches[account.id] = _PlaidFetch(
+                    triggered_at=triggered_at, baseline=_update_marker(account)
+                )
+        logger.info("Triggered a fetch from Plaid for %s accounts", len(triggered_ids))
+
+    def _pending_plaid_fetches(
+        self, accounts: List[PlaidAccountObject], target_ids: Set[int]
+    ) -> List[int]:
+        """
+        Accounts with a triggered fetch that hasn't landed yet
+        """
+        pending: List[int] = []
+        for account in accounts:
+            fetch = self._plaid_fetches.get(account.id)
+            if (
+                account.id in target_ids
+                and fetch is not None
+                and _update_marker(account) == fetch.baseline
+            ):
+                pending.append(account.id)
+        return pending
+
+    @staticmethod
+    def _next_plaid_poll(
+        delays: Iterator[float], deadline: float, timeout: float, pending: List[int]
+    ) -> float:
+        """
+        Seconds until the next poll, raising once the deadline has passed
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            msg = f"Fetch from Plaid didn't complete within {timeout}s: {pending}"
+            raise LunchMoneyTimeoutError(msg)
+        return min(next(delays), remaining)
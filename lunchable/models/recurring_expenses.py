@@ -12,6 +12,7 @@ from typing import List, Optional
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import _RecurringExpensesDescriptions
@@ -131,9 +132,11 @@ class RecurringExpensesClient(LunchMoneyAPIClient):
             params=params,
         )
         recurring_expenses = response_data.get(APIConfig.LUNCH_MONEY_RECURRING_EXPENSES)
-        recurring_expenses_objects = [
-            RecurringExpensesObject.model_validate(item) for item in recurring_expenses
-        ]
+        with response_validation():
+            recurring_expenses_objects = [
+                RecurringExpensesObject.model_validate(item)
+                for item in recurring_expenses
+            ]
         logger.debug(
             "%s RecurringExpensesObjects retrieved", len(recurring_expenses_objects)
         )
@@ -8,13 +8,21 @@ from __future__ import annotations
 
 import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
+from lunchable.models._dates import (
+    PeriodEnum,
+    is_past_period,
+    month_starts,
+    next_period_start,
+)
 from lunchable.models._descriptions import (
     _RecurringItemsDescriptions,
     _SummarizedTransactionDescriptions,
@@ -181,10 +189,98 @@ class RecurringItemsClient(LunchMoneyAPIClient):
             url_path=[APIConfig.LUNCH_MONEY_RECURRING_ITEMS],
             params=params,
         )
-        recurring_expenses_objects = [
-            RecurringItemsObject.model_validate(item) for item in response_data
-        ]
+        with response_validation():
+            recurring_expenses_objects = [
+                RecurringItemsObject.model_validate(item) for item in response_data
+            ]
         logger.debug(
             "%s RecurringExpensesObjects retrieved", len(recurring_expenses_objects)
         )
         return recurring_expenses_objects
+
+    @cached_property
+    def _recurring_items_cache(
+        self,
+    ) -> Dict[Tuple[datetime.date, Optional[bool]], List[RecurringItemsObject]]:
+        """
+        Recurring items for months that have already passed
+        """
+        return {}
+
+    def get_recurring_items_series(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        debit_as_negative: Optional[bool] = None,
+        concurrency: int = 4,
+    ) -> Dict[datetime.date, List[RecurringItemsObject]]:
+        """
+        Get Recurring Items for Many Months
+
+        Fetch the recurring items for every month between two dates, issuing
+        the per-month requests concurrently. Months that have already passed
+        don't change, so they're cached on the client and never fetched twice.
+        The current month and future months are always refreshed.
+
+        Parameters
+        ----------
+        start_date: datetime.date
+            Any date within the first month
+        end_date: datetime.date
+            Any date within the last month
+        debit_as_negative: Optional[bool]
+            Pass in true if you'd like items to be returned as negative amounts
+            and credits as positive amounts. Defaults to false.
+        concurrency: int
+            Maximum number of requests in flight at once, defaults to 4
+
+        Returns
+        -------
+        Dict[datetime.date, List[RecurringItemsObject]]
+            Recurring items keyed by the first day of each month
+
+        Examples
+        --------
+        ```python
+        import datetime
+
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        forecast = lunch.get_recurring_items_series(
+            start_date=datetime.date(2024, 1, 1),
+            end_date=datetime.date(2024, 12, 1),
+        )
+        ```
+        """
+        months = month_starts(start_date=start_date, end_date=end_date)
+        missing_months = [
+            month
+            for month in months
+            if (month, debit_as_negative) not in self._recurring_items_cache
+        ]
+        fetched = self._map_concurrently(
+            lambda month: self.get_recurring_items(
+                start_date=month, debit_as_negative=debit_as_negative
+            ),
+            missing_months,
+            concurrency=concurrency,
+        )
+        fetched_months = dict(zip(missing_months, fetched))
+        for month, items in fetched_months.items():
+            month_end = next_period_start(month, PeriodEnum.month) - datetime.timedelta(
+                days=1
+            )
+            if is_past_period(end_date=month_end):
+                self._recurring_items_cache[(month, debit_as_negative)] = items
+        logger.debug(
+            "%s months of recurring items fetched, %s from cache",
+            len(fetched_months),
+            len(months) - len(fetched_months),
+        )
+        return {
+            month: fetched_months[month]
+            if month in fetched_months
+            else self._recurring_items_cache[(month, debit_as_negative)]
+            for month in months
+        }
@@ -5,11 +5,14 @@ https://lunchmoney.dev/#tags
 """
 
 import logging
-from typing import List, Optional
+from functools import cached_property
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.exceptions import LunchMoneyError
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 
@@ -37,6 +40,157 @@ class TagsObject(LunchableModel):
     )
 
 
+def _is_id(tag: str) -> bool:
+    """
+    Whether a string is a tag ID, i.e. `"123"`
+    """
+    return tag.isascii() and tag.isdigit()
+
+
+class TagResolver:
+    """
+    Bidirectional Tag Name / ID Cache
+
+    Tags are looked up locally and only refetched when a name or ID isn't
+    known yet, i.e. after a tag was created elsewhere. Every call to
+    `LunchMoney.get_tags` refreshes the cache as well.
+    """
+
+    def __init__(self, fetch: Callable[[], List[TagsObject]]) -> None:
+        """
+        Initialize the Tag Resolver
+
+        Parameters
+        ----------
+        fetch: Callable[[], List[TagsObject]]
+            Function returning every tag, called lazily on a cache miss
+        """
+        self._fetch = fetch
+        self.ids: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+
+    def load(self, tags: Iterable[TagsObject]) -> None:
+        """
+        Replace the cached tags
+
+        Parameters
+        ----------
+        tags: Iterable[TagsObject]
+            Every tag on the account
+        """
+        tag_list = list(tags)
+        self.ids = {tag.name: tag.id for tag in tag_list}
+        self.names = {tag.id: tag.name for tag in tag_list}
+
+    def refresh(self) -> None:
+        """
+        Refetch every tag
+        """
+        self.load(self._fetch())
+        logger.debug("Refreshed the tag cache: %s tags", len(self.names))
+
+    def get_ids(self, tags: Iterable[Union[int, str]]) -> List[int]:
+        """
+        Resolve tag names (or IDs) to tag IDs
+
+        IDs are passed through as-is. Names are looked up in the cache,
+        which is refreshed at most once if any of them are missing. Strings
+        of digits that aren't the name of a cached tag are treated as IDs,
+        i.e. `"123"` from a command line, without refreshing the cache.
+
+        Parameters
+        ----------
+        tags: Iterable[Union[int, str]]
+            Tag names or IDs
+
+        Returns
+        -------
+        List[int]
+        """
+        tag_list = list(tags)
+        names = [tag for tag in tag_list if self._as_id(tag) is None]
+        self._refresh_if_missing(tag for tag in names if tag not in self.ids)
+        missing = [tag for tag in names if tag not in self.ids]
+        if missing:
+            msg = f"Tag names not found: {missing}"
+            raise LunchMoneyError(msg)
+        return [self._resolve_id(tag) for tag in tag_list]
+
+    def _as_id(self, tag: Union[int, str]) -> Optional[int]:
+        """
+        The tag ID a tag refers to directly, `None` for tag names
+
+        Strings of digits count as IDs unless they're a cached tag name.
+        """
+        if isinstance(tag, int):
+            return tag
+        elif tag not in self.ids and _is_id(tag):
+            return int(tag)
+        return None
+
+    def _resolve_id(self, tag: Union[int, str]) -> int:
+        """
+        Resolve a tag ID, cached tag name or string of digits to its ID
+        """
+        tag_id = self._as_id(tag)
+        if tag_id is None:
+            return self.ids[str(tag)]
+        return tag_id
+
+    def get_names(self, tags: Iterable[Union[int, str]]) -> List[str]:
+        """
+        Resolve tag IDs (or names) to tag names
+
+        Names are passed through as-is. IDs are looked up in the cache,
+        which is refreshed at most once if any of them are missing. Like
+        [get_ids][lunchable.models.tags.TagResolver.get_ids], strings of
+        digits that aren't the name of a cached tag are treated as IDs.
+
+        Parameters
+        ----------
+        tags: Iterable[Union[int, str]]
+            Tag IDs or names
+
+        Returns
+        -------
+        List[str]
+        """
+        tag_list = list(tags)
+        tag_ids = [self._as_id(tag) for tag in tag_list]
+        ids = [tag_id for tag_id in tag_ids if tag_id is not None]
+        self._refresh_if_missing(tag for tag in ids if tag not in self.names)
+        missing = [tag for tag in ids if tag not in self.names]
+        if missing:
+            msg = f"Tag IDs not found: {missing}"
+            raise LunchMoneyError(msg)
+        return [
+            str(tag) if tag_id is None else self.names[tag_id]
+            for tag, tag_id in zip(tag_list, tag_ids)
+        ]
+
+    def get_id(self, tag: Union[int, str]) -> int:
+        """
+        Resolve a single tag name (or ID) to its ID
+
+        Parameters
+        ----------
+        tag: Union[int, str]
+            Tag name or ID
+
+        Returns
+        -------
+        int
+        """
+        return self.get_ids([tag])[0]
+
+    def _refresh_if_missing(self, missing: Iterable[Union[int, str]]) -> None:
+        """
+        Refresh the cache once when anything is missing
+        """
+        if any(True for _ in missing):
+            self.refresh()
+
+
 class TagsClient(LunchMoneyAPIClient):
     """
     Lunch Money Tag Interactions
@@ -58,5 +212,27 @@ class TagsClient(LunchMoneyAPIClient):
         response_data = self.make_request(
             method=self.Methods.GET, url_path=APIConfig.LUNCHMONEY_TAGS
         )
-        tag_objects = [TagsObject.model_validate(item) for item in response_data]
+        with response_validation():
+            tag_objects = [TagsObject.model_validate(item) for item in response_data]
+        self.tag_resolver.load(tag_objects)
         return tag_objects
+
+    @cached_property
+    def tag_resolver(self) -> TagResolver:
+        """
+        Cached Tag Name / ID Resolver
+
+        Returns
+        -------
+        TagResolver
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        tag_ids = lunch.tag_resolver.get_ids(["Vacation", "Reimbursable"])
+        ```
+        """
+        return TagResolver(fetch=self.get_tags)
@@ -4,28 +4,46 @@ Lunch Money - Transactions
 https://lunchmoney.dev/#transactions
 """
 
+import copy
 import datetime
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pydantic_core
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
+from typing_extensions import Self
 
 from lunchable import LunchMoneyError
 from lunchable._config import APIConfig
+from lunchable._tracing import span
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
-from lunchable.models._core import LunchMoneyAPIClient
 from lunchable.models._descriptions import (
     _TransactionDescriptions,
     _TransactionInsertDescriptions,
     _TransactionSplitDescriptions,
     _TransactionUpdateDescriptions,
 )
-from lunchable.models.tags import TagsObject
+from lunchable.models.tags import TagsClient, TagsObject
 
 logger = logging.getLogger(__name__)
 
+# Validation context marking transactions as fetched, so they track changes
+_FETCHED_CONTEXT_KEY = "lunchable_fetched"
+_FETCHED_CONTEXT = {_FETCHED_CONTEXT_KEY: True}
+
 
 class TransactionBaseObject(LunchableModel):
     """
@@ -301,6 +319,74 @@ class TransactionObject(TransactionBaseObject):
         None, description=_TransactionDescriptions.children
     )
 
+    _original: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _tracked: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Snapshot the fetched state if the transaction was fetched from the API
+        """
+        if __context and __context.get(_FETCHED_CONTEXT_KEY):
+            self.clear_changes()
+
+    def __copy__(self) -> Self:
+        """
+        Copy the transaction, without sharing its fetched state
+        """
+        copied = super().__copy__()
+        copied._original = copy.deepcopy(self._original)
+        return copied
+
+    @property
+    def tracks_changes(self) -> bool:
+        """
+        Whether the transaction knows which of its fields changed
+
+        Transactions fetched from the API (and copies of them) do, those built
+        directly don't, so updating them sends every field.
+
+        Returns
+        -------
+        bool
+        """
+        return self._tracked
+
+    @property
+    def changed_fields(self) -> Dict[str, Any]:
+        """
+        Updatable fields that differ from when the transaction was fetched
+
+        Fields are compared against a snapshot of their fetched values, so
+        in place changes (i.e. appending to `tags`) count as well. Always
+        empty when `tracks_changes` is False.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Current values of the changed fields
+        """
+        if not self._tracked:
+            return {}
+        values = self.__dict__
+        return {
+            name: values[name]
+            for name, original in self._original.items()
+            if values[name] != original
+        }
+
+    def clear_changes(self) -> None:
+        """
+        Treat the current values as the fetched state
+        """
+        values = self.__dict__
+        self._original = {
+            name: copy.deepcopy(values[name])
+            if isinstance(values[name], (list, dict))
+            else values[name]
+            for name in _UPDATE_FIELDS
+        }
+        self._tracked = True
+
     @field_validator("plaid_metadata", mode="before")
     def to_json(cls, x: Optional[str]) -> Optional[Dict[str, Any]]:
         """
@@ -313,7 +399,7 @@ class TransactionObject(TransactionBaseObject):
         else:
             return pydantic_core.from_json(x)
 
-    def get_update_object(self) -> TransactionUpdateObject:
+    def get_update_object(self, changed_only: bool = False) -> TransactionUpdateObject:
         """
         Return a TransactionUpdateObject
 
@@ -321,20 +407,19 @@ class TransactionObject(TransactionBaseObject):
         change one of the properties and perform an `update_transaction` with
         your Lunchable object.
 
+        Parameters
+        ----------
+        changed_only: bool
+            Only include the fields in `changed_fields`, the remaining fields
+            are left unset. Ignored when the transaction doesn't track its
+            changes. Defaults to False.
+
         Returns
         -------
         TransactionUpdateObject
         """
-        update_dict = self.model_dump()
-        try:
-            TransactionUpdateObject.StatusEnum(self.status)
-        except ValueError:
-            update_dict["status"] = None
-        update_object = TransactionUpdateObject.model_validate(update_dict)
-        if update_object.tags is not None:
-            tags = [] if self.tags is None else self.tags
-            update_object.tags = [tag.name for tag in tags]
-        return update_object
+        update_dict = self._update_payload(changed_only=changed_only)
+        return TransactionUpdateObject.model_validate(update_dict)
 
     def get_insert_object(self) -> TransactionInsertObject:
         """
@@ -348,16 +433,91 @@ class TransactionObject(TransactionBaseObject):
         -------
         TransactionInsertObject
         """
-        insert_dict = self.model_dump()
-        try:
-            TransactionInsertObject.StatusEnum(self.status)
-        except ValueError:
-            insert_dict["status"] = None
-        insert_object = TransactionInsertObject.model_validate(insert_dict)
-        if insert_object.tags is not None:
-            tags = [] if self.tags is None else self.tags
-            insert_object.tags = [tag.name for tag in tags]
-        return insert_object
+        insert_dict = self._insert_payload()
+        return TransactionInsertObject.model_validate(insert_dict)
+
+    def _update_payload(self, changed_only: bool = False) -> Dict[str, Any]:
+        """
+        Update request body read straight from the transaction's fields
+
+        Unchanged fields are left out when `changed_only` is set, `None`
+        values are kept so that fields can be cleared.
+        """
+        fields = _UPDATE_FIELDS
+        changed_only = changed_only and self._tracked
+        if changed_only:
+            changed_fields = self.changed_fields
+            fields = tuple(field for field in fields if field in changed_fields)
+        payload = _payload_from_fields(self, fields=fields)
+        if changed_only and "tags" in payload and payload["tags"] is None:
+            payload["tags"] = []
+        _check_lengths(TransactionUpdateObject, payload)
+        return payload
+
+    def _insert_payload(self) -> Dict[str, Any]:
+        """
+        Insert request body read straight from the transaction's fields
+        """
+        payload = _payload_from_fields(self, fields=_INSERT_FIELDS)
+        payload = {key: value for key, value in payload.items() if value is not None}
+        _check_lengths(TransactionInsertObject, payload)
+        return payload
+
+
+_UPDATE_FIELDS = tuple(TransactionUpdateObject.model_fields)
+_INSERT_FIELDS = tuple(TransactionInsertObject.model_fields)
+_WRITABLE_STATUSES = frozenset(
+    status.value for status in TransactionUpdateObject.StatusEnum
+)
+
+
+def _max_lengths(model: Type[LunchableModel]) -> Dict[str, int]:
+    """
+    The `max_length` of each of a model's fields that has one
+    """
+    return {
+        name: constraint.max_length
+        for name, field in model.model_fields.items()
+        for constraint in field.metadata
+        if getattr(constraint, "max_length", None) is not None
+    }
+
+
+_MAX_LENGTHS = {
+    TransactionInsertObject: _max_lengths(TransactionInsertObject),
+    TransactionUpdateObject: _max_lengths(TransactionUpdateObject),
+}
+
+
+def _check_lengths(model: Type[LunchableModel], payload: Mapping[str, Any]) -> None:
+    """
+    Enforce a model's length limits on a request body built without it
+
+    Payloads within the limits aren't validated, others are validated with
+    the model so they raise the same `ValidationError` it would.
+    """
+    for name, max_length in _MAX_LENGTHS[model].items():
+        value = payload.get(name)
+        if isinstance(value, str) and len(value) > max_length:
+            model.model_validate(payload)
+
+
+def _payload_from_fields(
+    transaction: TransactionObject, fields: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Copy fields off a transaction into a JSON-ready request body
+
+    Statuses that can't be written (i.e. `recurring`) become `None` and
+    tag objects become tag names.
+    """
+    values = transaction.__dict__
+    payload = {field: values[field] for field in fields}
+    if "status" in payload and payload["status"] not in _WRITABLE_STATUSES:
+        payload["status"] = None
+    if payload.get("tags") is not None:
+        payload["tags"] = [tag.name for tag in payload["tags"]]
+    return payload
 
 
 class _TransactionsResponse(LunchableModel):
@@ -402,6 +562,34 @@ class _TransactionInsertParamsPost(LunchableModel):
     debit_as_negative: Optional[bool] = None
     skip_balance_update: Optional[bool] = None
 
+    @classmethod
+    def dump_payload(
+        cls,
+        transactions: Iterable[Union[TransactionObject, TransactionInsertObject]],
+        **params: Optional[bool],
+    ) -> bytes:
+        """
+        Serialize the request body straight to JSON bytes
+
+        `TransactionObject` fields are read directly instead of being
+        converted into a `TransactionInsertObject` first, `None` values
+        are left out.
+        """
+        body: Dict[str, Any] = {
+            "transactions": [
+                transaction._insert_payload()
+                if isinstance(transaction, TransactionObject)
+                else transaction
+                for transaction in transactions
+            ]
+        }
+        body.update(
+            (key, value)
+            for key, value in params.items()
+            if value is not None and key in cls.model_fields
+        )
+        return pydantic_core.to_json(body, exclude_none=True)
+
 
 class _TransactionGroupParamsPost(LunchableModel):
     """
@@ -426,6 +614,31 @@ class _TransactionUpdateParamsPut(LunchableModel):
     debit_as_negative: Optional[bool] = None
     skip_balance_update: Optional[bool] = None
 
+    @classmethod
+    def dump_payload(
+        cls,
+        transaction: Optional[Dict[str, Any]] = None,
+        split: Optional[List[TransactionSplitObject]] = None,
+        **params: Optional[bool],
+    ) -> bytes:
+        """
+        Serialize the request body straight to JSON bytes
+
+        `transaction` is an already prepared update body, its `None` values
+        are kept so fields can be cleared. `None` parameters are left out.
+        """
+        body: Dict[str, Any] = {}
+        if split is not None:
+            body["split"] = [item.model_dump(exclude_none=True) for item in split]
+        if transaction is not None:
+            body["transaction"] = transaction
+        body.update(
+            (key, value)
+            for key, value in params.items()
+            if value is not None and key in cls.model_fields
+        )
+        return pydantic_core.to_json(body)
+
 
 class _TransactionsUnsplitPost(LunchableModel):
     """
@@ -436,16 +649,19 @@ class _TransactionsUnsplitPost(LunchableModel):
     remove_parents: Optional[bool] = None
 
 
-class TransactionsClient(LunchMoneyAPIClient):
+class TransactionsClient(TagsClient):
     """
     Lunch Money Transactions Interactions
+
+    Tags can be referenced by name or ID, names are resolved through the
+    cached [tag_resolver][lunchable.LunchMoney.tag_resolver].
     """
 
     def get_transactions(
         self,
         start_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
         end_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
-        tag_id: Optional[int] = None,
+        tag_id: Optional[Union[int, str]] = None,
         recurring_id: Optional[int] = None,
         plaid_account_id: Optional[int] = None,
         category_id: Optional[int] = None,
@@ -477,8 +693,8 @@ class TransactionsClient(LunchMoneyAPIClient):
         end_date: Optional[Union[datetime.date, datetime.datetime, str]]
             Denotes the end of the time period you'd like to get transactions for.
             Defaults to end of current month. Required if start_date exists.
-        tag_id: Optional[int]
-            Filter by tag. Only accepts IDs, not names.
+        tag_id: Optional[Union[int, str]]
+            Filter by tag ID. Tag names are resolved to their IDs.
         recurring_id: Optional[int]
             Filter by recurring expense
         plaid_account_id: Optional[int]
@@ -526,7 +742,9 @@ class TransactionsClient(LunchMoneyAPIClient):
                                               end_date="2020-01-31")
         ```
         """
-        search_params = _TransactionParamsGet(
+        search_params, auto_paginate = self._transaction_search_params(
+            start_date=start_date,
+            end_date=end_date,
             tag_id=tag_id,
             recurring_id=recurring_id,
             plaid_account_id=plaid_account_id,
@@ -537,10 +755,135 @@ class TransactionsClient(LunchMoneyAPIClient):
             status=status,
             offset=offset,
             limit=limit,
+            debit_as_negative=debit_as_negative,
+            pending=pending,
+            params=params,
+        )
+        transactions = self._get_transactions(
+            search_params=search_params,
+            paginate=auto_paginate,
+        )
+        return transactions
+
+    def iter_transaction_pages(
+        self,
+        start_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
+        end_date: Optional[Union[datetime.date, datetime.datetime, str]] = None,
+        tag_id: Optional[Union[int, str]] = None,
+        recurring_id: Optional[int] = None,
+        plaid_account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        asset_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        is_group: Optional[bool] = None,
+        status: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        debit_as_negative: Optional[bool] = None,
+        pending: Optional[bool] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[List[TransactionObject]]:
+        """
+        Get Transactions Using Criteria, One Page at a Time
+
+        Takes the same arguments as
+        [get_transactions][lunchable.LunchMoney.get_transactions], but yields
+        each page of transactions as soon as it arrives instead of collecting
+        every page first. The next page is only requested once the previous
+        one has been consumed.
+
+        Parameters
+        ----------
+        start_date: Optional[Union[datetime.date, datetime.datetime, str]]
+            Denotes the beginning of the time period to fetch transactions for. Defaults
+            to beginning of current month. Required if end_date exists. Format: YYYY-MM-DD.
+        end_date: Optional[Union[datetime.date, datetime.datetime, str]]
+            Denotes the end of the time period you'd like to get transactions for.
+            Defaults to end of current month. Required if start_date exists.
+        tag_id: Optional[Union[int, str]]
+            Filter by tag ID. Tag names are resolved to their IDs.
+        recurring_id: Optional[int]
+            Filter by recurring expense
+        plaid_account_id: Optional[int]
+            Filter by Plaid account
+        category_id: Optional[int]
+            Filter by category. Will also match category groups.
+        asset_id: Optional[int]
+            Filter by asset
+        group_id: Optional[int]
+            Filter by group_id (if the transaction is part of a specific group)
+        is_group: Optional[bool]
+            Filter by group (returns transaction groups)
+        status: Optional[str]
+            Filter by status (Can be cleared or uncleared. For recurring
+            transactions, use recurring)
+        offset: Optional[int]
+            Sets the offset for the records returned (disables
+            automatic pagination)
+        limit: Optional[int]
+            Sets the maximum number of records to return. Defaults to 1000
+             (disables automatic pagination)
+        debit_as_negative: Optional[bool]
+            Pass in true if you'd like expenses to be returned as negative amounts and
+            credits as positive amounts. Defaults to false.
+        pending: Optional[bool]
+            Pass in true if you'd like to include imported transactions with a pending status.
+        params: Optional[dict]
+            Additional Query String Params
+
+        Yields
+        ------
+        List[TransactionObject]
+            A page of transactions
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        for page in lunch.iter_transaction_pages(start_date="2020-01-01",
+                                                 end_date="2020-12-31"):
+            print(len(page))
+        ```
+        """
+        search_params, auto_paginate = self._transaction_search_params(
             start_date=start_date,
             end_date=end_date,
+            tag_id=tag_id,
+            recurring_id=recurring_id,
+            plaid_account_id=plaid_account_id,
+            category_id=category_id,
+            asset_id=asset_id,
+            group_id=group_id,
+            is_group=is_group,
+            status=status,
+            offset=offset,
+            limit=limit,
             debit_as_negative=debit_as_negative,
             pending=pending,
+            params=params,
+        )
+        yield from self._iter_transaction_pages(
+            search_params=search_params, paginate=auto_paginate
+        )
+
+    def _transaction_search_params(
+        self,
+        tag_id: Optional[Union[int, str]],
+        offset: Optional[int],
+        limit: Optional[int],
+        params: Optional[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Query string for a transactions search and whether to paginate it
+        """
+        search_params = _TransactionParamsGet(
+            tag_id=None if tag_id is None else self.tag_resolver.get_id(tag_id),
+            offset=offset,
+            limit=limit,
+            **kwargs,
         ).model_dump(exclude_none=True)
         search_params.update(params if params is not None else {})
         auto_paginate = all(
@@ -551,11 +894,46 @@ class TransactionsClient(LunchMoneyAPIClient):
                 search_params.get("limit") is None,
             ]
         )
-        transactions = self._get_transactions(
-            search_params=search_params,
-            paginate=auto_paginate,
-        )
-        return transactions
+        return search_params, auto_paginate
+
+    def _iter_transaction_pages(
+        self, search_params: Dict[str, Any], paginate: bool = True
+    ) -> Iterator[List[TransactionObject]]:
+        """
+        Paginate Transactions, Lazily
+        """
+        search_params = dict(search_params)
+        offset = search_params.get("offset", 0)
+        while True:
+            with span(
+                "lunchable.transactions.page",
+                {
+                    "lunchable.page.offset": offset,
+                    "lunchable.page.limit": search_params.get("limit"),
+                },
+            ) as page_span:
+                transaction_response = self.make_request(
+                    method=self.Methods.GET,
+                    url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
+                    params=search_params,
+                )
+                with response_validation(), span(
+                    "lunchable.validate", {"lunchable.model": "TransactionObject"}
+                ):
+                    transaction_response = _TransactionsResponse.model_validate(
+                        transaction_response, context=_FETCHED_CONTEXT
+                    )
+                page_span.set_attribute(
+                    "lunchable.page.items", len(transaction_response.transactions)
+                )
+                page_span.set_attribute(
+                    "lunchable.page.has_more", bool(transaction_response.has_more)
+                )
+            yield transaction_response.transactions
+            if not (transaction_response.has_more and paginate):
+                return
+            offset += len(transaction_response.transactions)
+            search_params["offset"] = offset
 
     def _get_transactions(
         self,
@@ -567,22 +945,10 @@ class TransactionsClient(LunchMoneyAPIClient):
         Paginate Transactions
         """
         existing_transactions = existing_transactions or []
-        transaction_response = self.make_request(
-            method=self.Methods.GET,
-            url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
-            params=search_params,
-        )
-        transaction_response = _TransactionsResponse.model_validate(
-            transaction_response
-        )
-        existing_transactions.extend(transaction_response.transactions)
-        if transaction_response.has_more and paginate:
-            search_params["offset"] = len(existing_transactions)
-            return self._get_transactions(
-                existing_transactions=existing_transactions,
-                search_params=search_params,
-                paginate=True,
-            )
+        for page in self._iter_transaction_pages(
+            search_params=search_params, paginate=paginate
+        ):
+            existing_transactions.extend(page)
         return existing_transactions
 
     def get_transaction(
@@ -625,7 +991,10 @@ class TransactionsClient(LunchMoneyAPIClient):
             if debit_as_negative is not None
             else {},
         )
-        return TransactionObject.model_validate(response_data)
+        with response_validation():
+            return TransactionObject.model_validate(
+                response_data, context=_FETCHED_CONTEXT
+            )
 
     ListOrSingleTransactionUpdateObject = Optional[
         Union[TransactionUpdateObject, TransactionObject]
@@ -651,8 +1020,12 @@ class TransactionsClient(LunchMoneyAPIClient):
         Update a Transaction
 
         Use this endpoint to update a single transaction. You may also use this
-        to split an existing transaction. If a TransactionObject is provided it will be
-        converted into a TransactionUpdateObject.
+        to split an existing transaction. If a TransactionObject fetched from
+        the API is provided only the fields changed since it was fetched are
+        sent (see
+        [changed_fields][lunchable.models.transactions.TransactionObject.changed_fields]),
+        other TransactionObjects send every field. When there is nothing to
+        update the request is skipped and `{"updated": False}` is returned.
 
         PUT https://dev.lunchmoney.app/v1/transactions/:transaction_id
 
@@ -711,24 +1084,107 @@ class TransactionsClient(LunchMoneyAPIClient):
                                             transaction=transaction)
         ```
         """
-        payload = _TransactionUpdateParamsPut(
-            split=split,
-            debit_as_negative=debit_as_negative,
-            skip_balance_update=skip_balance_update,
-        ).model_dump(exclude_none=True)
+        tracked = transaction if isinstance(transaction, TransactionObject) else None
+        update_body: Optional[Dict[str, Any]] = None
         if transaction is None and split is None:
             raise LunchMoneyError("You must update the transaction or provide a split")
+        elif tracked is not None:
+            update_body = tracked._update_payload(changed_only=True)
         elif transaction is not None:
-            if isinstance(transaction, TransactionObject):
-                transaction = transaction.get_update_object()
-            payload["transaction"] = transaction.model_dump(exclude_unset=True)
+            update_body = transaction.model_dump(exclude_unset=True)
+        if split is None and not update_body:
+            logger.debug("Transaction %s is unchanged, skipping update", transaction_id)
+            return {"updated": False}
+        payload = _TransactionUpdateParamsPut.dump_payload(
+            transaction=update_body,
+            split=split,
+            debit_as_negative=debit_as_negative,
+            skip_balance_update=skip_balance_update,
+        )
         response_data = self.make_request(
             method=self.Methods.PUT,
             url_path=[APIConfig.LUNCHMONEY_TRANSACTIONS, transaction_id],
             payload=payload,
         )
+        if tracked is not None:
+            tracked.clear_changes()
         return response_data
 
+    def update_transactions(
+        self,
+        transactions: Iterable[TransactionObject],
+        debit_as_negative: Optional[bool] = None,
+        skip_balance_update: Optional[bool] = None,
+        concurrency: int = 4,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Update Many Transactions
+
+        Sends one update per transaction with only its
+        [changed_fields][lunchable.models.transactions.TransactionObject.changed_fields],
+        transactions without any changes are skipped without a request.
+        Transactions that don't track their changes are sent in full.
+
+        Parameters
+        ----------
+        transactions: Iterable[TransactionObject]
+            Fetched transactions, modified in place
+        debit_as_negative: Optional[bool]
+            If true, will assume negative amount values denote expenses and
+            positive amount values denote credits. Defaults to false.
+        skip_balance_update: Optional[bool]
+            If false, will skip updating balance if an asset_id
+            is present for any of the transactions.
+        concurrency: int
+            Maximum number of requests in flight at once, defaults to 4
+
+        Returns
+        -------
+        Dict[int, Dict[str, Any]]
+            Responses keyed by transaction ID, skipped transactions
+            have a response of `{"updated": False}`
+
+        Examples
+        --------
+        ```python
+        from lunchable import LunchMoney
+
+        lunch = LunchMoney(access_token="xxxxxxx")
+        transactions = lunch.get_transactions(category_id=1234)
+        for transaction in transactions:
+            if transaction.payee == "AMZN Mktp US":
+                transaction.payee = "Amazon"
+        responses = lunch.update_transactions(transactions)
+        ```
+        """
+        transaction_list = list(transactions)
+        changed = [
+            transaction
+            for transaction in transaction_list
+            if transaction.changed_fields or not transaction.tracks_changes
+        ]
+        logger.debug(
+            "Updating %s of %s transactions", len(changed), len(transaction_list)
+        )
+        responses = self._map_concurrently(
+            lambda transaction: self.update_transaction(
+                transaction_id=transaction.id,
+                transaction=transaction,
+                debit_as_negative=debit_as_negative,
+                skip_balance_update=skip_balance_update,
+            ),
+            changed,
+            concurrency=concurrency,
+        )
+        updated = {
+            transaction.id: response
+            for transaction, response in zip(changed, responses)
+        }
+        return {
+            transaction.id: updated.get(transaction.id, {"updated": False})
+            for transaction in transaction_list
+        }
+
     def insert_transactions(
         self,
         transactions: ListOrSingleTransactionInsertObject,
@@ -789,27 +1245,22 @@ class TransactionsClient(LunchMoneyAPIClient):
         new_transaction_ids = lunch.insert_transactions(transactions=new_transaction)
         ```
         """
-        insert_objects = []
         if not isinstance(transactions, list):
             transactions = [transactions]
         for item in transactions:
-            if isinstance(item, TransactionObject):
-                insert_objects.append(item.get_insert_object())
-            elif isinstance(item, TransactionInsertObject):
-                insert_objects.append(item)
-            else:
+            if not isinstance(item, (TransactionObject, TransactionInsertObject)):
                 raise LunchMoneyError(
                     "Only TransactionObjects or TransactionInsertObjects are "
                     "supported by this function."
                 )
-        payload = _TransactionInsertParamsPost(
-            transactions=insert_objects,
+        payload = _TransactionInsertParamsPost.dump_payload(
+            transactions=transactions,
             apply_rules=apply_rules,
             skip_duplicates=skip_duplicates,
             check_for_recurring=check_for_recurring,
             debit_as_negative=debit_as_negative,
             skip_balance_update=skip_balance_update,
-        ).model_dump(exclude_none=True)
+        )
         response_data = self.make_request(
             method=self.Methods.POST,
             url_path=APIConfig.LUNCHMONEY_TRANSACTIONS,
@@ -825,7 +1276,7 @@ class TransactionsClient(LunchMoneyAPIClient):
         transactions: List[int],
         category_id: Optional[int] = None,
         notes: Optional[str] = None,
-        tags: Optional[List[int]] = None,
+        tags: Optional[List[Union[int, str]]] = None,
     ) -> int:
         """
         Create a Transaction Group of Two or More Transactions
@@ -842,8 +1293,8 @@ class TransactionsClient(LunchMoneyAPIClient):
             Category for the grouped transaction
         notes: Optional[str]
             Notes for the grouped transaction
-        tags: Optional[List[int]]
-            Array of tag IDs for the grouped transaction
+        tags: Optional[List[Union[int, str]]]
+            Array of tag IDs or names for the grouped transaction
         transactions: Optional[List[int]]
             Array of transaction IDs to be part of the transaction group
 
@@ -860,7 +1311,7 @@ class TransactionsClient(LunchMoneyAPIClient):
             payee=payee,
             category_id=category_id,
             notes=notes,
-            tags=tags,
+            tags=None if tags is None else self.tag_resolver.get_ids(tags),
             transactions=transactions,
         ).model_dump(exclude_none=True)
         response_data = self.make_request(
@@ -960,4 +1411,7 @@ class TransactionsClient(LunchMoneyAPIClient):
                 APIConfig.LUNCHMONEY_TRANSACTION_GROUPS,
             ],
         )
-        return TransactionObject.model_validate(response_data)
+        with response_validation():
+            return TransactionObject.model_validate(
+                response_data, context=_FETCHED_CONTEXT
+            )
@@ -10,6 +10,7 @@ from typing import Optional
 from pydantic import Field
 
 from lunchable._config import APIConfig
+from lunchable.instrumentation import response_validation
 from lunchable.models._base import LunchableModel
 from lunchable.models._core import LunchMoneyAPIClient
 
@@ -57,5 +58,6 @@ class UserClient(LunchMoneyAPIClient):
         response_data = self.make_request(
             method=self.Methods.GET, url_path=APIConfig.LUNCHMONEY_ME
         )
-        me = UserObject.model_validate(response_data)
+        with response_validation():
+            me = UserObject.model_validate(response_data)
         return me
@@ -8,11 +8,24 @@ import datetime
 import functools
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, ClassVar, Dict, List, Tuple, Type, TypeVar, overload
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from lunchable import LunchMoney
+from lunchable._tracing import span
 from lunchable.models import (
     AssetsObject,
     CategoriesObject,
@@ -23,15 +36,76 @@ from lunchable.models import (
     TransactionObject,
     UserObject,
 )
+from lunchable.models.categories import CategoryTree
 
 logger = logging.getLogger(__name__)
 
 LunchableModelType = TypeVar("LunchableModelType", bound=LunchableModel)
 
 
+_ViewType = TypeVar("_ViewType")
+
+
+class _TrackedDict(Dict[Any, Any]):
+    """
+    Dictionary counting the writes made to it in place
+    """
+
+    writes: int = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.writes += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.writes += 1
+
+    def __ior__(self, other: Any) -> _TrackedDict:  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.writes += 1
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.writes += 1
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.writes += 1
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self.writes += 1
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.writes += 1
+
+
 class LunchableData(BaseModel):
     """
     Data Container for Lunchable App Data
+
+    The derived views on this object (`asset_map`, `transactions_list`, etc.)
+    are cached and only rebuilt when the underlying data changes. Each field
+    carries a version counter which is bumped whenever the field is reassigned
+    or refreshed by the `LunchableApp`. Writes made to one of the dictionaries
+    in place (`data.transactions[id] = ...`, `del`, `update()`, etc.) are
+    tracked as well, so the views pick those up without a
+    [bump_version][lunchable.plugins.app.LunchableData.bump_version]. Changing
+    an object held by a dictionary (`data.transactions[id].notes = ...`)
+    isn't a write to the dictionary and still needs one.
+
+    Since the views are shared between callers they are immutable: the lists
+    are tuples and `asset_map` is a read-only mapping. Copy them with `list()`
+    or `dict()` to change them.
     """
 
     plaid_accounts: Dict[int, PlaidAccountObject] = Field(
@@ -53,85 +127,194 @@ class LunchableData(BaseModel):
         description="User",
     )
 
+    _versions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _views: Dict[str, Tuple[Tuple[Tuple[int, int], ...], Any]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Track in place writes to the dictionary fields
+        """
+        for name in type(self).model_fields:
+            value = getattr(self, name)
+            if isinstance(value, dict) and not isinstance(value, _TrackedDict):
+                super().__setattr__(name, _TrackedDict(value))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, bumping its version if it's a data field
+        """
+        if isinstance(value, dict) and not isinstance(value, _TrackedDict):
+            value = _TrackedDict(value)
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self.bump_version(name)
+
+    def version(self, field: str) -> int:
+        """
+        Get the current version of a data field
+
+        Parameters
+        ----------
+        field: str
+            Name of the data field, i.e. `transactions`
+
+        Returns
+        -------
+        int
+        """
+        return self._versions.get(field, 0)
+
+    def bump_version(self, *fields: str) -> None:
+        """
+        Bump the version of one or more data fields
+
+        This invalidates any cached views derived from those fields.
+
+        Parameters
+        ----------
+        *fields: str
+            Names of the data fields, i.e. `transactions`
+        """
+        for field in fields:
+            self._versions[field] = self._versions.get(field, 0) + 1
+
+    def _writes(self, field: str) -> int:
+        """
+        Number of in place writes to a dictionary field, `-1` for other fields
+        """
+        value = getattr(self, field)
+        return value.writes if isinstance(value, _TrackedDict) else -1
+
+    def _cached_view(
+        self, name: str, fields: Tuple[str, ...], builder: Callable[[], _ViewType]
+    ) -> _ViewType:
+        """
+        Return a cached view, rebuilding it if any of its fields changed
+
+        A field counts as changed when its version was bumped or, for
+        dictionaries, when it was written to in place.
+        """
+        state = tuple((self.version(field), self._writes(field)) for field in fields)
+        cached = self._views.get(name)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        view = builder()
+        self._views[name] = (state, view)
+        return view
+
     @property
-    def asset_map(self) -> Dict[int, PlaidAccountObject | AssetsObject]:
+    def asset_map(self) -> Mapping[int, PlaidAccountObject | AssetsObject]:
         """
         Asset Mapping Across Plaid Accounts and Assets
 
         Returns
         -------
-        Dict[int, Union[PlaidAccountObject, AssetsObject]]
+        Mapping[int, Union[PlaidAccountObject, AssetsObject]]
         """
-        return {
-            **self.plaid_accounts,
-            **self.assets,
-        }
+        return self._cached_view(
+            "asset_map",
+            ("plaid_accounts", "assets"),
+            lambda: MappingProxyType({**self.plaid_accounts, **self.assets}),
+        )
+
+    @property
+    def category_tree(self) -> CategoryTree:
+        """
+        Category Hierarchy Index Over the Loaded Categories
+
+        Returns
+        -------
+        CategoryTree
+        """
+        return self._cached_view(
+            "category_tree",
+            ("categories",),
+            lambda: CategoryTree(self.categories.values()),
+        )
 
     @property
-    def plaid_accounts_list(self) -> List[PlaidAccountObject]:
+    def plaid_accounts_list(self) -> Tuple[PlaidAccountObject, ...]:
         """
         List of Plaid Accounts
 
         Returns
         -------
-        List[PlaidAccountObject]
+        Tuple[PlaidAccountObject, ...]
         """
-        return list(self.plaid_accounts.values())
+        return self._cached_view(
+            "plaid_accounts_list",
+            ("plaid_accounts",),
+            lambda: tuple(self.plaid_accounts.values()),
+        )
 
     @property
-    def assets_list(self) -> List[AssetsObject]:
+    def assets_list(self) -> Tuple[AssetsObject, ...]:
         """
         List of Assets
 
         Returns
         -------
-        List[AssetsObject]
+        Tuple[AssetsObject, ...]
         """
-        return list(self.assets.values())
+        return self._cached_view(
+            "assets_list", ("assets",), lambda: tuple(self.assets.values())
+        )
 
     @property
-    def transactions_list(self) -> List[TransactionObject]:
+    def transactions_list(self) -> Tuple[TransactionObject, ...]:
         """
         List of Transactions
 
         Returns
         -------
-        List[TransactionObject]
+        Tuple[TransactionObject, ...]
         """
-        return list(self.transactions.values())
+        return self._cached_view(
+            "transactions_list",
+            ("transactions",),
+            lambda: tuple(self.transactions.values()),
+        )
 
     @property
-    def categories_list(self) -> List[CategoriesObject]:
+    def categories_list(self) -> Tuple[CategoriesObject, ...]:
         """
         List of Categories
 
         Returns
         -------
-        List[CategoriesObject]
+        Tuple[CategoriesObject, ...]
         """
-        return list(self.categories.values())
+        return self._cached_view(
+            "categories_list", ("categories",), lambda: tuple(self.categories.values())
+        )
 
     @property
-    def tags_list(self) -> List[TagsObject]:
+    def tags_list(self) -> Tuple[TagsObject, ...]:
         """
         List of Tags
 
         Returns
         -------
-        List[TagsObject]
+        Tuple[TagsObject, ...]
         """
-        return list(self.tags.values())
+        return self._cached_view(
+            "tags_list", ("tags",), lambda: tuple(self.tags.values())
+        )
 
     @property
-    def crypto_list(self) -> List[CryptoObject]:
+    def crypto_list(self) -> Tuple[CryptoObject, ...]:
         """
         List of Crypto
 
         Returns
         -------
-        List[CryptoObject]
+        Tuple[CryptoObject, ...]
         """
-        return list(self.crypto.values())
+        return self._cached_view(
+            "crypto_list", ("crypto",), lambda: tuple(self.crypto.values())
+        )
 
 
 class BaseLunchableApp(ABC):
@@ -231,13 +414,18 @@ class BaseLunchableApp(ABC):
         except KeyError as e:
             msg = f"Model not supported by Lunchable App: {model.__name__}"
             raise NotImplementedError(msg) from e
-        fetched_data = fetch_data_function()
-        if isinstance(fetched_data, UserObject):
-            data_mapping = fetched_data
-        else:
-            data_mapping = {item.id: item for item in fetched_data}  # type: ignore[assignment]
+        with span(
+            "lunchable.app.refresh", {"lunchable.model": model.__name__}
+        ) as refresh_span:
+            fetched_data = fetch_data_function()
+            if isinstance(fetched_data, UserObject):
+                data_mapping = fetched_data
+            else:
+                data_mapping = {item.id: item for item in fetched_data}  # type: ignore[assignment]
+                refresh_span.set_attribute("lunchable.items", len(data_mapping))
+        # Reassigning the field bumps its version, invalidating cached views
         setattr(self.data, attr_name, data_mapping)
-        return data_mapping
+        return getattr(self.data, attr_name)
 
     def refresh_data(self, models: List[Type[LunchableModel]] | None = None) -> None:
         """
@@ -275,8 +463,12 @@ class BaseLunchableApp(ABC):
         ```
         """
         refresh_models = models or self.lunchable_models
-        for model in refresh_models:
-            self.refresh(model)
+        with span(
+            "lunchable.app.refresh_data",
+            {"lunchable.models": [model.__name__ for model in refresh_models]},
+        ):
+            for model in refresh_models:
+                self.refresh(model)
 
     def refresh_transactions(
         self,
@@ -367,6 +559,7 @@ class BaseLunchableApp(ABC):
         )
         transaction_map = {item.id: item for item in transactions}
         self.data.transactions.update(transaction_map)
+        self.data.bump_version("transactions")
         return transaction_map
 
     def clear_transactions(self) -> None:
@@ -374,6 +567,7 @@ class BaseLunchableApp(ABC):
         Clear Transactions from the App
         """
         self.data.transactions.clear()
+        self.data.bump_version("transactions")
 
 
 class LunchableApp(BaseLunchableApp):
@@ -0,0 +1,393 @@
+"""
+Record and Replay API Responses
+
+[ReplayTransport][lunchable.replay.ReplayTransport] is an httpx transport that
+records every exchange with the Lunch Money API to a single file and replays
+them later, for deterministic offline runs of tests and pipelines at full
+speed:
+
+```python
+from lunchable import LunchMoney
+from lunchable.replay import ReplayTransport
+
+replay = ReplayTransport("pipeline.replay")
+lunch = LunchMoney(transport=replay, async_transport=replay)
+```
+
+The first run talks to the API and records, later runs replay. Exchanges are
+keyed by a fingerprint of the request's method, URL (with its query sorted)
+and body, access tokens are never written. A recording is a header line
+followed by one record per exchange: a JSON line describing the request and
+response, then the response body, zlib compressed. Bodies are skipped over
+when a recording is opened and decompressed in chunks as they're read, so
+replaying very large pages doesn't hold them in memory twice.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import pathlib
+import threading
+import zlib
+from enum import Enum
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import httpx
+
+from lunchable.exceptions import LunchMoneyReplayError
+
+_MAGIC = b"LUNCHABLE-REPLAY 1\n"
+_CHUNK_SIZE = 64 * 1024
+# Bodies are stored decoded, so their encoding and framing don't carry over
+_DROPPED_HEADERS = frozenset(
+    {
+        "connection",
+        "content-encoding",
+        "content-length",
+        "set-cookie",
+        "transfer-encoding",
+    }
+)
+
+
+class RecordMode(str, Enum):
+    """
+    When to Record
+
+    The same modes as vcrpy's:
+
+    - `once`: replay an existing recording, or record one if there isn't any
+    - `new_episodes`: replay what's recorded and record everything else
+    - `none`: only replay, unrecorded requests raise an error
+    - `all`: record everything, replacing the existing recording
+    """
+
+    once = "once"
+    new_episodes = "new_episodes"
+    none = "none"
+    all = "all"
+
+
+@dataclasses.dataclass
+class Exchange:
+    """
+    A Recorded Request and Its Response
+
+    `offset` is where the compressed body starts in the recording, `size` is
+    its compressed and `length` its decompressed size in bytes.
+    """
+
+    fingerprint: str
+    method: str
+    url: str
+    status: int
+    headers: List[Tuple[str, str]]
+    offset: int
+    size: int
+    length: int
+
+
+def request_fingerprint(request: httpx.Request) -> str:
+    """
+    Key a request by its method, URL and body
+
+    Query parameters are sorted so their order doesn't matter. The request
+    must have been read.
+
+    Parameters
+    ----------
+    request: httpx.Request
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest
+    """
+    url = request.url
+    digest = hashlib.sha256()
+    for part in (
+        request.method.upper(),
+        url.scheme,
+        url.host,
+        str(url.port or ""),
+        url.path,
+        urlencode(sorted(url.params.multi_items())),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(request.content)
+    return digest.hexdigest()
+
+
+class _ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """
+    Response Body Decompressed From a Recording as It's Read
+    """
+
+    def __init__(self, path: pathlib.Path, exchange: Exchange) -> None:
+        """
+        Initialize the stream
+        """
+        self.path = path
+        self.exchange = exchange
+
+    def _chunks(self) -> Iterator[bytes]:
+        """
+        Read and decompress the body in chunks
+        """
+        decompressor = zlib.decompressobj()
+        with self.path.open("rb") as file:
+            file.seek(self.exchange.offset)
+            remaining = self.exchange.size
+            while remaining:
+                data = file.read(min(_CHUNK_SIZE, remaining))
+                if not data:
+                    msg = f"Recording is truncated: {self.path}"
+                    raise LunchMoneyReplayError(msg)
+                remaining -= len(data)
+                chunk = decompressor.decompress(data)
+                if chunk:
+                    yield chunk
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Iterate over the body
+        """
+        yield from self._chunks()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the body
+        """
+        for chunk in self._chunks():
+            yield chunk
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx Transport Recording and Replaying Exchanges
+
+    Works as both a sync and an async transport. Requests made more than once
+    replay their responses in the order they were recorded, once they run out
+    the last one is repeated.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        record_mode: Union[str, RecordMode] = RecordMode.once,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Initialize the transport
+
+        Parameters
+        ----------
+        path: Union[str, pathlib.Path]
+            Recording to replay from and record to
+        record_mode: Union[str, RecordMode]
+            When to record, defaults to `once`
+        transport: Optional[httpx.BaseTransport]
+            Transport sync requests are recorded from, defaults to
+            `httpx.HTTPTransport()`
+        async_transport: Optional[httpx.AsyncBaseTransport]
+            Transport async requests are recorded from, defaults to
+            `httpx.AsyncHTTPTransport()`
+        """
+        self.path = pathlib.Path(path)
+        self.record_mode = RecordMode(record_mode)
+        self.transport = transport
+        self.async_transport = async_transport
+        self._lock = threading.Lock()
+        self._exchanges: Dict[str, List[Exchange]] = {}
+        self._played: Dict[str, int] = {}
+        self._fresh = self.record_mode == RecordMode.all or not self.path.exists()
+        if not self._fresh:
+            self._load()
+        self.recording = self.record_mode in (
+            RecordMode.all,
+            RecordMode.new_episodes,
+        ) or (self.record_mode == RecordMode.once and self._fresh)
+
+    @property
+    def exchanges(self) -> List[Exchange]:
+        """
+        Every exchange in the recording
+        """
+        return sorted(
+            (exchange for items in self._exchanges.values() for exchange in items),
+            key=lambda exchange: exchange.offset,
+        )
+
+    def _load(self) -> None:
+        """
+        Index the recording, skipping over response bodies
+        """
+        with self.path.open("rb") as file:
+            if file.readline() != _MAGIC:
+                msg = f"Not a lunchable recording: {self.path}"
+                raise LunchMoneyReplayError(msg)
+            for line in iter(file.readline, b""):
+                record = json.loads(line)
+                exchange = Exchange(
+                    fingerprint=record["fingerprint"],
+                    method=record["method"],
+                    url=record["url"],
+                    status=record["status"],
+                    headers=[
+                        (str(name), str(value)) for name, value in record["headers"]
+                    ],
+                    offset=file.tell(),
+                    size=record["size"],
+                    length=record["length"],
+                )
+                file.seek(exchange.size + 1, 1)
+                self._exchanges.setdefault(exchange.fingerprint, []).append(exchange)
+
+    def _playback(self, fingerprint: str) -> Optional[Exchange]:
+        """
+        The next recorded exchange for a fingerprint
+
+        While recording, requests that have played all their exchanges are
+        recorded again instead of repeating the last one.
+        """
+        with self._lock:
+            exchanges = self._exchanges.get(fingerprint)
+            if not exchanges or self.record_mode == RecordMode.all:
+                return None
+            played = self._played.get(fingerprint, 0)
+            if played >= len(exchanges):
+                return None if self.recording else exchanges[-1]
+            self._played[fingerprint] = played + 1
+            return exchanges[played]
+
+    def _replay(self, exchange: Exchange) -> httpx.Response:
+        """
+        Build the response of a recorded exchange
+        """
+        return httpx.Response(
+            status_code=exchange.status,
+            headers=[*exchange.headers, ("Content-Length", str(exchange.length))],
+            stream=_ReplayStream(path=self.path, exchange=exchange),
+        )
+
+    def _unrecorded(self, request: httpx.Request) -> LunchMoneyReplayError:
+        """
+        Error for a request that isn't recorded and can't be
+        """
+        return LunchMoneyReplayError(
+            f"No recorded response for {request.method} {request.url} in "
+            f"{self.path} (record mode: {self.record_mode.value})"
+        )
+
+    def _record(
+        self, fingerprint: str, request: httpx.Request, response: httpx.Response
+    ) -> httpx.Response:
+        """
+        Append a read response to the recording
+        """
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        body = zlib.compress(response.content)
+        record = {
+            "fingerprint": fingerprint,
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "size": len(body),
+            "length": len(response.content),
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("wb" if self._fresh else "ab") as file:
+                if self._fresh:
+                    file.write(_MAGIC)
+                    self._fresh = False
+                file.write(json.dumps(record, separators=(",", ":")).encode("utf-8"))
+                file.write(b"\n")
+                offset = file.tell()
+                file.write(body)
+                file.write(b"\n")
+            exchange = Exchange(
+                fingerprint=fingerprint,
+                method=request.method,
+                url=str(request.url),
+                status=response.status_code,
+                headers=headers,
+                offset=offset,
+                size=len(body),
+                length=len(response.content),
+            )
+            exchanges = self._exchanges.setdefault(fingerprint, [])
+            exchanges.append(exchange)
+            self._played[fingerprint] = len(exchanges)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=[*headers, ("Content-Length", str(exchange.length))],
+            content=response.content,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Replay or record a sync request
+        """
+        request.read()
+        fingerprint = request_fingerprint(request)
+        exchange = self._playback(fingerprint)
+        if exchange is not None:
+            return self._replay(exchange)
+        if not self.recording:
+            raise self._unrecorded(request)
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        response = self.transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._record(fingerprint, request, response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Replay or record an async request
+        """
+        await request.aread()
+        fingerprint = request_fingerprint(request)
+        exchange = self._playback(fingerprint)
+        if exchange is not None:
+            return self._replay(exchange)
+        if not self.recording:
+            raise self._unrecorded(request)
+        if self.async_transport is None:
+            self.async_transport = httpx.AsyncHTTPTransport()
+        response = await self.async_transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(fingerprint, request, response)
+
+    def close(self) -> None:
+        """
+        Close the sync transport requests are recorded from
+        """
+        if self.transport is not None:
+            self.transport.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the async transport requests are recorded from
+        """
+        if self.async_transport is not None:
+            await self.async_transport.aclose()
@@ -0,0 +1,16 @@
+"""
+Local Lunch Money API Stand-In
+
+A local, seedable imitation of the Lunch Money API for load testing and
+offline development. Point lunchable at it with a base URL override or mount
+it on an httpx transport.
+"""
+
+from lunchable.standin.app import StandInAPI, StandInResponse
+from lunchable.standin.data import SyntheticData
+
+__all__ = [
+    "StandInAPI",
+    "StandInResponse",
+    "SyntheticData",
+]
@@ -0,0 +1,509 @@
+"""
+Lunch Money API Stand-In
+
+An ASGI app serving the endpoints lunchable uses from a
+[SyntheticData][lunchable.standin.data.SyntheticData] account, with
+configurable latency and injected errors and rate limiting. It can be run as
+a local server (`lunchable standin`) or mounted in-process on an httpx
+transport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import json
+import random
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import httpx
+
+from lunchable.standin.data import SyntheticData
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+_TRANSACTION_FILTERS = ("category_id", "plaid_account_id", "asset_id", "tag_id")
+
+
+class _BadRequest(Exception):
+    """
+    A request the API would reject with a 400
+    """
+
+
+@dataclasses.dataclass
+class StandInResponse:
+    """
+    Response of the Stand-In API
+    """
+
+    status: int
+    content: bytes
+    headers: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def json(
+        cls, body: Any, status: int = 200, headers: Optional[Dict[str, str]] = None
+    ) -> StandInResponse:
+        """
+        A JSON response
+        """
+        return cls(
+            status=status,
+            content=json.dumps(body, separators=(",", ":")).encode("utf-8"),
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
+
+
+class StandInAPI:
+    """
+    Local Stand-In for the Lunch Money API
+
+    Writes (inserting and updating transactions) are acknowledged the way the
+    API acknowledges them, but don't change the data that's served.
+
+    Examples
+    --------
+    Serve it in-process to a client:
+
+    ```python
+    from lunchable import LunchMoney
+    from lunchable.standin import StandInAPI, SyntheticData
+
+    api = StandInAPI(data=SyntheticData(seed=1, transactions=1_000_000))
+    lunch = LunchMoney(access_token="standin", transport=api.transport())
+    transactions = lunch.get_transactions(
+        start_date="2024-01-01", end_date="2024-01-31"
+    )
+    ```
+
+    Or run it as a server and point lunchable at it:
+
+    ```shell
+    lunchable standin --transactions 1000000 --latency 0.05 --rate-limit-rate 0.01
+    LUNCHMONEY_BASE_URL=http://127.0.0.1:8080 lunchable transactions get
+    ```
+    """
+
+    def __init__(
+        self,
+        data: Optional[SyntheticData] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        access_token: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the API
+
+        Parameters
+        ----------
+        data: Optional[SyntheticData]
+            Account to serve, defaults to `SyntheticData()`
+        latency: float
+            Seconds every response is delayed by
+        jitter: float
+            Up to this many more seconds are added to each delay, at random
+        error_rate: float
+            Fraction of requests answered with a 500 error
+        rate_limit_rate: float
+            Fraction of requests answered with a 429 error
+        retry_after: int
+            `Retry-After` seconds sent with 429 errors
+        access_token: Optional[str]
+            Only accept this bearer token, any token is accepted by default
+        seed: Optional[int]
+            Seed for latency jitter and injected errors, defaults to the
+            data's seed
+        """
+        if not 0 <= error_rate + rate_limit_rate <= 1:
+            msg = "error_rate and rate_limit_rate must add up to between 0 and 1"
+            raise ValueError(msg)
+        self.data = data if data is not None else SyntheticData()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.access_token = access_token
+        self._random = random.Random(self.data.seed if seed is None else seed)
+        self._lock = threading.Lock()
+        self._next_id = self.data.transactions + 1
+        self._routes: List[
+            Tuple[str, re.Pattern[str], Callable[..., StandInResponse]]
+        ] = [
+            ("GET", re.compile(r"/v1/me"), self._get_user),
+            ("GET", re.compile(r"/v1/transactions"), self._get_transactions),
+            ("POST", re.compile(r"/v1/transactions"), self._insert_transactions),
+            ("GET", re.compile(r"/v1/transactions/(\d+)"), self._get_transaction),
+            ("PUT", re.compile(r"/v1/transactions/(\d+)"), self._update_transaction),
+            ("GET", re.compile(r"/v1/categories"), self._get_categories),
+            ("GET", re.compile(r"/v1/categories/(\d+)"), self._get_category),
+            ("GET", re.compile(r"/v1/tags"), self._get_tags),
+            ("GET", re.compile(r"/v1/assets"), self._get_assets),
+            ("GET", re.compile(r"/v1/plaid_accounts"), self._get_plaid_accounts),
+            ("GET", re.compile(r"/v1/crypto"), self._get_crypto),
+            ("GET", re.compile(r"/v1/budgets"), self._get_budgets),
+            ("GET", re.compile(r"/v1/recurring_items"), self._get_recurring_items),
+        ]
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, str],
+        body: bytes = b"",
+        authorization: Optional[str] = None,
+    ) -> StandInResponse:
+        """
+        Answer a request, without any delay
+
+        Parameters
+        ----------
+        method: str
+            HTTP method
+        path: str
+            URL path, anything before `/v1/` (i.e. a base URL prefix) is ignored
+        params: Mapping[str, str]
+            Query string parameters
+        body: bytes
+            Request body
+        authorization: Optional[str]
+            `Authorization` header
+
+        Returns
+        -------
+        StandInResponse
+        """
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        token = (authorization or "").partition("Bearer ")[2]
+        if not token or (self.access_token is not None and token != self.access_token):
+            return StandInResponse.json(
+                {"error": "Access token does not exist."}, status=401
+            )
+        path = path[path.find("/v1/") :] if "/v1/" in path else path
+        path = path.rstrip("/")
+        allowed = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            allowed = True
+            if route_method != method.upper():
+                continue
+            try:
+                return handler(params, body, *match.groups())
+            except _BadRequest as error:
+                return StandInResponse.json({"error": str(error)}, status=400)
+        if allowed:
+            return StandInResponse.json({"error": "Method not allowed"}, status=405)
+        return StandInResponse.json({"error": f"Not found: {path}"}, status=404)
+
+    def delay(self) -> float:
+        """
+        Seconds the next response should be delayed by
+        """
+        if not self.jitter:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer an httpx request, for use with `httpx.MockTransport`
+        """
+        response = self.respond(
+            method=request.method,
+            path=request.url.path,
+            params=dict(request.url.params),
+            body=request.read(),
+            authorization=request.headers.get("Authorization"),
+        )
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+        return httpx.Response(
+            response.status, content=response.content, headers=response.headers
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        An httpx transport answering every request in-process
+
+        Returns
+        -------
+        httpx.MockTransport
+        """
+        return httpx.MockTransport(self.handle_request)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        ASGI entrypoint
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        headers = {
+            key.decode("latin-1").lower(): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        response = self.respond(
+            method=scope["method"],
+            path=scope["path"],
+            params=dict(parse_qsl(scope["query_string"].decode("latin-1"))),
+            body=body,
+            authorization=headers.get("authorization"),
+        )
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (key.lower().encode("latin-1"), value.encode("latin-1"))
+                    for key, value in response.headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+    def _fault(self) -> Optional[StandInResponse]:
+        """
+        An injected error response, if this request gets one
+        """
+        if not (self.error_rate or self.rate_limit_rate):
+            return None
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return StandInResponse.json(
+                {"error": "Too many requests"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            return StandInResponse.json({"error": "Internal server error"}, status=500)
+        return None
+
+    def _get_user(self, params: Mapping[str, str], body: bytes) -> StandInResponse:
+        """
+        GET /v1/me
+        """
+        return StandInResponse.json(self.data.user())
+
+    def _get_transactions(
+        self, params: Mapping[str, str], body: bytes
+    ) -> StandInResponse:
+        """
+        GET /v1/transactions
+
+        Without a date range every transaction is listed, rather than the
+        current month's.
+        """
+        filters: Dict[str, Any] = {
+            key: _integer(params, key)
+            for key in _TRANSACTION_FILTERS
+            if params.get(key) is not None
+        }
+        if params.get("status") is not None:
+            filters["status"] = params["status"]
+        transactions, has_more = self.data.transactions_page(
+            offset=_integer(params, "offset", default=0),
+            limit=_integer(params, "limit", default=1000),
+            start_date=_date(params, "start_date"),
+            end_date=_date(params, "end_date"),
+            filters=filters,
+        )
+        return StandInResponse.json(
+            {"transactions": transactions, "has_more": has_more}
+        )
+
+    def _get_transaction(
+        self, params: Mapping[str, str], body: bytes, transaction_id: str
+    ) -> StandInResponse:
+        """
+        GET /v1/transactions/:id
+        """
+        index = int(transaction_id) - 1
+        if not 0 <= index < self.data.transactions:
+            return StandInResponse.json(
+                {"error": "Transaction ID not found."}, status=404
+            )
+        return StandInResponse.json(self.data.transaction(index))
+
+    def _insert_transactions(
+        self, params: Mapping[str, str], body: bytes
+    ) -> StandInResponse:
+        """
+        POST /v1/transactions
+        """
+        try:
+            transactions = json.loads(body)["transactions"]
+        except (ValueError, KeyError, TypeError) as error:
+            raise _BadRequest("Request body must include transactions") from error
+        with self._lock:
+            first_id = self._next_id
+            self._next_id += len(transactions)
+        return StandInResponse.json(
+            {"ids": list(range(first_id, first_id + len(transactions)))}
+        )
+
+    def _update_transaction(
+        self, params: Mapping[str, str], body: bytes, transaction_id: str
+    ) -> StandInResponse:
+        """
+        PUT /v1/transactions/:id
+        """
+        if not 0 < int(transaction_id) < self._next_id:
+            return StandInResponse.json(
+                {"error": "Transaction ID not found."}, status=404
+            )
+        return StandInResponse.json({"updated": True})
+
+    def _get_categories(
+        self, params: Mapping[str, str], body: bytes
+    ) -> StandInResponse:
+        """
+        GET /v1/categories
+        """
+        nested = params.get("format") == "nested"
+        return StandInResponse.json(
+            {"categories": self.data.categories_list(nested=nested)}
+        )
+
+    def _get_category(
+        self, params: Mapping[str, str], body: bytes, category_id: str
+    ) -> StandInResponse:
+        """
+        GET /v1/categories/:id
+        """
+        index = int(category_id) - 1
+        if 0 <= index < self.data.categories:
+            return StandInResponse.json(self.data.category(index))
+        if 0 <= index - self.data.categories < self.data.category_groups:
+            return StandInResponse.json(
+                self.data.category_group(index - self.data.categories)
+            )
+        return StandInResponse.json({"error": "Category ID not found."}, status=404)
+
+    def _get_tags(self, params: Mapping[str, str], body: bytes) -> StandInResponse:
+        """
+        GET /v1/tags
+        """
+        return StandInResponse.json(
+            [self.data.tag(index) for index in range(self.data.tags)]
+        )
+
+    def _get_assets(self, params: Mapping[str, str], body: bytes) -> StandInResponse:
+        """
+        GET /v1/assets
+        """
+        return StandInResponse.json(
+            {"assets": [self.data.asset(index) for index in range(self.data.assets)]}
+        )
+
+    def _get_plaid_accounts(
+        self, params: Mapping[str, str], body: bytes
+    ) -> StandInResponse:
+        """
+        GET /v1/plaid_accounts
+        """
+        return StandInResponse.json(
+            {
+                "plaid_accounts": [
+                    self.data.plaid_account(index)
+                    for index in range(self.data.plaid_accounts)
+                ]
+            }
+        )
+
+    def _get_crypto(self, params: Mapping[str, str], body: bytes) -> StandInResponse:
+        """
+        GET /v1/crypto
+        """
+        return StandInResponse.json(
+            {
+                "crypto": [
+                    self.data.crypto_balance(index) for index in range(self.data.crypto)
+                ]
+            }
+        )
+
+    def _get_budgets(self, params: Mapping[str, str], body: bytes) -> StandInResponse:
+        """
+        GET /v1/budgets
+        """
+        start_date = _date(params, "start_date")
+        end_date = _date(params, "end_date")
+        if start_date is None or end_date is None:
+            raise _BadRequest("start_date and end_date are required")
+        return StandInResponse.json(
+            self.data.budgets_list(start_date=start_date, end_date=end_date)
+        )
+
+    def _get_recurring_items(
+        self, params: Mapping[str, str], body: bytes
+    ) -> StandInResponse:
+        """
+        GET /v1/recurring_items
+        """
+        start_date = _date(params, "start_date") or datetime.date.today()
+        return StandInResponse.json(
+            self.data.recurring_items_list(start_date=start_date)
+        )
+
+
+def _integer(params: Mapping[str, str], key: str, default: Optional[int] = None) -> int:
+    """
+    An integer query string parameter
+    """
+    value = params.get(key)
+    if value is None and default is not None:
+        return default
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError) as error:
+        msg = f"{key} must be an integer"
+        raise _BadRequest(msg) from error
+
+
+def _date(params: Mapping[str, str], key: str) -> Optional[datetime.date]:
+    """
+    A `YYYY-MM-DD` query string parameter
+    """
+    value = params.get(key)
+    if value is None:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError as error:
+        msg = f"{key} must be formatted as YYYY-MM-DD"
+        raise _BadRequest(msg) from error
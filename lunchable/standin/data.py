@@ -0,0 +1,701 @@
+"""
+Synthetic Lunch Money Data
+
+Every object is derived from a seed and its own index, nothing is generated
+up front. That keeps a dataset of millions of transactions as cheap to create
+as one of ten, and lets any page of it be served without the pages before it.
+"""
+
+from __future__ import annotations
+
+import array
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from lunchable.models._dates import month_starts
+
+_MASK = (1 << 64) - 1
+
+_PAYEES: Tuple[str, ...] = (
+    "Whole Foods",
+    "Trader Joe's",
+    "Amazon",
+    "Target",
+    "Shell",
+    "Chevron",
+    "Starbucks",
+    "Chipotle",
+    "Uber",
+    "Lyft",
+    "Delta Air Lines",
+    "Airbnb",
+    "Con Edison",
+    "Comcast",
+    "Verizon",
+    "CVS Pharmacy",
+    "Home Depot",
+    "Costco",
+    "Spotify",
+    "Netflix",
+)
+_CATEGORY_NAMES: Tuple[str, ...] = (
+    "Groceries",
+    "Restaurants",
+    "Coffee Shops",
+    "Gas",
+    "Rideshare",
+    "Flights",
+    "Hotels",
+    "Electricity",
+    "Internet",
+    "Phone",
+    "Pharmacy",
+    "Home Improvement",
+    "Subscriptions",
+    "Shopping",
+    "Gifts",
+    "Fitness",
+)
+_GROUP_NAMES: Tuple[str, ...] = (
+    "Food",
+    "Transportation",
+    "Travel",
+    "Bills",
+    "Health",
+    "Home",
+    "Entertainment",
+    "Personal",
+)
+_INSTITUTIONS: Tuple[str, ...] = (
+    "Chase",
+    "Bank of America",
+    "Wells Fargo",
+    "Capital One",
+    "Ally Bank",
+)
+_CADENCES: Tuple[str, ...] = ("monthly", "monthly", "twice a month")
+# Transaction fields that can be filtered on without generating transactions
+_FILTER_FIELDS = frozenset(
+    {"category_id", "plaid_account_id", "asset_id", "tag_id", "status", "is_income"}
+)
+# Filtered listings whose matching indexes are kept, to page through them
+_MATCH_CACHE_SIZE = 16
+
+
+def _mix(seed: int, index: int, salt: int = 0) -> int:
+    """
+    A 64-bit hash of the seed, an index and a salt (splitmix64)
+    """
+    value = (
+        seed * 0x9E3779B97F4A7C15
+        + index * 0xBF58476D1CE4E5B9
+        + salt * 0x94D049BB133111EB
+    ) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def _timestamp(date: datetime.date, seconds: int = 43_200) -> str:
+    """
+    API formatted timestamp, `seconds` into a day
+    """
+    minutes, second = divmod(seconds % 86_400, 60)
+    hour, minute = divmod(minutes, 60)
+    return f"{date.isoformat()}T{hour:02d}:{minute:02d}:{second:02d}.000Z"
+
+
+def _money(cents: int) -> str:
+    """
+    API formatted amount
+    """
+    return f"{cents / 100:.4f}"
+
+
+class SyntheticData:
+    """
+    Seedable Synthetic Lunch Money Account
+
+    Transactions are spread evenly over `[start_date, end_date]` in index
+    order, so the transactions of a date range are a contiguous range of
+    indexes, found without generating any of them.
+
+    Examples
+    --------
+    ```python
+    from lunchable.standin import SyntheticData
+
+    data = SyntheticData(seed=42, transactions=5_000_000)
+    page, has_more = data.transactions_page(offset=2_000_000, limit=1000)
+    ```
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        transactions: int = 10_000,
+        start_date: datetime.date = datetime.date(2020, 1, 1),
+        end_date: datetime.date = datetime.date(2024, 12, 31),
+        categories: int = 32,
+        tags: int = 20,
+        assets: int = 4,
+        plaid_accounts: int = 6,
+        crypto: int = 2,
+        recurring_items: int = 12,
+    ) -> None:
+        """
+        Initialize the Dataset
+
+        Parameters
+        ----------
+        seed: int
+            Seed every value is derived from
+        transactions: int
+            Number of transactions
+        start_date: datetime.date
+            Date of the first transaction
+        end_date: datetime.date
+            Date of the last transaction
+        categories: int
+            Number of categories, which are grouped eight to a category group
+        tags: int
+            Number of tags
+        assets: int
+            Number of manually managed assets
+        plaid_accounts: int
+            Number of Plaid accounts
+        crypto: int
+            Number of crypto balances
+        recurring_items: int
+            Number of recurring items
+        """
+        if end_date < start_date:
+            msg = "end_date must not be before start_date"
+            raise ValueError(msg)
+        self.seed = seed
+        self.transactions = transactions
+        self.start_date = start_date
+        self.end_date = end_date
+        self.categories = max(categories, 1)
+        self.category_groups = (self.categories + 7) // 8
+        self.tags = tags
+        self.assets = assets
+        self.plaid_accounts = plaid_accounts
+        self.crypto = crypto
+        self.recurring_items = recurring_items
+        self._days = (end_date - start_date).days + 1
+        self._matches: OrderedDict[Tuple[Any, ...], Sequence[int]] = OrderedDict()
+        self._matches_lock = threading.Lock()
+
+    def _hash(self, index: int, salt: int) -> int:
+        """
+        Deterministic hash of an object's index
+        """
+        return _mix(self.seed, index, salt)
+
+    def transaction_date(self, index: int) -> datetime.date:
+        """
+        Date of transaction `index`
+        """
+        return self.start_date + datetime.timedelta(
+            days=index * self._days // max(self.transactions, 1)
+        )
+
+    def transaction_range(
+        self,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+    ) -> range:
+        """
+        Indexes of the transactions between two dates, inclusive
+        """
+        total = self.transactions
+
+        def first_on_or_after(date: Optional[datetime.date]) -> int:
+            if date is None:
+                return 0
+            day = (date - self.start_date).days
+            return min(max(-(-day * total // self._days), 0), total)
+
+        start = first_on_or_after(start_date)
+        stop = (
+            total
+            if end_date is None
+            else first_on_or_after(end_date + datetime.timedelta(days=1))
+        )
+        return range(start, max(start, stop))
+
+    def _transaction_keys(self, index: int) -> Dict[str, Any]:
+        """
+        The fields of transaction `index` it can be filtered on, without
+        generating the rest of it
+        """
+        value = self._hash(index, salt=1)
+        category_index = (value >> 8) % self.categories
+        account = (value >> 36) % 5
+        plaid_account_id = asset_id = None
+        if self.plaid_accounts and (account or not self.assets):
+            plaid_account_id = account % self.plaid_accounts + 1
+        elif self.assets:
+            asset_id = account % self.assets + 1
+        has_tag = bool(self.tags) and value % 7 == 0
+        return {
+            "category_id": category_index + 1,
+            "plaid_account_id": plaid_account_id,
+            "asset_id": asset_id,
+            "tag_id": (value >> 44) % max(self.tags, 1) + 1 if has_tag else None,
+            "status": "uncleared" if value % 11 == 0 else "cleared",
+            "is_income": category_index % 16 == 15,
+        }
+
+    def transaction(self, index: int) -> Dict[str, Any]:
+        """
+        Transaction number `index`, shaped like `GET /v1/transactions` items
+        """
+        value = self._hash(index, salt=1)
+        keys = self._transaction_keys(index)
+        date = self.transaction_date(index)
+        payee = _PAYEES[value % len(_PAYEES)]
+        category_index = keys["category_id"] - 1
+        group_index = category_index // 8
+        is_income = keys["is_income"]
+        cents = 100 + (value >> 16) % 25_000
+        account_fields: Dict[str, Any]
+        if keys["plaid_account_id"] is not None:
+            account = keys["plaid_account_id"] - 1
+            source = "plaid"
+            account_fields = {
+                "plaid_account_id": account + 1,
+                "plaid_account_name": f"Account {account + 1}",
+                "plaid_account_mask": f"{account + 1:04d}",
+                "institution_name": self._institution(account),
+                "account_display_name": f"Account {account + 1}",
+            }
+        elif keys["asset_id"] is not None:
+            account = keys["asset_id"] - 1
+            source = "api"
+            account_fields = {
+                "asset_id": account + 1,
+                "asset_name": f"Asset {account + 1}",
+                "asset_status": "active",
+                "account_display_name": f"Asset {account + 1}",
+            }
+        else:
+            source, account_fields = "api", {}
+        tag_id = keys["tag_id"]
+        timestamp = _timestamp(date, seconds=(value >> 20) % 86_400)
+        return {
+            "id": index + 1,
+            "date": date.isoformat(),
+            "payee": payee,
+            "amount": _money(-cents if is_income else cents),
+            "currency": "usd",
+            "to_base": (-cents if is_income else cents) / 100,
+            "category_id": category_index + 1,
+            "category_name": self._category_name(category_index),
+            "category_group_id": self.categories + group_index + 1,
+            "category_group_name": _GROUP_NAMES[group_index % len(_GROUP_NAMES)],
+            "is_income": is_income,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "status": keys["status"],
+            "is_pending": False,
+            "notes": None if value % 5 else f"Synthetic note {index + 1}",
+            "original_name": payee.upper(),
+            "recurring_id": None,
+            "recurring_payee": None,
+            "recurring_description": None,
+            "recurring_cadence": None,
+            "recurring_type": None,
+            "recurring_amount": None,
+            "recurring_currency": None,
+            "parent_id": None,
+            "has_children": False,
+            "group_id": None,
+            "is_group": False,
+            "asset_id": None,
+            "asset_institution_name": None,
+            "asset_name": None,
+            "asset_display_name": None,
+            "asset_status": None,
+            "plaid_account_id": None,
+            "plaid_account_name": None,
+            "plaid_account_mask": None,
+            "institution_name": None,
+            "plaid_account_display_name": None,
+            "plaid_metadata": None,
+            "source": source,
+            "display_name": payee,
+            "display_notes": None,
+            "account_display_name": None,
+            "tags": [] if tag_id is None else [self.tag(tag_id - 1)],
+            "external_id": None,
+            **account_fields,
+        }
+
+    def iter_transactions(
+        self,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Transactions between two dates matching every filter
+
+        Filters are compared against transaction fields, `tag_id` matches
+        transactions having that tag.
+        """
+        for index in self.matching_indexes(
+            start_date=start_date, end_date=end_date, filters=filters
+        ):
+            yield self.transaction(index)
+
+    def matching_indexes(
+        self,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> Sequence[int]:
+        """
+        Indexes of the transactions between two dates matching every filter
+
+        Filters on `category_id`, `plaid_account_id`, `asset_id`, `tag_id`,
+        `status` and `is_income` are checked without generating transactions,
+        other fields need each transaction in the date range. The indexes of
+        the last few filtered listings are kept, so paging through one only
+        filters it once.
+        """
+        indexes = self.transaction_range(start_date=start_date, end_date=end_date)
+        if not filters:
+            return indexes
+        key = (indexes.start, indexes.stop, tuple(sorted(filters.items())))
+        with self._matches_lock:
+            if key in self._matches:
+                self._matches.move_to_end(key)
+                return self._matches[key]
+        if _FILTER_FIELDS.issuperset(filters):
+            fields = self._transaction_keys
+        else:
+            fields = self._filterable_transaction
+        items = tuple(filters.items())
+
+        def is_match(index: int) -> bool:
+            item = fields(index)
+            return all(item.get(name) == value for name, value in items)
+
+        matches = array.array("q", filter(is_match, indexes))
+        with self._matches_lock:
+            self._matches[key] = matches
+            while len(self._matches) > _MATCH_CACHE_SIZE:
+                self._matches.popitem(last=False)
+        return matches
+
+    def _filterable_transaction(self, index: int) -> Dict[str, Any]:
+        """
+        Transaction `index` with its tag as a `tag_id` field
+        """
+        item = self.transaction(index)
+        item["tag_id"] = item["tags"][0]["id"] if item["tags"] else None
+        return item
+
+    def transactions_page(
+        self,
+        offset: int = 0,
+        limit: int = 1000,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        A page of transactions and whether there are more after it
+        """
+        indexes = self.matching_indexes(
+            start_date=start_date, end_date=end_date, filters=filters
+        )
+        selected = indexes[offset : offset + limit]
+        return (
+            [self.transaction(index) for index in selected],
+            offset + limit < len(indexes),
+        )
+
+    def _category_name(self, index: int) -> str:
+        """
+        Unique name of category `index`
+        """
+        name = _CATEGORY_NAMES[index % len(_CATEGORY_NAMES)]
+        cycle = index // len(_CATEGORY_NAMES)
+        return name if cycle == 0 else f"{name} {cycle + 1}"
+
+    def _institution(self, index: int) -> str:
+        """
+        Institution of Plaid account `index`
+        """
+        return _INSTITUTIONS[self._hash(index, salt=2) % len(_INSTITUTIONS)]
+
+    def category(self, index: int) -> Dict[str, Any]:
+        """
+        Category number `index`
+        """
+        return {
+            "id": index + 1,
+            "name": self._category_name(index),
+            "description": None,
+            "is_income": index % 16 == 15,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "archived": False,
+            "archived_on": None,
+            "updated_at": _timestamp(self.start_date),
+            "created_at": _timestamp(self.start_date),
+            "is_group": False,
+            "group_id": self.categories + index // 8 + 1,
+            "order": index % 8,
+        }
+
+    def category_group(self, index: int, nested: bool = False) -> Dict[str, Any]:
+        """
+        Category group number `index`, with its categories as children
+        """
+        members = range(index * 8, min(index * 8 + 8, self.categories))
+        children = [self.category(member) for member in members]
+        return {
+            "id": self.categories + index + 1,
+            "name": _GROUP_NAMES[index % len(_GROUP_NAMES)],
+            "description": None,
+            "is_income": False,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "archived": False,
+            "archived_on": None,
+            "updated_at": _timestamp(self.start_date),
+            "created_at": _timestamp(self.start_date),
+            "is_group": True,
+            "group_id": None,
+            "order": index,
+            "children": children
+            if nested
+            else [
+                {
+                    "id": child["id"],
+                    "name": child["name"],
+                    "description": child["description"],
+                    "created_at": child["created_at"],
+                }
+                for child in children
+            ],
+        }
+
+    def categories_list(self, nested: bool = False) -> List[Dict[str, Any]]:
+        """
+        Every category, as `GET /v1/categories` lists them
+
+        Flat listings include every category and every group, nested ones
+        only the groups with their categories in them.
+        """
+        groups = [
+            self.category_group(index, nested=nested)
+            for index in range(self.category_groups)
+        ]
+        if nested:
+            return groups
+        return [self.category(index) for index in range(self.categories)] + groups
+
+    def tag(self, index: int) -> Dict[str, Any]:
+        """
+        Tag number `index`
+        """
+        return {
+            "id": index + 1,
+            "name": f"Tag {index + 1}",
+            "description": None,
+            "archived": False,
+        }
+
+    def asset(self, index: int) -> Dict[str, Any]:
+        """
+        Manually managed asset number `index`
+        """
+        value = self._hash(index, salt=3)
+        return {
+            "id": index + 1,
+            "type_name": "cash",
+            "subtype_name": "savings" if index % 2 else "checking",
+            "name": f"Asset {index + 1}",
+            "display_name": None,
+            "balance": _money(value % 10_000_000),
+            "balance_as_of": _timestamp(self.end_date),
+            "closed_on": None,
+            "currency": "usd",
+            "institution_name": _INSTITUTIONS[value % len(_INSTITUTIONS)],
+            "exclude_transactions": False,
+            "created_at": _timestamp(self.start_date),
+        }
+
+    def plaid_account(self, index: int) -> Dict[str, Any]:
+        """
+        Plaid account number `index`
+        """
+        value = self._hash(index, salt=4)
+        is_credit = index % 3 == 2
+        return {
+            "id": index + 1,
+            "date_linked": self.start_date.isoformat(),
+            "name": f"Account {index + 1}",
+            "type": "credit" if is_credit else "depository",
+            "subtype": "credit card" if is_credit else "checking",
+            "mask": f"{index + 1:04d}",
+            "institution_name": self._institution(index),
+            "status": "active",
+            "last_import": _timestamp(self.end_date),
+            "balance": _money(value % 5_000_000),
+            "currency": "usd",
+            "balance_last_update": _timestamp(self.end_date),
+            "limit": 10_000 if is_credit else None,
+        }
+
+    def crypto_balance(self, index: int) -> Dict[str, Any]:
+        """
+        Crypto balance number `index`
+        """
+        value = self._hash(index, salt=5)
+        return {
+            "id": index + 1,
+            "zabo_account_id": None,
+            "source": "manual",
+            "name": "Bitcoin" if index % 2 == 0 else "Ethereum",
+            "display_name": None,
+            "balance": f"{value % 1_000_000 / 100_000:.6f}",
+            "balance_as_of": _timestamp(self.end_date),
+            "currency": "btc" if index % 2 == 0 else "eth",
+            "status": "active",
+            "institution_name": None,
+            "created_at": _timestamp(self.start_date),
+        }
+
+    def user(self) -> Dict[str, Any]:
+        """
+        The account's user
+        """
+        return {
+            "user_id": 1,
+            "user_name": "Synthetic User",
+            "user_email": "synthetic@example.com",
+            "account_id": 1,
+            "budget_name": f"Synthetic Budget {self.seed}",
+            "api_key_label": "standin",
+        }
+
+    def budgets_list(
+        self, start_date: datetime.date, end_date: datetime.date
+    ) -> List[Dict[str, Any]]:
+        """
+        Budget summaries of every category for the months between two dates
+
+        Spending is synthetic rather than summed from the transactions, which
+        would mean generating all of them.
+        """
+        months = month_starts(start_date=start_date, end_date=end_date)
+        budgets = []
+        for index in range(self.categories):
+            category = self.category(index)
+            data = {}
+            for month in months:
+                value = self._hash(index, salt=month.toordinal())
+                budgeted = 10_000 + (index * 2_500) % 90_000
+                spent = value % (budgeted * 3 // 2)
+                data[month.isoformat()] = {
+                    "budget_amount": budgeted / 100,
+                    "budget_currency": "usd",
+                    "budget_to_base": budgeted / 100,
+                    "spending_to_base": spent / 100,
+                    "num_transactions": value % 40,
+                }
+            budgets.append(
+                {
+                    "category_name": category["name"],
+                    "category_id": category["id"],
+                    "category_group_name": _GROUP_NAMES[
+                        (index // 8) % len(_GROUP_NAMES)
+                    ],
+                    "group_id": category["group_id"],
+                    "is_group": False,
+                    "is_income": category["is_income"],
+                    "exclude_from_budget": False,
+                    "exclude_from_totals": False,
+                    "data": data,
+                    "config": None,
+                }
+            )
+        return budgets
+
+    def recurring_items_list(self, start_date: datetime.date) -> List[Dict[str, Any]]:
+        """
+        Recurring items expected in the month of `start_date`
+        """
+        month = start_date.replace(day=1)
+        items = []
+        for index in range(self.recurring_items):
+            value = self._hash(index, salt=6)
+            cadence = _CADENCES[index % len(_CADENCES)]
+            billing_day = value % 28 + 1
+            cents = 500 + (value >> 8) % 20_000
+            payee = _PAYEES[(value >> 24) % len(_PAYEES)]
+            billing_dates = [month.replace(day=billing_day)]
+            if cadence == "twice a month":
+                billing_dates.append(month.replace(day=(billing_day + 13) % 28 + 1))
+            occurrences = {
+                date.isoformat(): [
+                    {
+                        "id": self.transactions + index * 100 + position + 1,
+                        "date": date.isoformat(),
+                        "amount": _money(cents),
+                        "currency": "usd",
+                        "payee": payee,
+                        "category_id": (value >> 40) % self.categories + 1,
+                        "recurring_id": index + 1,
+                        "to_base": cents / 100,
+                    }
+                ]
+                for position, date in enumerate(sorted(billing_dates))
+            }
+            items.append(
+                {
+                    "id": index + 1,
+                    "start_date": self.start_date.replace(day=billing_day).isoformat(),
+                    "end_date": None,
+                    "payee": payee,
+                    "currency": "usd",
+                    "created_by": 1,
+                    "created_at": _timestamp(self.start_date),
+                    "updated_at": _timestamp(self.start_date),
+                    "billing_date": self.start_date.replace(
+                        day=billing_day
+                    ).isoformat(),
+                    "original_name": payee.upper(),
+                    "description": None,
+                    "plaid_account_id": None,
+                    "asset_id": None,
+                    "source": "manual",
+                    "notes": None,
+                    "amount": _money(cents),
+                    "category_id": (value >> 40) % self.categories + 1,
+                    "category_group_id": None,
+                    "is_income": False,
+                    "exclude_from_totals": False,
+                    "granularity": "month",
+                    "cadence": cadence,
+                    "quantity": 1,
+                    "occurrences": occurrences,
+                    "transactions_within_range": [
+                        item for dated in occurrences.values() for item in dated
+                    ],
+                    "missing_dates_within_range": [],
+                    "date": None,
+                    "to_base": cents / 100,
+                }
+            )
+        return items
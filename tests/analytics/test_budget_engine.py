@@ -0,0 +1,160 @@
+"""
+Run Tests on the Local Budget Engine
+"""
+
+import datetime
+import pathlib
+from typing import List
+
+from lunchable import LunchMoney
+from lunchable.analytics import BudgetEngine, budgets_to_matrix
+from lunchable.models import BudgetObject, TransactionObject
+from tests.conftest import lunchable_cassette
+
+cassettes_dir = pathlib.Path(__file__).parent.parent / "models"
+
+january = datetime.date(2024, 1, 1)
+
+
+def test_local_budgets(lunch_money_obj: LunchMoney) -> None:
+    """
+    Compute budgets from the recorded budgets and transactions
+    """
+    with lunchable_cassette(str(cassettes_dir / "test_get_budgets")):
+        budgets = lunch_money_obj.get_budgets(
+            start_date=datetime.date(2022, 11, 1),
+            end_date=datetime.date(2022, 11, 29),
+        )
+    with lunchable_cassette(str(cassettes_dir / "test_get_transactions")):
+        transactions = lunch_money_obj.get_transactions()
+    engine = BudgetEngine(budgets=budgets, transactions=transactions)
+    local_budgets = engine.get_budgets(
+        start_date=january, end_date=datetime.date(2024, 1, 31)
+    )
+    assert len(local_budgets) == len(budgets)
+    summary = {
+        budget.category_name: budget.data[january]
+        for budget in local_budgets
+        if budget.category_id is not None
+    }
+    assert isinstance(local_budgets[0], BudgetObject)
+    assert summary["Shopping"].spending_to_base == 850.52
+    assert summary["Shopping"].num_transactions == 12
+    # The grouped Personal Care transactions are counted through their group
+    assert summary["Personal Care"].spending_to_base == 150.0
+    assert summary["Personal Care"].num_transactions == 1
+    assert summary["Home"].spending_to_base == 94.61
+    assert summary["Groceries"].num_transactions == 1
+    assert summary["Income"].num_transactions == 0
+
+
+def test_local_budgets_config(lunch_money_obj: LunchMoney) -> None:
+    """
+    Budgeted amounts fall back to the budget configuration
+    """
+    budget = BudgetObject.model_validate(
+        {
+            "category_name": "Groceries",
+            "category_id": 1,
+            "is_income": False,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "data": {"2024-01-01": {"budget_amount": 50, "budget_to_base": 50}},
+            "config": {
+                "config_id": 1,
+                "cadence": "monthly",
+                "amount": 100,
+                "currency": "usd",
+                "to_base": 100,
+                "auto_suggest": "fixed",
+            },
+        }
+    )
+    engine = BudgetEngine(budgets=[budget], transactions=[])
+    (local_budget,) = engine.get_budgets(
+        start_date=january, end_date=datetime.date(2024, 2, 10)
+    )
+    assert list(local_budget.data) == [january, datetime.date(2024, 2, 1)]
+    assert local_budget.data[january].budget_amount == 50
+    assert local_budget.data[datetime.date(2024, 2, 1)].budget_amount == 100
+    assert local_budget.data[datetime.date(2024, 2, 1)].spending_to_base == 0
+    quarterly = budget.model_copy(
+        update={
+            "config": budget.config.model_copy(update={"cadence": "every 3 months"})
+        }
+    )
+    (local_budget,) = BudgetEngine(budgets=[quarterly], transactions=[]).get_budgets(
+        start_date=january, end_date=datetime.date(2024, 2, 10)
+    )
+    assert local_budget.data[january].budget_amount == 50
+    assert local_budget.data[datetime.date(2024, 2, 1)].budget_amount is None
+    assert local_budget.data[datetime.date(2024, 2, 1)].budget_to_base is None
+
+
+def test_local_budgets_match_api(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    The engine reproduces the API's summaries of a recorded month
+
+    There are no recorded transactions for the recorded budget month, so the
+    month's transactions are built from its per-category counts and totals.
+    """
+    november = datetime.date(2022, 11, 1)
+    with lunchable_cassette(str(cassettes_dir / "test_get_budgets")):
+        budgets = lunch_money_obj.get_budgets(
+            start_date=november, end_date=datetime.date(2022, 11, 29)
+        )
+    categories = {budget.category_name: budget.category_id for budget in budgets}
+    amounts = [("Groceries", 28.15)] + [("Shopping", 70.0)] * 9
+    amounts += [("Shopping", 81.69)]
+    template = test_transactions[0]
+    transactions = [
+        template.model_copy(
+            update={
+                "id": index + 1,
+                "date": november + datetime.timedelta(days=index),
+                "category_id": categories[category],
+                "amount": amount,
+                "to_base": amount,
+            }
+        )
+        for index, (category, amount) in enumerate(amounts)
+    ]
+    # Outside of the month
+    transactions.append(
+        transactions[0].model_copy(
+            update={"id": 100, "date": datetime.date(2022, 12, 1)}
+        )
+    )
+    engine = BudgetEngine(budgets=budgets, transactions=transactions)
+    local_budgets = engine.get_budgets(
+        start_date=november, end_date=datetime.date(2022, 11, 30)
+    )
+    assert [budget.data[november] for budget in local_budgets] == [
+        budget.data[november] for budget in budgets
+    ]
+
+
+def test_budgets_to_matrix(lunch_money_obj: LunchMoney) -> None:
+    """
+    Convert budgets into dense category-by-month arrays
+    """
+    with lunchable_cassette(str(cassettes_dir / "test_get_budgets")):
+        budgets = lunch_money_obj.get_budgets(
+            start_date=datetime.date(2022, 11, 1),
+            end_date=datetime.date(2022, 11, 29),
+        )
+    groceries = budgets[2].data[datetime.date(2022, 11, 1)]
+    budgets[2].data[january] = groceries.model_copy(
+        update={"budget_to_base": 50.0, "spending_to_base": 20.0}
+    )
+    matrix = budgets_to_matrix(budgets)
+    assert matrix.months.tolist() == [datetime.date(2022, 11, 1), january]
+    assert matrix.spending_to_base.shape == (len(budgets), 2)
+    assert matrix.category_name[2] == "Groceries"
+    assert matrix.spending_to_base[2].tolist() == [28.15, 20.0]
+    assert matrix.num_transactions[6, 0] == 10
+    assert matrix.num_transactions[6, 1] == 0
+    assert matrix.variance[2, 1] == 30.0
+    assert matrix.rollover[2].tolist() == [0.0, 30.0]
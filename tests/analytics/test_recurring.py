@@ -0,0 +1,104 @@
+"""
+Run Tests on the Recurring Item Projections
+"""
+
+import datetime
+import pathlib
+
+from lunchable import LunchMoney
+from lunchable.analytics import project_recurring_items
+from lunchable.models.recurring_items import RecurringItemsObject
+from tests.conftest import lunchable_cassette
+
+cassettes_dir = pathlib.Path(__file__).parent.parent / "models"
+
+
+def _recurring_item(**kwargs: object) -> RecurringItemsObject:
+    """
+    Build a recurring item with sensible defaults
+    """
+    defaults = {
+        "id": 1,
+        "payee": "Test",
+        "currency": "usd",
+        "created_by": 1,
+        "created_at": "2021-01-01T00:00:00Z",
+        "updated_at": "2021-01-01T00:00:00Z",
+        "billing_date": "2024-01-31",
+        "granularity": "month",
+        "quantity": 1,
+        "source": "manual",
+        "amount": 10,
+        "to_base": 10,
+        "is_income": False,
+        "exclude_from_totals": False,
+        "occurrences": {},
+    }
+    defaults.update(kwargs)
+    return RecurringItemsObject.model_validate(defaults)
+
+
+def test_projection_matches_api(lunch_money_obj: LunchMoney) -> None:
+    """
+    Projected occurrences agree with the recorded API occurrences
+    """
+    with lunchable_cassette(str(cassettes_dir / "test_get_recurring_items")):
+        recurring_items = lunch_money_obj.get_recurring_items(
+            start_date=datetime.date(2022, 11, 1)
+        )
+    recurring_item = recurring_items[0]
+    occurrence_dates = sorted(recurring_item.occurrences)
+    projection = project_recurring_items(
+        recurring_items, start_date=occurrence_dates[0], end_date=occurrence_dates[-1]
+    )
+    assert projection.to_dict() == {recurring_item.id: occurrence_dates}
+
+
+def test_projection_cadences() -> None:
+    """
+    Month ends are clamped, weekly items respect their start date
+    """
+    projection = project_recurring_items(
+        [
+            _recurring_item(id=1),
+            _recurring_item(
+                id=2,
+                billing_date="2024-01-03",
+                granularity="week",
+                quantity=2,
+                start_date="2024-02-01",
+            ),
+            _recurring_item(id=3, billing_date="2020-02-29", granularity="year"),
+            _recurring_item(
+                id=4,
+                billing_date="2024-01-01",
+                cadence="twice a month",
+                end_date="2024-02-10",
+            ),
+        ],
+        start_date=datetime.date(2024, 1, 1),
+        end_date=datetime.date(2024, 3, 31),
+    )
+    occurrences = projection.to_dict()
+    assert occurrences[1] == [
+        datetime.date(2024, 1, 31),
+        datetime.date(2024, 2, 29),
+        datetime.date(2024, 3, 31),
+    ]
+    assert occurrences[2] == [
+        datetime.date(2024, 2, 14),
+        datetime.date(2024, 2, 28),
+        datetime.date(2024, 3, 13),
+        datetime.date(2024, 3, 27),
+    ]
+    assert occurrences[3] == [datetime.date(2024, 2, 29)]
+    assert occurrences[4] == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 1, 16),
+        datetime.date(2024, 2, 1),
+    ]
+    assert projection.totals_by_month() == {
+        datetime.date(2024, 1, 1): 30.0,
+        datetime.date(2024, 2, 1): 50.0,
+        datetime.date(2024, 3, 1): 30.0,
+    }
@@ -0,0 +1,161 @@
+"""
+Run Tests on the Spending Aggregations
+"""
+
+import datetime
+import logging
+from typing import Iterable, List
+
+import pytest
+
+from lunchable.analytics import TransactionArrays, aggregate_spending
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models import TransactionObject
+from lunchable.models.tags import TagsObject
+from lunchable.plugins.app import LunchableData
+
+
+def test_aggregate_by_category_and_month(
+    test_transactions: List[TransactionObject],
+) -> None:
+    """
+    Spending is summed per category and month, normalized with to_base
+    """
+    test_transactions[1].category_id = test_transactions[2].category_id
+    test_transactions[2].to_base = 10.0
+    test_transactions[0].date = datetime.date(2021, 10, 3)
+    spending = aggregate_spending(test_transactions)
+    assert spending.to_records() == [
+        {
+            "category": 229140,
+            "period": datetime.date(2021, 9, 1),
+            "total": 12.0,
+            "count": 2,
+        },
+        {
+            "category": 658761,
+            "period": datetime.date(2021, 10, 1),
+            "total": 1.0,
+            "count": 1,
+        },
+    ]
+
+
+def test_aggregate_filters(test_transactions: List[TransactionObject]) -> None:
+    """
+    Income and excluded transactions are left out unless requested
+    """
+    test_transactions[0].is_income = True
+    test_transactions[1].exclude_from_totals = True
+    spending = aggregate_spending(test_transactions, by=[])
+    assert spending.total.tolist() == [3.0]
+    spending = aggregate_spending(
+        test_transactions, by=[], include_income=True, include_excluded=True
+    )
+    assert spending.total.tolist() == [6.0]
+    assert spending.count.tolist() == [3]
+
+
+def test_aggregate_by_tag_and_payee(
+    test_transactions: List[TransactionObject],
+) -> None:
+    """
+    Tagged transactions count once per tag, untagged transactions are kept
+    """
+    first_tag, second_tag = TagsObject(id=1, name="a"), TagsObject(id=2, name="b")
+    test_transactions[0].tags = [first_tag, second_tag]
+    test_transactions[1].tags = [second_tag]
+    spending = aggregate_spending(test_transactions, by=["tag", "payee"])
+    records = spending.to_records()
+    assert records == [
+        {"tag": None, "payee": "Test 3", "total": 3.0, "count": 1},
+        {"tag": 1, "payee": "Test 1", "total": 1.0, "count": 1},
+        {"tag": 2, "payee": "Test 1", "total": 1.0, "count": 1},
+        {"tag": 2, "payee": "Test 2", "total": 2.0, "count": 1},
+    ]
+
+
+def test_aggregate_weekly_by_asset(test_transactions: List[TransactionObject]) -> None:
+    """
+    Weeks start on Monday, assets fall back to the Plaid account
+    """
+    test_transactions[0].asset_id = None
+    test_transactions[0].plaid_account_id = 99
+    spending = aggregate_spending(
+        TransactionArrays.from_transactions(test_transactions),
+        by=["asset", "period"],
+        period="week",
+    )
+    records = spending.to_records()
+    assert [record["asset"] for record in records] == [99, 23043]
+    assert {record["period"] for record in records} == {datetime.date(2021, 9, 13)}
+
+
+def test_aggregate_lunchable_data(
+    test_transactions: List[TransactionObject], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Columns built from LunchableData are cached until transactions change
+    """
+    builds: List[int] = []
+    from_transactions = TransactionArrays.from_transactions
+
+    def counting(transactions: Iterable[TransactionObject]) -> TransactionArrays:
+        builds.append(1)
+        return from_transactions(transactions)
+
+    monkeypatch.setattr(TransactionArrays, "from_transactions", counting)
+    data = LunchableData()
+    data.transactions = {item.id: item for item in test_transactions}
+    aggregate_spending(data)
+    aggregate_spending(data, start_date=datetime.date(2021, 9, 20))
+    assert len(builds) == 1
+    version = data.version("transactions")
+    data.bump_version("transactions")
+    assert data.version("transactions") == version + 1
+    spending = aggregate_spending(data, by=["category_group"])
+    assert len(builds) == 2
+    assert spending.to_records() == [{"category_group": None, "total": 6.0, "count": 3}]
+    del data.transactions[test_transactions[0].id]
+    spending = aggregate_spending(data, by=[])
+    assert len(builds) == 3
+    assert spending.total.tolist() == [5.0]
+
+
+def test_aggregate_missing_to_base(
+    test_transactions: List[TransactionObject], caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Transactions without to_base are summed by amount, with a warning
+    """
+    test_transactions[0].to_base = 10.0
+    with caplog.at_level(logging.WARNING, logger="lunchable.analytics.spending"):
+        spending = aggregate_spending(test_transactions, by=[])
+    assert spending.total.tolist() == [15.0]
+    assert "2 of 3 transactions have no to_base" in caplog.text
+    caplog.clear()
+    for transaction in test_transactions:
+        transaction.to_base = transaction.amount
+    aggregate_spending(test_transactions, by=[])
+    assert caplog.text == ""
+
+
+def test_aggregate_invalid_dimension(
+    test_transactions: List[TransactionObject],
+) -> None:
+    """
+    Unknown dimensions raise a LunchMoneyError
+    """
+    with pytest.raises(LunchMoneyError):
+        aggregate_spending(test_transactions, by=["merchant"])
+
+
+def test_aggregate_skips_grouped(test_transactions: List[TransactionObject]) -> None:
+    """
+    Members of a transaction group are counted through the group itself
+    """
+    test_transactions[0].group_id = test_transactions[2].id
+    test_transactions[1].group_id = test_transactions[2].id
+    test_transactions[2].is_group = True
+    spending = aggregate_spending(test_transactions, by=[])
+    assert spending.total.tolist() == [3.0]
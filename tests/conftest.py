@@ -11,6 +11,7 @@ import pytest
 from vcr import VCR
 
 from lunchable import LunchMoney
+from lunchable._config import FileConfig
 from lunchable.models import TransactionObject
 
 obscure_start_date_object = datetime.datetime(year=2022, month=11, day=1)
@@ -35,6 +36,20 @@ def set_test_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
             monkeypatch.setenv(env_var, f"{env_var}_PLACEHOLDER")
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    """
+    Keep the lunchable Cache Directory out of the User's Home Directory
+
+    Returns
+    -------
+    pathlib.Path
+    """
+    path = tmp_path / "cache"
+    monkeypatch.setattr(FileConfig, "CACHE_DIR", path)
+    return path
+
+
 @pytest.fixture
 def obscure_start_date() -> datetime.datetime:
     """
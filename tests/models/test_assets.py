@@ -3,12 +3,15 @@ Run Tests on the Assets Endpoint
 """
 
 import datetime
+import json
 import logging
+from typing import List
 
+import httpx
 import pytest
 
 from lunchable import LunchMoney
-from lunchable.models.assets import AssetsObject
+from lunchable.models.assets import AssetsObject, BalanceUpdateStatus
 from tests.conftest import lunchable_cassette
 
 logger = logging.getLogger(__name__)
@@ -81,3 +84,45 @@ def test_create_asset(lunch_money_obj: LunchMoney):
     )
     assert isinstance(response, AssetsObject)
     logger.info(response)
+
+
+def test_update_asset_balances(
+    lunch_money_obj: LunchMoney, lunchmoney_asset: AssetsObject
+):
+    """
+    Update only the asset balances that changed, reporting failures per item
+    """
+    assets = [
+        lunchmoney_asset.model_dump(mode="json"),
+        {**lunchmoney_asset.model_dump(mode="json"), "id": 2, "balance": 10.0},
+        {**lunchmoney_asset.model_dump(mode="json"), "id": 3, "balance": 5.0},
+    ]
+    updated: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"assets": assets})
+        asset_id = int(request.url.path.split("/")[-1])
+        if asset_id == 3:
+            return httpx.Response(404, json={"error": "Asset not found"})
+        updated.append(asset_id)
+        body = json.loads(request.content)
+        asset = next(asset for asset in assets if asset["id"] == asset_id)
+        return httpx.Response(200, json={**asset, **body})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    results = lunch_money_obj.update_asset_balances(
+        {lunchmoney_asset.id: 12.345, 2: 10.001, 3: 6.0, 4: 1.0}, rate_limit=20
+    )
+    assert updated == [lunchmoney_asset.id]
+    assert [result.status for result in results] == [
+        BalanceUpdateStatus.updated,
+        BalanceUpdateStatus.unchanged,
+        BalanceUpdateStatus.failed,
+        BalanceUpdateStatus.failed,
+    ]
+    assert results[0].previous_balance == -1.0
+    assert results[0].asset is not None and results[0].asset.balance == 12.35
+    assert results[2].error is not None and results[3].error is not None
+    lunch_money_obj.update_asset_balances({lunchmoney_asset.id: 12.35})
+    assert updated == [lunchmoney_asset.id]
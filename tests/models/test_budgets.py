@@ -5,7 +5,10 @@ Run Tests on the Budgets Endpoint
 import datetime
 import logging
 
-from lunchable import LunchMoney
+import httpx
+import pytest
+
+from lunchable import LunchMoney, LunchMoneyError
 from lunchable.models import BudgetObject
 from tests.conftest import lunchable_cassette
 
@@ -56,3 +59,73 @@ def test_delete_budget(
     )
     logger.info("Budget Deleted")
     assert deleted is True
+
+
+def test_get_budgets_series(lunch_money_obj: LunchMoney) -> None:
+    """
+    Fetch budgets per month concurrently and merge them per category
+    """
+    requested_months = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_date = request.url.params["start_date"]
+        requested_months.append(start_date)
+        budget = {
+            "category_name": "Groceries",
+            "category_id": 1,
+            "is_income": False,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "data": {start_date: {"spending_to_base": 10, "num_transactions": 1}},
+        }
+        return httpx.Response(200, json=[budget])
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    start_date = datetime.date(2022, 11, 1)
+    end_date = datetime.date.today()
+    budgets = lunch_money_obj.get_budgets_series(
+        start_date=start_date, end_date=end_date, concurrency=8
+    )
+    assert len(budgets) == 1
+    assert next(iter(budgets[0].data)) == start_date
+    assert len(budgets[0].data) == len(requested_months)
+    assert sorted(requested_months) == [month.isoformat() for month in budgets[0].data]
+    requested_months.clear()
+    lunch_money_obj.get_budgets_series(start_date=start_date, end_date=end_date)
+    assert requested_months == [end_date.replace(day=1).isoformat()]
+
+
+def test_get_budgets_series_whole_months(lunch_money_obj: LunchMoney) -> None:
+    """
+    Budget series are fetched in whole months, shorter periods are rejected
+    """
+    requested_windows = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_windows.append(
+            (request.url.params["start_date"], request.url.params["end_date"])
+        )
+        return httpx.Response(200, json=[])
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    lunch_money_obj.get_budgets_series(
+        start_date=datetime.date(2022, 1, 15), end_date=datetime.date(2022, 3, 10)
+    )
+    assert sorted(requested_windows) == [
+        ("2022-01-01", "2022-01-31"),
+        ("2022-02-01", "2022-02-28"),
+        ("2022-03-01", "2022-03-31"),
+    ]
+    requested_windows.clear()
+    lunch_money_obj.get_budgets_series(
+        start_date=datetime.date(2021, 6, 15),
+        end_date=datetime.date(2021, 6, 20),
+        period="year",
+    )
+    assert requested_windows == [("2021-06-01", "2021-06-30")]
+    with pytest.raises(LunchMoneyError):
+        lunch_money_obj.get_budgets_series(
+            start_date=datetime.date(2022, 1, 1),
+            end_date=datetime.date(2022, 3, 31),
+            period="week",
+        )
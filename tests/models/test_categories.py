@@ -3,13 +3,19 @@ Run Tests on the Categories Endpoint
 """
 
 import logging
+import pathlib
+
+import pytest
 
 from lunchable import LunchMoney
-from lunchable.models.categories import CategoriesObject
+from lunchable.exceptions import LunchMoneyError
+from lunchable.models.categories import CategoriesObject, CategoryTree
 from tests.conftest import lunchable_cassette
 
 logger = logging.getLogger(__name__)
 
+_here = pathlib.Path(__file__).parent
+
 
 @lunchable_cassette
 def test_get_categories(lunch_money_obj: LunchMoney):
@@ -128,3 +134,30 @@ def test_get_categories_flattened(lunch_money_obj: LunchMoney):
     assert len(categories) >= 1
     for category in categories:
         assert isinstance(category, CategoriesObject)
+
+
+def test_category_tree(lunch_money_obj: LunchMoney):
+    """
+    Index Categories and Derive the Nested Format Locally
+    """
+    with lunchable_cassette(str(_here / "test_get_categories_flattened")):
+        tree = lunch_money_obj.get_category_tree()
+    with lunchable_cassette(str(_here / "test_get_categories_nested")):
+        nested = lunch_money_obj.get_categories(format="nested")
+    assert isinstance(tree, CategoryTree)
+    assert len(tree) == 10
+    assert tree.get_category(658761).group_id == 658694
+    group = tree.get_group(658761)
+    assert group is not None and group.id == 658694
+    assert tree.get_group(658694) is None
+    assert {child.id for child in tree.get_children(658694)} == {658761, 443128}
+    assert [item.id for item in tree.ancestors(443128)] == [658694]
+    assert [item.id for item in tree.descendants(658694)] == [
+        item.id for item in tree.get_children(658694)
+    ]
+    assert tree.get_id(tree.get_category(443126).name) == 443126
+    with pytest.raises(LunchMoneyError):
+        tree.get_id("Not A Real Category")
+    assert [item.model_dump() for item in tree.nested()] == [
+        item.model_dump() for item in nested
+    ]
@@ -0,0 +1,37 @@
+"""
+Run Tests on the Core API Client
+"""
+
+import time
+
+import pytest
+
+from lunchable import LunchMoney
+from lunchable._config import APIConfig
+
+
+def test_map_concurrently_rate_limit(lunch_money_obj: LunchMoney):
+    """
+    Results keep their order and calls are spaced out by the rate limit
+    """
+    started = time.monotonic()
+    results = lunch_money_obj._map_concurrently(
+        lambda item: item * 2, range(5), concurrency=4, rate_limit=50
+    )
+    assert results == [0, 2, 4, 6, 8]
+    assert time.monotonic() - started >= 0.08
+
+
+def test_base_url(monkeypatch: pytest.MonkeyPatch):
+    """
+    Requests go to the base URL passed in, then the environment, then the API
+    """
+    monkeypatch.delenv("LUNCHMONEY_BASE_URL", raising=False)
+    assert LunchMoney(access_token="xxx").base_url == "https://dev.lunchmoney.app"
+    monkeypatch.setenv("LUNCHMONEY_BASE_URL", "http://127.0.0.1:8000/api/")
+    lunch = LunchMoney(access_token="xxx")
+    assert APIConfig.make_url(["transactions", 1], base_url=lunch.base_url) == (
+        "http://127.0.0.1:8000/api/v1/transactions/1"
+    )
+    lunch = LunchMoney(access_token="xxx", base_url="http://localhost:9000")
+    assert lunch.base_url == "http://localhost:9000"
@@ -2,9 +2,14 @@
 Run Tests on the Crypto Endpoint
 """
 
+import json
 import logging
+from typing import Any, Dict, List
+
+import httpx
 
 from lunchable import LunchMoney
+from lunchable.models.assets import BalanceUpdateStatus
 from lunchable.models.crypto import CryptoObject
 from tests.conftest import lunchable_cassette
 
@@ -31,3 +36,38 @@ def test_update_crypto(lunch_money_obj: LunchMoney):
     crypto = lunch_money_obj.update_crypto(crypto_id=7286, balance=0.50)
     assert isinstance(crypto, CryptoObject)
     logger.info("Crypto Asset Updated: %s", crypto.id)
+
+
+def test_update_crypto_balances(lunch_money_obj: LunchMoney):
+    """
+    Update only the manual crypto balances that changed
+    """
+    crypto: List[Dict[str, Any]] = [
+        {
+            "id": crypto_id,
+            "source": source,
+            "name": "Bitcoin",
+            "balance": 1.5,
+            "currency": "btc",
+            "created_at": "2021-01-01T00:00:00.000Z",
+        }
+        for crypto_id, source in [(1, "manual"), (2, "manual"), (3, "synced")]
+    ]
+    updated: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(200, json={"crypto": crypto})
+        crypto_id = int(request.url.path.split("/")[-1])
+        updated.append(crypto_id)
+        return httpx.Response(200, json={**crypto[0], **json.loads(request.content)})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    results = lunch_money_obj.update_crypto_balances({1: 2.0, 2: 1.5, 3: 4.0})
+    assert updated == [1]
+    assert [result.status for result in results] == [
+        BalanceUpdateStatus.updated,
+        BalanceUpdateStatus.unchanged,
+        BalanceUpdateStatus.failed,
+    ]
+    assert results[0].crypto is not None and results[0].crypto.balance == 2.0
@@ -2,9 +2,17 @@
 Run Tests on the Plaid Accounts Endpoint
 """
 
+import asyncio
+import datetime
+import json
 import logging
+from typing import Any, Dict, List
+
+import httpx
+import pytest
 
 from lunchable import LunchMoney
+from lunchable.exceptions import LunchMoneyTimeoutError
 from lunchable.models.plaid_accounts import PlaidAccountObject
 from tests.conftest import lunchable_cassette
 
@@ -30,3 +38,91 @@ def test_trigger_fetch_from_plaid(lunch_money_obj: LunchMoney):
     """
     plaid_fetch_request = lunch_money_obj.trigger_fetch_from_plaid()
     assert plaid_fetch_request is True
+
+
+def _plaid_account(account_id: int, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Minimal Plaid account response
+    """
+    return {
+        "id": account_id,
+        "date_linked": "2020-01-28",
+        "name": f"Account {account_id}",
+        "type": "depository",
+        "subtype": "checking",
+        "institution_name": "Bank",
+        "status": "active",
+        "currency": "usd",
+        "balance_last_update": "2024-01-01T00:00:00.000Z",
+        "plaid_last_successful_update": "2024-01-01T00:00:00.000Z",
+        "last_fetch": "2024-01-01T00:00:00.000Z",
+        **kwargs,
+    }
+
+
+class _PlaidServer:
+    """
+    Fake Plaid endpoints where a fetch lands after a few polls
+    """
+
+    def __init__(self, polls_until_done: int = 2) -> None:
+        self.accounts = [_plaid_account(1), _plaid_account(2, status="inactive")]
+        self.polls_until_done = polls_until_done
+        self.triggers: List[Dict[str, Any]] = []
+        self.polls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/fetch"):
+            self.triggers.append(json.loads(request.content or b"{}"))
+            return httpx.Response(200, json=True)
+        if self.triggers:
+            self.polls += 1
+            if self.polls >= self.polls_until_done:
+                self.accounts[0][
+                    "plaid_last_successful_update"
+                ] = datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
+        return httpx.Response(200, json={"plaid_accounts": self.accounts})
+
+
+def test_fetch_from_plaid_and_wait(lunch_money_obj: LunchMoney):
+    """
+    Trigger a Plaid fetch and poll until it lands
+    """
+    server = _PlaidServer()
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(server))
+    accounts = lunch_money_obj.fetch_from_plaid_and_wait(
+        plaid_account_ids=[1, 2], poll_interval=0.01
+    )
+    assert server.triggers == [{"plaid_account_id": 1}]
+    assert server.polls == 2
+    assert [account.id for account in accounts] == [1, 2]
+    assert accounts[0].plaid_last_successful_update > accounts[1].last_fetch
+    lunch_money_obj.fetch_from_plaid_and_wait(poll_interval=0.01)
+    assert len(server.triggers) == 1
+
+
+def test_fetch_from_plaid_and_wait_timeout(lunch_money_obj: LunchMoney):
+    """
+    Give up on a Plaid fetch that never lands
+    """
+    server = _PlaidServer(polls_until_done=1_000)
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(server))
+    with pytest.raises(LunchMoneyTimeoutError):
+        lunch_money_obj.fetch_from_plaid_and_wait(timeout=0.05, poll_interval=0.01)
+
+
+def test_afetch_from_plaid_and_wait(lunch_money_obj: LunchMoney):
+    """
+    Trigger a Plaid fetch and poll until it lands, asynchronously
+    """
+    server = _PlaidServer()
+    lunch_money_obj.async_session = httpx.AsyncClient(
+        transport=httpx.MockTransport(server)
+    )
+    accounts = asyncio.run(
+        lunch_money_obj.afetch_from_plaid_and_wait(
+            plaid_account_ids=[1], poll_interval=0.01
+        )
+    )
+    assert server.triggers == [{"plaid_account_id": 1}]
+    assert [account.id for account in accounts] == [1]
@@ -5,6 +5,8 @@ Run Tests on the Recurring Items Endpoint
 import datetime
 import logging
 
+import httpx
+
 from lunchable import LunchMoney
 from lunchable.models.recurring_items import RecurringItemsObject
 from tests.conftest import lunchable_cassette
@@ -26,3 +28,27 @@ def test_get_recurring_items(
     for recurring_expense in recurring_expenses:
         assert isinstance(recurring_expense, RecurringItemsObject)
     logger.info("%s Recurring Expenses returned", len(recurring_expenses))
+
+
+def test_get_recurring_items_series(lunch_money_obj: LunchMoney) -> None:
+    """
+    Fetch many months concurrently, caching the months that have passed
+    """
+    requested_months = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_months.append(request.url.params["start_date"])
+        return httpx.Response(200, json=[])
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    next_year = datetime.date.today().year + 1
+    start_date, end_date = datetime.date(2022, 11, 1), datetime.date(next_year, 1, 1)
+    series = lunch_money_obj.get_recurring_items_series(
+        start_date=start_date, end_date=end_date
+    )
+    assert next(iter(series)) == start_date
+    assert list(series)[-1] == end_date
+    assert len(requested_months) == len(series)
+    requested_months.clear()
+    lunch_money_obj.get_recurring_items_series(start_date=start_date, end_date=end_date)
+    assert min(requested_months) == datetime.date.today().replace(day=1).isoformat()
@@ -3,8 +3,12 @@ Run Tests on the Tags Endpoint
 """
 
 import logging
+from typing import List
 
-from lunchable import LunchMoney
+import httpx
+import pytest
+
+from lunchable import LunchMoney, LunchMoneyError
 from lunchable.models.tags import TagsObject
 from tests.conftest import lunchable_cassette
 
@@ -21,3 +25,47 @@ def test_get_tags(lunch_money_obj: LunchMoney):
     for tag in tags:
         assert isinstance(tag, TagsObject)
     logger.info("%s Plaid Accounts returned", len(tags))
+
+
+def test_tag_resolver(lunch_money_obj: LunchMoney):
+    """
+    Resolve Tag Names and IDs, Refetching Only on a Cache Miss
+    """
+    tags = [{"id": 1, "name": "Vacation"}, {"id": 2, "name": "Reimbursable"}]
+    requests: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/tags"):
+            return httpx.Response(200, json=tags)
+        return httpx.Response(200, json={"transactions": []})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    resolver = lunch_money_obj.tag_resolver
+    assert resolver.get_ids([5]) == [5]
+    assert requests == []
+    assert resolver.get_ids(["Vacation", 2]) == [1, 2]
+    assert resolver.get_names([2, "Vacation"]) == ["Reimbursable", "Vacation"]
+    assert len(requests) == 1
+    lunch_money_obj.get_transactions(tag_id="Reimbursable", limit=10)
+    assert requests[-1].endswith("/transactions")
+    assert len(requests) == 2
+    tags.append({"id": 3, "name": "New Tag"})
+    assert resolver.get_id("New Tag") == 3
+    assert len(requests) == 3
+    with pytest.raises(LunchMoneyError):
+        resolver.get_names([4])
+    assert len(requests) == 4
+    assert resolver.get_ids(["123", "Vacation"]) == [123, 1]
+    assert resolver.get_names(["2", "Vacation"]) == ["Reimbursable", "Vacation"]
+    assert len(requests) == 4
+    tags.append({"id": 4, "name": "2024"})
+    assert resolver.get_id("2024") == 2024
+    assert len(requests) == 4
+    resolver.refresh()
+    assert resolver.get_id("2024") == 4
+    assert resolver.get_names(["2024", 4]) == ["2024", "2024"]
+    with pytest.raises(LunchMoneyError):
+        resolver.get_names(["99"])
+    with pytest.raises(LunchMoneyError):
+        resolver.get_ids(["Unknown"])
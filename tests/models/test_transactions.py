@@ -2,18 +2,27 @@
 Run Tests on the Transactions Endpoint
 """
 
+import copy
 import datetime
+import json
 import logging
 from time import sleep
-from typing import List
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from pydantic import ValidationError
 
 from lunchable import LunchMoney
+from lunchable.models.tags import TagsObject
 from lunchable.models.transactions import (
     TransactionChildObject,
     TransactionInsertObject,
     TransactionObject,
     TransactionSplitObject,
     TransactionUpdateObject,
+    _TransactionInsertParamsPost,
+    _TransactionUpdateParamsPut,
 )
 from tests.conftest import lunchable_cassette
 
@@ -183,3 +192,217 @@ def test_get_transactions_no_paginate(lunch_money_obj: LunchMoney) -> None:
     assert len(transactions) >= 1
     for transaction in transactions:
         assert isinstance(transaction, TransactionObject)
+
+
+def test_transaction_changed_fields(test_transactions: List[TransactionObject]) -> None:
+    """
+    Track changes to a fetched transaction
+    """
+    transaction = test_transactions[0]
+    assert not transaction.tracks_changes
+    transaction.clear_changes()
+    assert transaction.tracks_changes
+    assert transaction.changed_fields == {}
+    transaction.notes = "Updated Notes"
+    transaction.payee = "Test 1"
+    transaction.tags = [TagsObject(id=1, name="Vacation")]
+    assert transaction.changed_fields == {
+        "notes": "Updated Notes",
+        "tags": [TagsObject(id=1, name="Vacation")],
+    }
+    update_object = transaction.get_update_object(changed_only=True)
+    assert update_object.model_dump(exclude_unset=True) == {
+        "notes": "Updated Notes",
+        "tags": ["Vacation"],
+    }
+    transaction.notes = "Test Transaction 1"
+    assert list(transaction.changed_fields) == ["tags"]
+    transaction.clear_changes()
+    assert transaction.changed_fields == {}
+
+
+def test_update_transactions_changed_only(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Send only changed fields and skip unchanged transactions
+    """
+    payloads: Dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads[request.url.path.split("/")[-1]] = json.loads(request.content)
+        return httpx.Response(200, json={"updated": True})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    for transaction in test_transactions:
+        transaction.clear_changes()
+    test_transactions[0].payee = "New Payee"
+    test_transactions[2].category_id = 1234
+    responses = lunch_money_obj.update_transactions(test_transactions)
+    assert responses == {
+        test_transactions[0].id: {"updated": True},
+        test_transactions[1].id: {"updated": False},
+        test_transactions[2].id: {"updated": True},
+    }
+    assert payloads == {
+        str(test_transactions[0].id): {"transaction": {"payee": "New Payee"}},
+        str(test_transactions[2].id): {"transaction": {"category_id": 1234}},
+    }
+    assert test_transactions[0].changed_fields == {}
+    payloads.clear()
+    response = lunch_money_obj.update_transaction(
+        transaction_id=test_transactions[0].id, transaction=test_transactions[0]
+    )
+    assert response == {"updated": False}
+    assert payloads == {}
+
+
+def test_update_transaction_without_baseline(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Transactions without a fetched baseline are sent in full, and copies
+    don't share their change tracking
+    """
+    payloads: List[Dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(
+                200, json=test_transactions[0].model_dump(mode="json")
+            )
+        payloads.append(json.loads(request.content)["transaction"])
+        return httpx.Response(200, json={"updated": True})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    built = test_transactions[1]
+    response = lunch_money_obj.update_transaction(
+        transaction_id=built.id, transaction=built
+    )
+    assert response == {"updated": True}
+    assert payloads[-1]["notes"] == built.notes
+    assert payloads[-1]["payee"] == built.payee
+
+    fetched = lunch_money_obj.get_transaction(transaction_id=test_transactions[0].id)
+    assert fetched.tracks_changes
+    fetched.notes = "Fetched Notes"
+    copied = fetched.model_copy(update={"payee": "Copied Payee"})
+    assert copied.tracks_changes
+    assert copied.changed_fields == {"notes": "Fetched Notes", "payee": "Copied Payee"}
+    copied.category_id = 1234
+    assert "category_id" not in fetched.changed_fields
+    lunch_money_obj.update_transaction(transaction_id=copied.id, transaction=copied)
+    assert payloads[-1] == {
+        "notes": "Fetched Notes",
+        "payee": "Copied Payee",
+        "category_id": 1234,
+    }
+    assert fetched.changed_fields == {"notes": "Fetched Notes"}
+    assert copy.copy(fetched)._original is not fetched._original
+
+
+def test_update_transaction_in_place_changes(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Fields changed in place on a fetched transaction are sent
+    """
+    payloads: List[Dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            fetched = test_transactions[0].model_dump(mode="json")
+            return httpx.Response(200, json={**fetched, "tags": []})
+        payloads.append(json.loads(request.content)["transaction"])
+        return httpx.Response(200, json={"updated": True})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    fetched = lunch_money_obj.get_transaction(transaction_id=test_transactions[0].id)
+    assert fetched.tags == []
+    fetched.tags.append(TagsObject(id=1, name="Vacation"))
+    assert list(fetched.changed_fields) == ["tags"]
+    response = lunch_money_obj.update_transaction(
+        transaction_id=fetched.id, transaction=fetched
+    )
+    assert response == {"updated": True}
+    assert payloads == [{"tags": ["Vacation"]}]
+    assert fetched.changed_fields == {}
+    fetched.tags.append(TagsObject(id=2, name="Work"))
+    lunch_money_obj.update_transaction(transaction_id=fetched.id, transaction=fetched)
+    assert payloads[-1] == {"tags": ["Vacation", "Work"]}
+
+
+def test_transaction_payload_lengths(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Length limits are enforced before anything is sent
+    """
+    requests: List[httpx.Request] = []
+    lunch_money_obj.session = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200, json={})
+        )
+    )
+    transaction = test_transactions[0]
+    transaction.notes = "x" * 400
+    with pytest.raises(ValidationError):
+        transaction.get_update_object()
+    with pytest.raises(ValidationError):
+        transaction.get_insert_object()
+    with pytest.raises(ValidationError):
+        lunch_money_obj.update_transaction(
+            transaction_id=transaction.id, transaction=transaction
+        )
+    with pytest.raises(ValidationError):
+        lunch_money_obj.insert_transactions(transactions=[transaction])
+    assert requests == []
+    transaction.notes = "x" * 350
+    assert transaction.get_update_object().notes == transaction.notes
+
+
+def test_transaction_payloads(test_transactions: List[TransactionObject]) -> None:
+    """
+    Serialize transactions straight to insert and update request bodies
+    """
+    transaction = test_transactions[0]
+    transaction.status = "recurring"
+    transaction.tags = [TagsObject(id=1, name="Vacation")]
+    insert_body = json.loads(
+        _TransactionInsertParamsPost.dump_payload(
+            transactions=[transaction, transaction.get_insert_object()],
+            apply_rules=True,
+            skip_duplicates=None,
+        )
+    )
+    expected = {
+        "date": "2021-09-19",
+        "amount": 1.0,
+        "category_id": 658761,
+        "payee": "Test 1",
+        "currency": "usd",
+        "asset_id": 49335,
+        "notes": "Test Transaction 1",
+        "tags": ["Vacation"],
+    }
+    assert insert_body == {"transactions": [expected, expected], "apply_rules": True}
+    update_body = json.loads(
+        _TransactionUpdateParamsPut.dump_payload(
+            transaction=transaction._update_payload(),
+            debit_as_negative=True,
+        )
+    )
+    assert update_body == {
+        "transaction": {
+            **expected,
+            "recurring_id": None,
+            "status": None,
+            "external_id": None,
+        },
+        "debit_as_negative": True,
+    }
+    update_object = transaction.get_update_object()
+    assert update_object.model_dump(exclude_unset=True) == {
+        **update_body["transaction"],
+        "date": datetime.date(2021, 9, 19),
+    }
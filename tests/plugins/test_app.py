@@ -0,0 +1,85 @@
+"""
+Run Tests on the LunchableApp
+"""
+
+from typing import List
+
+import pytest
+
+from lunchable.models import TransactionObject
+from lunchable.plugins.app import LunchableData
+
+
+def test_cached_views(test_transactions: List[TransactionObject]) -> None:
+    """
+    Derived views are cached until their underlying data changes
+    """
+    data = LunchableData()
+    data.transactions = {item.id: item for item in test_transactions[:2]}
+    first_list = data.transactions_list
+    assert first_list is data.transactions_list
+    assert len(first_list) == 2
+    data.transactions[test_transactions[2].id] = test_transactions[2]
+    data.bump_version("transactions")
+    assert data.transactions_list is not first_list
+    assert len(data.transactions_list) == 3
+
+
+def test_cached_views_reassignment() -> None:
+    """
+    Reassigning a field invalidates the views derived from it
+    """
+    data = LunchableData()
+    asset_map = data.asset_map
+    assert asset_map is data.asset_map
+    tags_list = data.tags_list
+    data.plaid_accounts = {}
+    assert data.asset_map is not asset_map
+    assert data.tags_list is tags_list
+    assert data.version("plaid_accounts") == 1
+
+
+def test_cached_views_in_place(test_transactions: List[TransactionObject]) -> None:
+    """
+    Adding or removing items in place invalidates the views derived from them
+    """
+    data = LunchableData()
+    data.transactions = {item.id: item for item in test_transactions[:2]}
+    assert len(data.transactions_list) == 2
+    data.transactions[test_transactions[2].id] = test_transactions[2]
+    assert len(data.transactions_list) == 3
+    del data.transactions[test_transactions[0].id]
+    assert [item.id for item in data.transactions_list] == [
+        item.id for item in test_transactions[1:]
+    ]
+
+
+def test_cached_views_replaced_item(
+    test_transactions: List[TransactionObject],
+) -> None:
+    """
+    Replacing an item in place, keeping the size, invalidates the views
+    """
+    data = LunchableData()
+    data.transactions = {item.id: item for item in test_transactions}
+    first_list = data.transactions_list
+    replacement = test_transactions[0].model_copy(update={"payee": "Replaced"})
+    data.transactions[replacement.id] = replacement
+    assert data.transactions_list is not first_list
+    assert data.transactions_list[0].payee == "Replaced"
+
+
+def test_cached_views_read_only(test_transactions: List[TransactionObject]) -> None:
+    """
+    The shared views can't be mutated by callers
+    """
+    data = LunchableData()
+    data.transactions = {item.id: item for item in test_transactions}
+    assert isinstance(data.transactions_list, tuple)
+    with pytest.raises(TypeError):
+        data.asset_map[1] = test_transactions[0]
+    ordered = sorted(data.transactions_list, key=lambda item: -item.id)
+    assert ordered != list(data.transactions_list)
+    assert [item.id for item in data.transactions_list] == [
+        item.id for item in test_transactions
+    ]
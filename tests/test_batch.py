@@ -0,0 +1,52 @@
+"""
+Run Tests on Batch HTTP Requests
+"""
+
+import json
+import time
+
+import httpx
+
+from lunchable import LunchMoney
+from lunchable._batch import run_batch
+
+
+def test_run_batch(lunch_money_obj: LunchMoney) -> None:
+    """
+    Results stream in input order with their status, errors don't stop the batch
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/slow":
+            time.sleep(0.05)
+        if request.url.path == "/v1/missing":
+            return httpx.Response(404, json={"error": "Not Found"})
+        body = json.loads(request.content) if request.content else None
+        return httpx.Response(
+            200, json={"method": request.method, "path": request.url.path, "body": body}
+        )
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    lines = [
+        "# comment",
+        "GET /v1/slow",
+        "",
+        'PUT v1/transactions/1 {"transaction": {"notes": "hi"}}',
+        "GET /v1/missing",
+        "NOT-A-REQUEST",
+        '{"method": "post", "url": "https://dev.lunchmoney.app/v1/tags", "body": {"a": 1}}',
+    ]
+    results = list(run_batch(lunch=lunch_money_obj, lines=lines, concurrency=3))
+    assert [result.line for result in results] == [2, 4, 5, 6, 7]
+    assert [result.status for result in results] == [200, 200, 404, None, 200]
+    assert [result.ok for result in results] == [True, True, False, False, True]
+    assert results[0].elapsed_ms >= 50
+    assert results[1].url == "https://dev.lunchmoney.app/v1/transactions/1"
+    assert results[1].response == {
+        "method": "PUT",
+        "path": "/v1/transactions/1",
+        "body": {"transaction": {"notes": "hi"}},
+    }
+    assert "line 6" in results[3].error
+    assert results[4].response["body"] == {"a": 1}
+    assert results[4].method == "POST"
@@ -0,0 +1,55 @@
+"""
+Run Tests on API Benchmarks
+"""
+
+import datetime
+from typing import List
+
+import httpx
+
+from lunchable import LunchMoney
+from lunchable._bench import BenchScenario, LunchableBenchmark
+from lunchable.models.transactions import TransactionObject
+
+
+def test_benchmark(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Every scenario reports its requests, bytes and latency split
+    """
+    transaction = test_transactions[0].model_dump(mode="json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/transactions":
+            offset = int(request.url.params.get("offset", 0))
+            return httpx.Response(
+                200,
+                json={"transactions": [transaction], "has_more": offset < 2},
+            )
+        elif request.url.path == "/v1/broken":
+            return httpx.Response(500, text="Server Error")
+        return httpx.Response(200, json={"user_id": 1})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    benchmark = LunchableBenchmark(
+        lunch=lunch_money_obj,
+        iterations=4,
+        concurrency=2,
+        start_date=datetime.date(2024, 1, 1),
+        end_date=datetime.date(2024, 1, 31),
+    )
+    report = benchmark.run(scenarios=list(BenchScenario))
+    get, transactions, fanout = report.scenarios
+    assert report.base_url == lunch_money_obj.base_url
+    assert [get.requests, transactions.requests, fanout.requests] == [4, 12, 4]
+    assert fanout.concurrency == 2
+    assert get.errors == 0
+    assert get.bytes_received == 4 * len(b'{"user_id":1}')
+    assert get.latency_ms.p50 <= get.latency_ms.p95 <= get.latency_ms.p99
+    assert get.server_ms + get.client_ms > 0
+    assert lunch_money_obj.session.event_hooks == {"request": [], "response": []}
+    broken = LunchableBenchmark(lunch=lunch_money_obj, iterations=2, path="broken")
+    (result,) = broken.run(scenarios=["get"]).scenarios
+    assert result.errors == 2
+    assert result.latency_ms is None
@@ -0,0 +1,85 @@
+"""
+Benchmark Suite Tests
+"""
+
+import json
+import pathlib
+
+from click.testing import CliRunner
+
+from benchmarks.__main__ import cli
+from benchmarks.models import model_cases, run_models
+from benchmarks.suite import compare_results, default_suite, run_suite
+from benchmarks.synthetic import _encoded_transactions, transaction
+
+
+def test_encoded_transactions() -> None:
+    """
+    Served transactions match the generated ones
+    """
+    assert json.loads(_encoded_transactions(995, 1005)) == [
+        transaction(index) for index in range(995, 1005)
+    ]
+
+
+def test_run_suite() -> None:
+    """
+    Every benchmark runs against the synthetic API
+    """
+    results = run_suite(benchmarks=default_suite(sizes=[1500]), rounds=1)
+    benchmarks = results["benchmarks"]
+    assert set(benchmarks) == {
+        "get_transactions[1500]",
+        "insert_transactions[10000]",
+        "refresh_data",
+        "write_transactions[json][10000]",
+        "write_transactions[ndjson][10000]",
+        "write_transactions[csv][10000]",
+    }
+    assert benchmarks["get_transactions[1500]"]["requests"] == 2
+    assert benchmarks["insert_transactions[10000]"]["requests"] == 20
+    assert benchmarks["refresh_data"]["requests"] == 6
+    json.dumps(results)
+
+
+def test_run_models() -> None:
+    """
+    Every model case validates, and its timings and allocations are recorded
+    """
+    cases = model_cases()
+    results = run_models(cases=cases, min_time=0.0001, repeat=1, calls=2)
+    assert len(results) == len(cases) * 3
+    full = results["TransactionObject[full].validate"]
+    plain = results["TransactionObject[plain].validate"]
+    assert full["seconds"] > 0
+    assert full["retained_bytes"] > plain["retained_bytes"]
+
+
+def test_compare(tmp_path: pathlib.Path) -> None:
+    """
+    Compare fails on regressions past the threshold
+    """
+    baseline = {"benchmarks": {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}}
+    current = {
+        "benchmarks": {
+            "a": {"seconds": 1.05},
+            "b": {"seconds": 1.5},
+            "c": {"seconds": 1.0},
+        }
+    }
+    comparisons = compare_results(baseline=baseline, current=current, threshold=0.1)
+    assert [(item.name, item.regressed) for item in comparisons] == [
+        ("a", False),
+        ("b", True),
+    ]
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+    baseline_path.write_text(json.dumps(baseline))
+    current_path.write_text(json.dumps(current))
+    runner = CliRunner()
+    result = runner.invoke(cli, ["compare", str(baseline_path), str(current_path)])
+    assert result.exit_code == 1
+    result = runner.invoke(
+        cli, ["compare", str(baseline_path), str(current_path), "--threshold", "0.6"]
+    )
+    assert result.exit_code == 0
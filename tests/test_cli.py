@@ -2,9 +2,21 @@
 Test cases for the __main__ module.
 """
 
+import csv
+import functools
+import io
+import json
+import pathlib
+from typing import List
+
+import httpx
 import pytest
 from click.testing import CliRunner
 
+from tests.conftest import lunchable_cassette
+
+_models_dir = pathlib.Path(__file__).parent / "models"
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -36,3 +48,139 @@ def test_registered_plugins(runner: CliRunner) -> None:
     for plugin in builtin_plugins:
         result = runner.invoke(cli, ["plugins", plugin, "--help"])
         assert result.exit_code == 0
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_transactions_get_formats(runner: CliRunner, output_format: str) -> None:
+    """
+    Stream transactions as JSON, NDJSON or CSV with a subset of fields
+    """
+    from lunchable._cli import cli
+
+    with lunchable_cassette(str(_models_dir / "test_get_transactions")):
+        result = runner.invoke(
+            cli,
+            [
+                "transactions",
+                "get",
+                "--format",
+                output_format,
+                "--fields",
+                "id,payee,amount,tags",
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    if output_format == "json":
+        rows = json.loads(result.output)
+    elif output_format == "ndjson":
+        rows = [json.loads(line) for line in result.output.splitlines()]
+    else:
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+    assert len(rows) >= 1
+    assert list(rows[0]) == ["id", "payee", "amount", "tags"]
+
+
+def test_transactions_get_unknown_fields(runner: CliRunner) -> None:
+    """
+    Unknown --fields are rejected before any request is made
+    """
+    from lunchable._cli import cli
+
+    result = runner.invoke(cli, ["transactions", "get", "--fields", "id,nope"])
+    assert result.exit_code == 2
+    assert "nope" in result.output
+
+
+def test_transactions_get_tag_id(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    --tag-id is sent as an ID without looking up tag names
+    """
+    from lunchable import LunchMoney
+    from lunchable._cli import cli
+
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"transactions": [], "has_more": False})
+
+    monkeypatch.setattr(
+        "lunchable._cli.LunchMoney",
+        functools.partial(LunchMoney, transport=httpx.MockTransport(handler)),
+    )
+    result = runner.invoke(
+        cli, ["transactions", "get", "--tag-id", "123", "--format", "ndjson"]
+    )
+    assert result.exit_code == 0, result.output
+    assert [request.url.path for request in requests] == ["/v1/transactions"]
+    assert requests[0].url.params["tag_id"] == "123"
+
+
+def test_profile(runner: CliRunner, tmp_path: pathlib.Path) -> None:
+    """
+    --profile prints a time breakdown and --profile-output dumps the stats
+    """
+    import pstats
+
+    from lunchable._cli import cli
+
+    output = tmp_path / "transactions.pstats"
+    with lunchable_cassette(str(_models_dir / "test_get_transactions")):
+        result = runner.invoke(
+            cli,
+            ["--profile-output", str(output), "transactions", "get"],
+        )
+    assert result.exit_code == 0, result.output
+    for phase in ["Network wait", "JSON decode", "Model validation", "Output"]:
+        assert phase in result.output
+    assert pstats.Stats(str(output)).total_calls > 0
+
+
+def test_profile_startup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Startup is the wall time since the package started importing
+    """
+    import time
+
+    from lunchable import _startup
+    from lunchable._profile import CLIProfiler
+
+    monkeypatch.setattr(_startup, "STARTED", time.perf_counter() - 5)
+    profiler = CLIProfiler()
+    profiler.start()
+    profiler.stop()
+    assert 5 <= profiler.breakdown()["Startup / imports"] < 6
+
+
+@pytest.mark.parametrize("output_format", ["json", "csv"])
+def test_profile_streaming_output(
+    runner: CliRunner, tmp_path: pathlib.Path, output_format: str
+) -> None:
+    """
+    Streamed output counts towards the rendering phase
+    """
+    import pstats
+
+    from lunchable._cli import cli
+    from lunchable._profile import _CATEGORIES, _cumulative_time
+
+    output = tmp_path / "transactions.pstats"
+    with lunchable_cassette(str(_models_dir / "test_get_transactions")):
+        result = runner.invoke(
+            cli,
+            [
+                "--profile-output",
+                str(output),
+                "transactions",
+                "get",
+                "--format",
+                output_format,
+            ],
+        )
+    assert result.exit_code == 0, result.output
+    rendering = _cumulative_time(
+        stats=pstats.Stats(str(output)), functions=_CATEGORIES["Output rendering"]
+    )
+    assert rendering > 0
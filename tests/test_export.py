@@ -0,0 +1,135 @@
+"""
+Run Tests on Resumable Transaction Exports
+"""
+
+import datetime
+import json
+import pathlib
+from typing import Dict, List
+
+import httpx
+
+from lunchable import LunchMoney
+from lunchable._export import TransactionExporter, WindowStatus, _filters_key
+from lunchable.models.transactions import TransactionObject
+
+
+def test_export_resumes(
+    lunch_money_obj: LunchMoney,
+    test_transactions: List[TransactionObject],
+    tmp_path: pathlib.Path,
+) -> None:
+    """
+    Export month by month, then only refetch the month that failed
+    """
+    requested: List[str] = []
+    failing = {"2021-10-01"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_date = request.url.params["start_date"]
+        requested.append(start_date)
+        if start_date in failing:
+            return httpx.Response(500, text="Server Error")
+        transactions = [
+            {**transaction.model_dump(mode="json"), "date": start_date}
+            for transaction in test_transactions
+        ]
+        return httpx.Response(200, json={"transactions": transactions})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    exporter = TransactionExporter(lunch=lunch_money_obj, output_dir=tmp_path)
+    windows = exporter.export(
+        start_date=datetime.date(2021, 9, 15), end_date=datetime.date(2021, 11, 30)
+    )
+    assert sorted(requested) == ["2021-09-15", "2021-10-01", "2021-11-01"]
+    assert [window.status for window in windows] == [
+        WindowStatus.complete,
+        WindowStatus.failed,
+        WindowStatus.complete,
+    ]
+    lines = (tmp_path / "month=2021-09" / "transactions.jsonl").read_text()
+    assert [json.loads(line)["id"] for line in lines.splitlines()] == [
+        transaction.id for transaction in test_transactions
+    ]
+    assert not (tmp_path / "month=2021-10").exists()
+    checkpoint = exporter.load_checkpoint()
+    assert checkpoint["month=2021-10/all"].status == WindowStatus.failed
+    requested.clear()
+    failing.clear()
+    windows = exporter.export(
+        start_date=datetime.date(2021, 9, 15), end_date=datetime.date(2021, 11, 30)
+    )
+    assert requested == ["2021-10-01"]
+    assert [window.transactions for window in windows] == [len(test_transactions)]
+    assert all(
+        window.status == WindowStatus.complete
+        for window in exporter.load_checkpoint().values()
+    )
+
+
+def test_export_merges_partitions(
+    lunch_money_obj: LunchMoney,
+    tmp_path: pathlib.Path,
+) -> None:
+    """
+    Partial months and filtered exports merge into the month's partition
+    """
+    requested: List[Dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        requested.append(params)
+        day = int(params["start_date"][-2:])
+        transaction_id = int(params.get("tag_id", 0)) * 100 + day
+        transaction = {
+            "id": transaction_id,
+            "date": params["start_date"],
+            "amount": "1.00",
+            "currency": "usd",
+            "to_base": 1.0,
+            "payee": "Payee",
+            "is_income": False,
+            "exclude_from_budget": False,
+            "exclude_from_totals": False,
+            "created_at": "2021-09-01T00:00:00Z",
+            "updated_at": "2021-09-01T00:00:00Z",
+            "status": "cleared",
+            "is_pending": False,
+            "has_children": False,
+            "is_group": False,
+            "source": "api",
+            "display_name": "Payee",
+            "display_notes": None,
+            "account_display_name": "Account",
+        }
+        return httpx.Response(200, json={"transactions": [transaction]})
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    exporter = TransactionExporter(lunch=lunch_money_obj, output_dir=tmp_path)
+    path = tmp_path / "month=2021-09" / "transactions.jsonl"
+
+    def exported_ids() -> List[int]:
+        return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+    september = datetime.date(2021, 9, 1), datetime.date(2021, 9, 30)
+    exporter.export(start_date=datetime.date(2021, 9, 15), end_date=september[1])
+    assert exported_ids() == [15]
+    exporter.export(start_date=september[0], end_date=september[1])
+    assert [params["start_date"] for params in requested] == [
+        "2021-09-15",
+        "2021-09-01",
+    ]
+    assert exported_ids() == [1]
+    requested.clear()
+    assert (
+        exporter.export(start_date=datetime.date(2021, 9, 15), end_date=september[1])
+        == []
+    )
+    assert requested == []
+    exporter.export(start_date=september[0], end_date=september[1], tag_id=2)
+    assert [params.get("tag_id") for params in requested] == ["2"]
+    assert exported_ids() == [1, 201]
+    assert set(exporter.load_checkpoint()) == {
+        "month=2021-09/all",
+        f"month=2021-09/{_filters_key({'tag_id': 2})}",
+    }
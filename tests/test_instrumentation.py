@@ -0,0 +1,151 @@
+"""
+Run Tests on Request Instrumentation
+"""
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from lunchable import LunchMoney
+from lunchable.exceptions import LunchMoneyHTTPError
+from lunchable.instrumentation import MetricsCollector, RequestEvent, ValidationEvent
+from lunchable.models.tags import TagsObject
+from lunchable.models.transactions import TransactionObject
+
+
+def test_metrics_collector(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Requests are recorded per endpoint, with decode and validation time
+    """
+    transaction = test_transactions[0].model_dump(mode="json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/transactions":
+            return httpx.Response(200, json={"transactions": [transaction]})
+        elif request.url.path == "/v1/transactions/404":
+            return httpx.Response(404, json={"error": "Not Found"})
+        elif request.url.path == "/v1/down":
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(200, json=transaction)
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    lunch_money_obj.async_session = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    started: List[RequestEvent] = []
+    lunch_money_obj.hooks.pre_request.append(started.append)
+    metrics = MetricsCollector(buckets=(0.5, 1.0)).install(lunch_money_obj)
+    lunch_money_obj.get_transactions(start_date="2024-01-01", end_date="2024-01-31")
+    lunch_money_obj.get_transaction(transaction_id=1)
+    asyncio.run(lunch_money_obj.amake_request(method="GET", url_path=["me"]))
+    with pytest.raises(LunchMoneyHTTPError):
+        lunch_money_obj.get_transaction(transaction_id=404)
+    with pytest.raises(httpx.ConnectError):
+        lunch_money_obj.request(method="GET", url="https://dev.lunchmoney.app/v1/down")
+    assert [event.endpoint for event in started] == [
+        "/v1/transactions",
+        "/v1/transactions/{id}",
+        "/v1/me",
+        "/v1/transactions/{id}",
+        "/v1/down",
+    ]
+    exported = metrics.to_dict()
+    assert sorted(exported) == [
+        "GET /v1/down",
+        "GET /v1/me",
+        "GET /v1/transactions",
+        "GET /v1/transactions/{id}",
+    ]
+    single = exported["GET /v1/transactions/{id}"]
+    assert single["requests"] == 2
+    assert single["statuses"] == {"200": 1, "404": 1}
+    assert single["retries"] == 0
+    assert single["duration_seconds"]["buckets"] == {0.5: 2, 1.0: 2}
+    assert single["response_bytes"] > 0
+    assert single["decode_seconds"] > 0
+    assert list(single["validation_seconds"]) == ["TransactionObject"]
+    assert list(exported["GET /v1/transactions"]["validation_seconds"]) == [
+        "_TransactionsResponse"
+    ]
+    assert exported["GET /v1/me"]["decode_seconds"] > 0
+    assert exported["GET /v1/down"]["statuses"] == {"error": 1}
+    prometheus = metrics.to_prometheus()
+    assert "# TYPE lunchable_request_duration_seconds histogram" in prometheus
+    assert (
+        'lunchable_request_duration_seconds_bucket{method="GET",'
+        'endpoint="/v1/transactions/{id}",le="+Inf"} 2'
+    ) in prometheus
+    assert (
+        'lunchable_requests_total{method="GET",'
+        'endpoint="/v1/transactions/{id}",status="404"} 1'
+    ) in prometheus
+    assert 'model="TransactionObject"' in prometheus
+    metrics.reset()
+    assert metrics.to_dict() == {}
+
+
+def test_metrics_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Rate limited requests are retried, and the retries are counted
+    """
+    sent: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        if len(sent) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={})
+        elif len(sent) == 2:
+            return httpx.Response(429, json={"error": "Too Many Requests"})
+        return httpx.Response(200, json={"user_id": 1})
+
+    lunch = LunchMoney(
+        access_token="token",
+        transport=httpx.MockTransport(handler),
+        async_transport=httpx.MockTransport(handler),
+        max_retries=2,
+    )
+    finished: List[RequestEvent] = []
+    lunch.hooks.post_request.append(finished.append)
+    metrics = MetricsCollector().install(lunch)
+    monkeypatch.setattr("lunchable.models._core._MAX_RETRY_DELAY", 0.0)
+    assert lunch.make_request(method="GET", url_path="me") == {"user_id": 1}
+    sent.clear()
+    response = asyncio.run(lunch.amake_request(method="GET", url_path="me"))
+    assert response == {"user_id": 1}
+    assert len(sent) == 3
+    assert [event.attempt for event in finished] == [3, 3]
+    assert metrics.to_dict()["GET /v1/me"]["retries"] == 2
+    assert (
+        'lunchable_request_retries_total{method="GET",endpoint="/v1/me"} 2'
+        in metrics.to_prometheus()
+    )
+    lunch.max_retries = 0
+    sent.clear()
+    with pytest.raises(LunchMoneyHTTPError):
+        lunch.make_request(method="GET", url_path="me")
+    assert len(sent) == 1
+
+
+def test_unrelated_validation(
+    lunch_money_obj: LunchMoney, test_transactions: List[TransactionObject]
+) -> None:
+    """
+    Only the validation of a response is attributed to its request
+    """
+    transaction = test_transactions[0].model_dump(mode="json")
+    lunch_money_obj.session = httpx.Client(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, json=transaction))
+    )
+    validated: List[ValidationEvent] = []
+    lunch_money_obj.hooks.post_validation.append(validated.append)
+    lunch_money_obj.get_transaction(transaction_id=1)
+    assert [event.model for event in validated] == ["TransactionObject"]
+    TransactionObject.model_validate(transaction)
+    TagsObject.model_validate({"id": 1, "name": "Unrelated"})
+    lunch_money_obj.make_request(method="GET", url_path=["transactions", 1])
+    TransactionObject.model_validate(transaction)
+    assert len(validated) == 1
@@ -0,0 +1,106 @@
+"""
+Run Tests on Lazily Loaded CLI Plugins
+"""
+
+import pathlib
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from lunchable import _lazy_plugins
+from lunchable._lazy_plugins import LazyPluginGroup
+
+PLUGIN_SOURCE = '''
+import click
+
+
+@click.command()
+def fakelunch():
+    """
+    A Fake Plugin
+    """
+    click.echo("Hello from fakelunch")
+'''
+
+
+@pytest.fixture
+def plugin_group(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    A plugin group with a single, not yet imported, plugin
+    """
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    (site_packages / "fake_lunch_plugin.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(site_packages))
+    monkeypatch.delitem(sys.modules, "fake_lunch_plugin", raising=False)
+    scans = []
+
+    def scan(group: str):
+        scans.append(group)
+        return {
+            "fakelunch": {
+                "value": "fake_lunch_plugin:fakelunch",
+                "summary": "Fake Lunch Money plugin",
+            },
+            "brokenlunch": {"value": "missing_plugin:command", "summary": ""},
+        }
+
+    monkeypatch.setattr(_lazy_plugins, "_scan_entry_points", scan)
+
+    @click.group(
+        cls=LazyPluginGroup,
+        entry_point_group="lunchable.cli",
+        index_path=tmp_path / "cache" / "index.json",
+    )
+    def plugins() -> None:
+        """
+        Plugins
+        """
+
+    return plugins, scans
+
+
+def test_lazy_plugins(plugin_group, tmp_path: pathlib.Path) -> None:
+    """
+    Plugins are listed from the index and only imported when invoked
+    """
+    plugins, scans = plugin_group
+    runner = CliRunner()
+    result = runner.invoke(plugins, ["--help"])
+    assert result.exit_code == 0
+    assert "fakelunch    Fake Lunch Money plugin" in result.output
+    assert "fake_lunch_plugin" not in sys.modules
+    result = runner.invoke(plugins, ["fakelunch"])
+    assert result.output == "Hello from fakelunch\n"
+    assert "fake_lunch_plugin" in sys.modules
+    result = runner.invoke(plugins, ["brokenlunch"])
+    assert result.exit_code == 1
+    assert "could not be loaded" in result.output
+    assert scans == ["lunchable.cli"]
+    assert (tmp_path / "cache" / "index.json").exists()
+
+
+def test_plugin_index_cache(plugin_group) -> None:
+    """
+    The index is cached on disk and reused until the environment changes
+    """
+    plugins, scans = plugin_group
+    assert sorted(plugins.plugin_index) == ["brokenlunch", "fakelunch"]
+    fresh = LazyPluginGroup(
+        entry_point_group="lunchable.cli", index_path=plugins.index_path
+    )
+    assert fresh.plugin_index == plugins.plugin_index
+    assert len(scans) == 1
+    completions = fresh.shell_complete(click.Context(fresh), "fake")
+    assert [item.value for item in completions] == ["fakelunch"]
+    assert "fake_lunch_plugin" not in sys.modules
+
+
+def test_default_index_path(cache_dir: pathlib.Path) -> None:
+    """
+    The index defaults to the lunchable cache directory
+    """
+    group = LazyPluginGroup(entry_point_group="lunchable.cli")
+    assert group.index_path == cache_dir / "lunchable.cli.json"
@@ -0,0 +1,42 @@
+"""
+Run Tests on Logging Configuration
+"""
+
+import json
+import logging
+
+import httpx
+import pytest
+
+from lunchable import LunchMoney
+from lunchable._config import logging_config
+
+
+def test_json_logging(
+    lunch_money_obj: LunchMoney,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """
+    API requests are logged as single line JSON with structured fields
+    """
+    monkeypatch.delenv("PYTEST_CURRENT_TEST")
+    monkeypatch.setattr(logging_config, "LOG_HANDLER", "json")
+    handler, level = logging_config.get_log_handler(log_level=logging.DEBUG)
+    assert isinstance(handler.formatter, logging_config.JSONFormatter)
+    lunch_money_obj.session = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"user_id": 1})
+        )
+    )
+    with caplog.at_level(logging.DEBUG, logger="lunchable.models._core"):
+        lunch_money_obj.make_request(method="GET", url_path="me", params={"a": 1})
+    (record,) = caplog.records
+    entry = json.loads(handler.format(record))
+    assert "\n" not in handler.format(record)
+    assert entry["level"] == "DEBUG"
+    assert entry["message"].startswith("GET /v1/me 200")
+    assert entry["method"] == "GET"
+    assert entry["endpoint"] == "/v1/me"
+    assert entry["status"] == 200
+    assert entry["duration_ms"] >= 0
@@ -0,0 +1,141 @@
+"""
+Run Tests on the Record/Replay Transport
+"""
+
+import asyncio
+import gzip
+import json
+import pathlib
+from typing import List
+
+import httpx
+import pytest
+
+from lunchable import LunchMoney
+from lunchable.exceptions import LunchMoneyReplayError
+from lunchable.replay import ReplayTransport
+
+
+def _recorded_api(requests: List[httpx.Request]) -> httpx.MockTransport:
+    """
+    An API that counts its requests and numbers its responses
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/v1/me":
+            return httpx.Response(
+                200,
+                content=gzip.compress(json.dumps({"user_id": len(requests)}).encode()),
+                headers={"Content-Encoding": "gzip", "Set-Cookie": "session=1"},
+            )
+        return httpx.Response(200, json={"tags": request.url.params.get("page")})
+
+    return httpx.MockTransport(handler)
+
+
+def test_record_and_replay(tmp_path: pathlib.Path) -> None:
+    """
+    Exchanges are recorded once, replayed in order, and the last repeats
+    """
+    path = tmp_path / "recording.replay"
+    requests: List[httpx.Request] = []
+    recorder = ReplayTransport(path, transport=_recorded_api(requests))
+    lunch = LunchMoney(access_token="secret", transport=recorder)
+    recorded = [lunch.make_request(method="GET", url_path="me") for _ in range(2)]
+    lunch.make_request(method="GET", url_path="tags", params={"page": 1, "b": 2})
+    assert recorded == [{"user_id": 1}, {"user_id": 2}]
+    assert len(requests) == 3
+    assert b"secret" not in path.read_bytes()
+
+    replay = ReplayTransport(path, record_mode="none")
+    lunch = LunchMoney(access_token="other", transport=replay)
+    assert [lunch.make_request(method="GET", url_path="me") for _ in range(3)] == [
+        {"user_id": 1},
+        {"user_id": 2},
+        {"user_id": 2},
+    ]
+    assert lunch.make_request(
+        method="GET", url_path="tags", params={"b": 2, "page": 1}
+    ) == {"tags": "1"}
+    assert len(requests) == 3
+    assert [exchange.method for exchange in replay.exchanges] == ["GET"] * 3
+    assert all(
+        name.lower() not in ("content-encoding", "set-cookie")
+        for name, _ in replay.exchanges[0].headers
+    )
+    with pytest.raises(LunchMoneyReplayError):
+        lunch.make_request(method="GET", url_path="assets")
+
+
+def test_new_episodes(tmp_path: pathlib.Path) -> None:
+    """
+    New requests are appended to an existing recording
+    """
+    path = tmp_path / "recording.replay"
+    requests: List[httpx.Request] = []
+    lunch = LunchMoney(
+        access_token="secret",
+        transport=ReplayTransport(path, transport=_recorded_api(requests)),
+    )
+    lunch.make_request(method="GET", url_path="me")
+    lunch = LunchMoney(
+        access_token="secret",
+        transport=ReplayTransport(
+            path, record_mode="new_episodes", transport=_recorded_api(requests)
+        ),
+    )
+    assert lunch.make_request(method="GET", url_path="me") == {"user_id": 1}
+    lunch.make_request(method="GET", url_path="tags", params={"page": 2})
+    assert len(requests) == 2
+    assert len(ReplayTransport(path).exchanges) == 2
+
+
+def test_streaming_replay(tmp_path: pathlib.Path) -> None:
+    """
+    Large bodies are streamed back in chunks
+    """
+    path = tmp_path / "recording.replay"
+    body = json.dumps({"transactions": [{"id": index} for index in range(200_000)]})
+    recorder = ReplayTransport(
+        path,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text=body)),
+    )
+    with httpx.Client(transport=recorder) as client:
+        client.get("https://dev.lunchmoney.app/v1/transactions")
+    assert path.stat().st_size < len(body) / 4
+
+    with httpx.Client(transport=ReplayTransport(path, record_mode="none")) as client:
+        with client.stream(
+            "GET", "https://dev.lunchmoney.app/v1/transactions"
+        ) as response:
+            chunks = list(response.iter_raw())
+    assert len(chunks) > 1
+    assert b"".join(chunks).decode() == body
+
+
+def test_async_replay(tmp_path: pathlib.Path) -> None:
+    """
+    The async client replays what the sync client recorded
+    """
+    path = tmp_path / "recording.replay"
+    requests: List[httpx.Request] = []
+    lunch = LunchMoney(
+        access_token="secret",
+        transport=ReplayTransport(path, transport=_recorded_api(requests)),
+    )
+    lunch.make_request(method="GET", url_path="me")
+    replay = ReplayTransport(path, record_mode="none")
+    lunch = LunchMoney(access_token="secret", async_transport=replay)
+    response = asyncio.run(lunch.amake_request(method="GET", url_path="me"))
+    assert response == {"user_id": 1}
+
+
+def test_not_a_recording(tmp_path: pathlib.Path) -> None:
+    """
+    Files that aren't recordings are rejected
+    """
+    path = tmp_path / "cassette.yaml"
+    path.write_text("interactions: []\n")
+    with pytest.raises(LunchMoneyReplayError):
+        ReplayTransport(path)
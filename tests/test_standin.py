@@ -0,0 +1,138 @@
+"""
+Run Tests on the Local API Stand-In
+"""
+
+import asyncio
+import datetime
+from typing import List
+
+import httpx
+import pytest
+
+from lunchable import LunchMoney, TransactionInsertObject
+from lunchable.exceptions import LunchMoneyHTTPError
+from lunchable.standin import StandInAPI, SyntheticData
+
+
+def test_standin_transactions() -> None:
+    """
+    Transactions are paged by date range with offset, limit and has_more
+    """
+    data = SyntheticData(seed=1, transactions=5_000)
+    lunch = LunchMoney(access_token="standin", transport=StandInAPI(data).transport())
+    start_date, end_date = datetime.date(2021, 1, 1), datetime.date(2022, 12, 31)
+    pages = list(lunch.iter_transaction_pages(start_date=start_date, end_date=end_date))
+    transactions = [transaction for page in pages for transaction in page]
+    assert len(pages) > 1
+    assert len(transactions) == len(data.transaction_range(start_date, end_date))
+    assert all(start_date <= item.date <= end_date for item in transactions)
+    assert len({item.id for item in transactions}) == len(transactions)
+    transaction = lunch.get_transaction(transaction_id=transactions[0].id)
+    assert transaction == transactions[0]
+
+
+def test_standin_endpoints() -> None:
+    """
+    Every endpoint lunchable uses is served
+    """
+    data = SyntheticData(seed=2, transactions=100, categories=12)
+    lunch = LunchMoney(access_token="standin", transport=StandInAPI(data).transport())
+    assert lunch.get_user().user_id
+    categories = lunch.get_categories()
+    assert len([category for category in categories if not category.is_group]) == 12
+    assert len(lunch.get_tags()) == data.tags
+    assert len(lunch.get_assets()) == data.assets
+    assert len(lunch.get_plaid_accounts()) == data.plaid_accounts
+    assert len(lunch.get_crypto()) == data.crypto
+    assert lunch.get_budgets(
+        start_date=datetime.date(2023, 1, 1), end_date=datetime.date(2023, 3, 31)
+    )
+    assert len(lunch.get_recurring_items()) == data.recurring_items
+    ids = lunch.insert_transactions(
+        transactions=[
+            TransactionInsertObject(
+                date=datetime.date(2023, 1, 1), amount=1.0, payee="Standin"
+            )
+        ]
+    )
+    assert ids == [data.transactions + 1]
+
+
+def test_standin_errors() -> None:
+    """
+    Errors and rate limiting are injected, and tokens can be checked
+    """
+    api = StandInAPI(error_rate=0.25, rate_limit_rate=0.25, seed=3)
+    responses = [
+        api.respond("GET", "/v1/me", params={}, authorization="Bearer standin")
+        for _ in range(200)
+    ]
+    statuses = [response.status for response in responses]
+    assert {200, 429, 500} == set(statuses)
+    assert 20 < statuses.count(429) < 80
+    assert all(
+        response.headers["Retry-After"] == "1"
+        for response in responses
+        if response.status == 429
+    )
+    lunch = LunchMoney(
+        access_token="wrong",
+        transport=StandInAPI(access_token="standin").transport(),
+    )
+    with pytest.raises(LunchMoneyHTTPError):
+        lunch.get_user()
+
+
+def test_standin_asgi() -> None:
+    """
+    The stand-in is an ASGI app the async client can talk to
+    """
+    lunch = LunchMoney(
+        access_token="standin",
+        async_transport=httpx.ASGITransport(app=StandInAPI()),  # type: ignore[arg-type]
+    )
+
+    async def fetch() -> List[str]:
+        responses = await asyncio.gather(
+            lunch.amake_request(method="GET", url_path="me"),
+            lunch.amake_request(method="GET", url_path="tags"),
+        )
+        return [type(response).__name__ for response in responses]
+
+    assert asyncio.run(fetch()) == ["dict", "list"]
+
+
+def test_standin_seed() -> None:
+    """
+    The same seed generates the same account
+    """
+    first, second = SyntheticData(seed=4), SyntheticData(seed=4)
+    assert first.transaction(1234) == second.transaction(1234)
+    assert first.transaction(1234) != SyntheticData(seed=5).transaction(1234)
+    assert first.categories_list(nested=True) == second.categories_list(nested=True)
+
+
+def test_standin_filtered_pages() -> None:
+    """
+    Filtered listings are filtered once and paged from their matches
+    """
+    data = SyntheticData(seed=6, transactions=5_000)
+    filters = {"category_id": 3, "status": "cleared"}
+    matches = data.matching_indexes(filters=filters)
+    assert data.matching_indexes(filters=dict(reversed(filters.items()))) is matches
+    expected = [
+        item
+        for item in map(data.transaction, range(data.transactions))
+        if item["category_id"] == 3 and item["status"] == "cleared"
+    ]
+    pages = [
+        data.transactions_page(offset=offset, limit=50, filters=filters)
+        for offset in range(0, len(expected), 50)
+    ]
+    assert [item for page, _ in pages for item in page] == expected
+    assert [has_more for _, has_more in pages] == [True] * (len(pages) - 1) + [False]
+    tagged = list(data.iter_transactions(filters={"tag_id": 2, "payee": "Amazon"}))
+    assert tagged
+    assert all(
+        item["payee"] == "Amazon" and item["tags"][0]["id"] == 2 for item in tagged
+    )
@@ -0,0 +1,103 @@
+"""
+Run Tests on Optional Tracing
+"""
+
+import contextlib
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+import pytest
+
+from lunchable import LunchMoney, _tracing
+from lunchable.models.transactions import TransactionObject
+
+
+class FakeSpan:
+    """
+    Recorded Span
+    """
+
+    def __init__(self, name: str, attributes: Dict[str, Any], parent: Optional[str]):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """
+    Tracer Recording Spans and Their Parents
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[FakeSpan] = []
+        self._stack: List[FakeSpan] = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[FakeSpan]:
+        parent = self._stack[-1].name if self._stack else None
+        span = FakeSpan(name=name, attributes=attributes or {}, parent=parent)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+
+def test_tracing_disabled() -> None:
+    """
+    Without OpenTelemetry spans are a shared no-op
+    """
+    if _tracing.tracing_enabled():
+        pytest.skip("opentelemetry is installed")
+    with _tracing.span("lunchable.test", {"a": 1}) as span:
+        span.set_attribute("b", 2)
+    assert _tracing.span("lunchable.test") is _tracing.span("lunchable.other")
+
+
+def test_transaction_page_spans(
+    lunch_money_obj: LunchMoney,
+    test_transactions: List[TransactionObject],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Each page gets a span wrapping its request, decode and validation
+    """
+    tracer = FakeTracer()
+    monkeypatch.setattr(_tracing, "_tracer", tracer)
+    transaction = test_transactions[0].model_dump(mode="json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        return httpx.Response(
+            200, json={"transactions": [transaction], "has_more": offset == 0}
+        )
+
+    lunch_money_obj.session = httpx.Client(transport=httpx.MockTransport(handler))
+    transactions = lunch_money_obj.get_transactions(
+        start_date="2024-01-01", end_date="2024-01-31"
+    )
+    assert len(transactions) == 2
+    assert [(span.name, span.parent) for span in tracer.spans] == [
+        ("lunchable.transactions.page", None),
+        ("lunchable.request", "lunchable.transactions.page"),
+        ("lunchable.decode", "lunchable.request"),
+        ("lunchable.validate", "lunchable.transactions.page"),
+    ] * 2
+    first_page, request = tracer.spans[:2]
+    second_page = tracer.spans[4]
+    assert first_page.attributes == {
+        "lunchable.page.offset": 0,
+        "lunchable.page.items": 1,
+        "lunchable.page.has_more": True,
+    }
+    assert second_page.attributes["lunchable.page.offset"] == 1
+    assert second_page.attributes["lunchable.page.has_more"] is False
+    assert request.attributes["http.request.method"] == "GET"
+    assert request.attributes["http.response.status_code"] == 200
+    assert request.attributes["http.response.body.size"] > 0